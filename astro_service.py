@@ -0,0 +1,158 @@
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+from date_parser import parse_date
+from numerology import date_number, get_number_profile, name_number
+from planet import MINUTE_TO_INDEX, parse_time
+from zodiac import ZODIAC_PROFILES, sign_index
+
+LAYERS: Tuple[str, ...] = ("sun_sign", "numerology", "sidereal")
+
+
+def _copy(value: Any) -> Any:
+    """A fresh copy of a cached or shared layer; read-only mappings become plain dicts."""
+    if isinstance(value, Mapping):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_copy(item) for item in value)
+    return value
+
+
+class AstroProfileService:
+    """
+    Single entry point for the sun-sign (zodiac.py), numerology (planet.py /
+    numerology.py) and sidereal chart (star.py) engines.
+
+    A birth record is parsed once and the shared pieces (date, minute of day,
+    location, UTC instant, Julian Day) are computed once and memoized, as is
+    each layer. Only the requested layers are computed. Every call returns
+    its own copies of the layers, so a caller can modify a result without
+    affecting the cache or other callers.
+    """
+
+    def __init__(self, cache_size: int = 4096, kundali_generator=None):
+        self._kundali = kundali_generator
+        self._numerology = lru_cache(maxsize=cache_size)(self._compute_numerology)
+        self._coordinates = lru_cache(maxsize=cache_size)(self._compute_coordinates)
+        self._timezone = lru_cache(maxsize=cache_size)(self._compute_timezone)
+        self._instant = lru_cache(maxsize=cache_size)(self._compute_instant)
+        self._sidereal = lru_cache(maxsize=cache_size)(self._compute_sidereal)
+
+    @property
+    def kundali_generator(self):
+        if self._kundali is None:
+            # star.py needs swisseph, geopy and timezonefinder, so only load it on demand
+            from star import KundaliGenerator
+            self._kundali = KundaliGenerator()
+        return self._kundali
+
+    # ==================== PUBLIC API ====================
+
+    def profile(
+        self,
+        birth_date: str,
+        birth_time: Optional[str] = None,
+        birth_place: Optional[str] = None,
+        name: Optional[str] = None,
+        layers: Sequence[str] = LAYERS,
+    ) -> Dict[str, Any]:
+        """Combined profile for one birth record, restricted to `layers`."""
+        unknown = set(layers) - set(LAYERS)
+        if unknown:
+            raise ValueError(f"Unknown layers: {', '.join(sorted(unknown))}")
+
+        d = parse_date(birth_date)
+        minute = parse_time(birth_time) if birth_time else None
+        result: Dict[str, Any] = {}
+
+        if "sun_sign" in layers:
+            result["sun_sign"] = _copy(ZODIAC_PROFILES[sign_index(d.month, d.day)])
+
+        if "numerology" in layers:
+            result["numerology"] = _copy(self._numerology(d, minute, name or None))
+
+        if "sidereal" in layers:
+            if minute is None or not birth_place:
+                result["sidereal"] = {"error": "Birth time and place are required for the sidereal chart"}
+            else:
+                try:
+                    result["sidereal"] = _copy(self._sidereal(d, minute, birth_place.strip()))
+                except Exception as e:
+                    # Failures are not memoized, so a transient geocoding error can be retried
+                    result["sidereal"] = {"error": str(e)}
+
+        return result
+
+    def profiles(
+        self,
+        records: Iterable[Dict[str, Any]],
+        layers: Sequence[str] = LAYERS,
+    ) -> Iterator[Dict[str, Any]]:
+        """Profile a stream of records with date/time/place/name fields; errors are reported inline."""
+        for record in records:
+            if not isinstance(record, Mapping):
+                yield {"error": f"Expected a record object, got {type(record).__name__}"}
+                continue
+            try:
+                yield self.profile(
+                    record.get("date") or record.get("birth_date", ""),
+                    record.get("time") or record.get("birth_time"),
+                    record.get("place") or record.get("birth_place"),
+                    record.get("name"),
+                    layers,
+                )
+            except ValueError as e:
+                yield {"error": str(e)}
+
+    def birth_instant(self, birth_date: str, birth_time: str, birth_place: str) -> Dict[str, Any]:
+        """Resolved location, timezone, UTC instant and Julian Day for a birth record."""
+        lat, lon, tz_name, dt_utc, jd = self._instant(
+            parse_date(birth_date), parse_time(birth_time), birth_place.strip()
+        )
+        return {"latitude": lat, "longitude": lon, "timezone": tz_name, "utc": dt_utc, "julian_day": jd}
+
+    def cache_info(self) -> Dict[str, Any]:
+        return {
+            "numerology": self._numerology.cache_info(),
+            "coordinates": self._coordinates.cache_info(),
+            "timezone": self._timezone.cache_info(),
+            "instant": self._instant.cache_info(),
+            "sidereal": self._sidereal.cache_info(),
+        }
+
+    # ==================== LAYERS ====================
+
+    def _compute_numerology(self, d: date, minute: Optional[int], name: Optional[str]) -> Dict[str, Any]:
+        profile = {"date": get_number_profile(date_number(d))}
+        if minute is not None:
+            profile["time"] = get_number_profile(MINUTE_TO_INDEX[minute])
+        if name:
+            profile["name"] = get_number_profile(name_number(name))
+        return profile
+
+    def _compute_coordinates(self, place: str) -> Tuple[float, float]:
+        lat, lon = self.kundali_generator.get_coordinates(place)
+        if lat is None or lon is None:
+            raise LookupError("Could not find location")
+        return lat, lon
+
+    def _compute_timezone(self, lat: float, lon: float) -> str:
+        return self.kundali_generator.get_timezone(lat, lon)
+
+    def _compute_instant(self, d: date, minute: int, place: str):
+        generator = self.kundali_generator
+        lat, lon = self._coordinates(place)
+        tz_name = self._timezone(lat, lon)
+        dt_naive = datetime(d.year, d.month, d.day, minute // 60, minute % 60)
+        dt_utc = generator.to_utc(dt_naive, tz_name)
+        jd = generator.calculate_julian_day(dt_utc, lat, lon)
+        return lat, lon, tz_name, dt_utc, jd
+
+    def _compute_sidereal(self, d: date, minute: int, place: str) -> Dict[str, Any]:
+        lat, lon, tz_name, _, jd = self._instant(d, minute, place)
+        return self.kundali_generator.build_kundali(
+            d.isoformat(), f"{minute // 60:02d}:{minute % 60:02d}", place, lat, lon, tz_name, jd
+        )
@@ -0,0 +1,543 @@
+"""
+Throughput benchmarks.
+Usage: python benchmarks.py [name ...] [-n COUNT]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+BENCHMARKS: Dict[str, Callable[[Optional[int]], None]] = {}
+
+
+def benchmark(fn):
+    BENCHMARKS[fn.__name__[len("bench_"):]] = fn
+    return fn
+
+
+def _report(label: str, count: int, seconds: float):
+    rate = count / seconds if seconds else float("inf")
+    print(f"{label:<40} {count:>10,} in {seconds:8.3f}s  ({rate:,.0f}/s)")
+
+
+# ==================== ASTRO PROFILES ====================
+
+def _synthetic_birth_records(n: int, seed: int = 7) -> Iterator[Dict[str, str]]:
+    rng = random.Random(seed)
+    for i in range(n):
+        yield {
+            "id": str(i),
+            "date": f"{rng.randint(1950, 2012)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+        }
+
+
+@benchmark
+def bench_batch_profiles(n: Optional[int] = None):
+    """main.py batch pipeline: records → profiles → NDJSON (to /dev/null)."""
+    from main import profile_records, write_ndjson
+
+    n = n or 1_000_000
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        start = time.perf_counter()
+        count = write_ndjson(profile_records(_synthetic_birth_records(n)), out)
+        _report("batch profiles (NDJSON)", count, time.perf_counter() - start)
+
+
+# ==================== CV INGESTION ====================
+
+_CV_LINES = [
+    "EDUCATION",
+    "B.Tech in Computer Science and Engineering, Example University 2021 - 2025",
+    "CGPA: 8.7 / 10",
+    "EXPERIENCE",
+    "Software Engineering Intern, Example Corp Jun 2024 - Aug 2024",
+    "Developed REST APIs in Python and Django; deployed with Docker on AWS.",
+    "PROJECTS",
+    "Resume Parser. Built a PDF parsing tool using Python, pandas and scikit-learn.",
+    "Portfolio Website. Designed a React and TypeScript site with CI/CD.",
+    "SKILLS",
+    "Python, Java, JavaScript, SQL, MySQL, MongoDB, Git, Machine Learning",
+    "Leadership, Communication, Teamwork, Problem Solving",
+    "CERTIFICATIONS",
+    "AWS Certified Cloud Practitioner; Completed Deep Learning course",
+    "ACHIEVEMENTS",
+    "Winner, National Hackathon 2023; Dean's List scholarship",
+]
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_synthetic_cv_pdf(path: str, pages: int = 2, seed: int = 0, lines_per_page: int = 40):
+    """Write a minimal text-only PDF (Helvetica, no external dependencies) that looks like a CV."""
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(pages)]
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for i in range(pages):
+        body = [f"Candidate {seed} Page {i + 1}" if i else f"Candidate Name {seed}",
+                f"candidate{seed}@example.com | +91 98765 {seed % 100000:05d}",
+                f"linkedin.com/in/candidate-{seed} | github.com/candidate{seed}"]
+        while len(body) < lines_per_page:
+            body.extend(rng.sample(_CV_LINES, 4))
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in body[:lines_per_page]]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_ids[i] + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def make_cv_corpus(directory: str, count: int, pages: int = 2) -> List[str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"cv_{i:05d}.pdf")
+        make_synthetic_cv_pdf(path, pages=pages + i % 3, seed=i)
+        paths.append(path)
+    return paths
+
+
+@benchmark
+def bench_cv_ingestion(n: Optional[int] = None):
+    """Sequential extraction vs. CVIngestionEngine over a synthetic corpus."""
+    from cv_ingest import CVIngestionEngine, extract_page_range, join_pages
+
+    n = n or 200
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_cv_corpus(directory, n)
+
+        start = time.perf_counter()
+        for path in paths:
+            join_pages(extract_page_range(path, 0, 1 << 30))
+        _report("CV extraction, sequential", n, time.perf_counter() - start)
+
+        with CVIngestionEngine(pages_per_task=2) as engine:
+            start = time.perf_counter()
+            results = engine.extract_many(paths)
+            _report(f"CV extraction, {engine.max_workers} processes", n, time.perf_counter() - start)
+        failed = sum(1 for r in results.values() if r["status"] != "ok")
+        if failed:
+            print(f"  {failed} files failed")
+
+
+@benchmark
+def bench_pdf_backends(n: Optional[int] = None):
+    """Each extraction backend on its own vs. cheapest-first with per-page fallback."""
+    from pdf_backends import available_backends, backend_stats, extract_pages, reset_backend_stats
+
+    n = n or 100
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_cv_corpus(directory, n)
+        for backend in available_backends():
+            start = time.perf_counter()
+            for path in paths:
+                extract_pages(path, backends=[backend])
+            _report(f"PDF text, {backend.name} only", n, time.perf_counter() - start)
+
+        reset_backend_stats()
+        start = time.perf_counter()
+        for path in paths:
+            extract_pages(path)
+        _report("PDF text, cheapest first + fallback", n, time.perf_counter() - start)
+        for name, stats in backend_stats().items():
+            print(f"  {name:<12} {stats['pages']:>6} pages  {stats['ms_per_page']:8.3f} ms/page"
+                  f"  ({stats['fallback_pages']} fallback)")
+
+
+def _synthetic_cv_text(lines: int, seed: int = 0) -> str:
+    """A long CV body with the contact block at the end, so every pattern scans the whole text."""
+    rng = random.Random(seed)
+    body = [rng.choice(_CV_LINES) for _ in range(lines)]
+    body += ["Jane Candidate", "jane.candidate@example.com | +91 98765 43210",
+             "https://www.linkedin.com/in/jane-candidate | https://github.com/janec",
+             "https://janecandidate.dev"]
+    return "\n".join(body)
+
+
+def _per_pattern_contact_fields(text: str) -> Dict[str, str]:
+    # Baseline: one re.findall scan per field, as parse_cv_pdf used to do
+    found = {}
+    text_lower = text.lower()
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    if emails:
+        found['email'] = emails[0]
+    phones = re.findall(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]', text)
+    if phones:
+        found['phone'] = phones[0].strip()
+    linkedin = re.findall(r'linkedin\.com/in/[\w-]+', text_lower)
+    if linkedin:
+        found['linkedin'] = linkedin[0]
+    github = re.findall(r'github\.com/[\w-]+', text_lower)
+    if github:
+        found['github'] = github[0]
+    for url in re.findall(r'https?://(?:www\.)?[\w\-\.]+\.[\w]{2,}', text):
+        if 'linkedin' not in url.lower() and 'github' not in url.lower():
+            found['portfolio'] = url
+            break
+    return found
+
+
+@benchmark
+def bench_cv_fields(n: Optional[int] = None):
+    """Contact-field extraction on a large CV: a findall scan per pattern vs. the compiled pattern bank."""
+    from deloitte1 import NaviRitiCareerPredictor, extract_contact_fields
+
+    n = n or 200
+    text = _synthetic_cv_text(5000)
+    if _per_pattern_contact_fields(text) != extract_contact_fields(text):
+        print("  warning: pattern bank disagrees with the per-pattern baseline")
+
+    for label, fn in (("contact fields, per-pattern scans", _per_pattern_contact_fields),
+                      ("contact fields, compiled pattern bank", extract_contact_fields)):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn(text)
+        _report(label, n, time.perf_counter() - start)
+
+    predictor = NaviRitiCareerPredictor()
+    start = time.perf_counter()
+    for _ in range(n):
+        cv_data = predictor._new_cv_data()
+        cv_data['raw_text'] = text
+        predictor._extract_cv_information_enhanced(cv_data)
+    _report("full CV field extraction", n, time.perf_counter() - start)
+
+
+@benchmark
+def bench_cv_preview(n: Optional[int] = None):
+    """40-page CV: extract everything then parse vs. page-streaming contact preview."""
+    from cv_stream import stream_cv
+    from deloitte1 import NaviRitiCareerPredictor
+    from pdf_backends import extract_pages
+
+    n = n or 20
+    predictor = NaviRitiCareerPredictor()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "long_cv.pdf")
+        make_synthetic_cv_pdf(path, pages=40)
+
+        start = time.perf_counter()
+        for _ in range(n):
+            cv_data = predictor._new_cv_data()
+            cv_data['raw_text'] = ''.join([f"{text}\n" for text in extract_pages(path) if text])
+            predictor._extract_cv_information_enhanced(cv_data)
+        _report("40-page CV, full parse", n, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(n):
+            stream_cv(path, ('name', 'email', 'phone'))
+        _report("40-page CV, streamed contact preview", n, time.perf_counter() - start)
+
+        predictor.preview_cv_pdf(path)  # start the sandbox child
+        start = time.perf_counter()
+        for _ in range(n):
+            predictor.preview_cv_pdf(path)
+        _report("  same, in the CV sandbox", n, time.perf_counter() - start)
+
+
+# ==================== STARTUP ====================
+
+_STARTUP_SNIPPETS = {
+    "import deloitte1 (PDF libraries lazy)":
+        "import deloitte1; deloitte1.NaviRitiCareerPredictor()",
+    "import deloitte1 + PyPDF2/pdfplumber (old eager cost)":
+        "import PyPDF2, pdfplumber, deloitte1; deloitte1.NaviRitiCareerPredictor()",
+}
+
+
+# ==================== COHORT SCORING ====================
+
+def _synthetic_students(n: int, seed: int = 5) -> List[Dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "cgpa": round(rng.uniform(5, 10), 2),
+            "technical_skills": ["skill"] * rng.randint(0, 12),
+            "experience": ["role"] * rng.randint(0, 3),
+            "projects": ["project"] * rng.randint(0, 5),
+            "certifications": ["cert"] * rng.randint(0, 4),
+            "psychometric_results": {
+                "technical_aptitude": rng.uniform(40, 100),
+                "communication": rng.uniform(40, 100),
+                "analytical_skills": rng.uniform(40, 100),
+            },
+        }
+        for _ in range(n)
+    ]
+
+
+@benchmark
+def bench_cohort_scoring(n: Optional[int] = None):
+    """Stage-3 employability scores: per-student calls vs one columnar pass."""
+    from cohort_scoring import cohort_from_students, score_cohort
+    from predictor_core import ENHANCED_SCORING
+
+    n = n or 200_000
+    students = _synthetic_students(n)
+
+    start = time.perf_counter()
+    expected = [ENHANCED_SCORING.score(s, {}, s["psychometric_results"]) for s in students]
+    _report("per-student scoring", n, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    columns = cohort_from_students(students)
+    _report("  dicts → columns", n, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    scores = score_cohort(columns)
+    _report("  columnar scoring", n, time.perf_counter() - start)
+    assert scores.tolist() == expected
+
+
+# ==================== CAREER RULES ====================
+
+@benchmark
+def bench_career_rules(n: Optional[int] = None):
+    """Stage-3 career rules per request, and with 1,000 more rules on other degrees/skills."""
+    from rule_engine import RULES_PATH, RuleSet
+    import json
+
+    n = n or 100_000
+    with open(RULES_PATH, encoding="utf-8") as f:
+        specs = json.load(f)["rulesets"]["stage3_careers"]
+    extra = [
+        {"when": {"text": field, "contains": [f"{field}-{i}"]}, "emit": [{"career": f"Career {i}", "match": 50}]}
+        for i in range(500) for field in ("degree", "skills")
+    ]
+    rng = random.Random(9)
+    degrees = ["B.Tech CSE", "B.Tech Mechanical", "B.Com", "MBA", "BA Psychology"]
+    skills = ["Python", "Java", "React", "SQL", "Excel", "Docker"]
+    contexts = [
+        {
+            "degree": rng.choice(degrees),
+            "skills": rng.sample(skills, rng.randint(0, 4)),
+            "psychometric": {"leadership_score": rng.randint(40, 100)},
+        }
+        for _ in range(n)
+    ]
+    for ruleset in (RuleSet("stage3_careers", specs), RuleSet("stage3_careers + 1000", specs + extra)):
+        start = time.perf_counter()
+        for context in contexts:
+            ruleset.evaluate(context)
+        _report(f"{ruleset.name} ({len(ruleset.rules.rules)} rules)", n, time.perf_counter() - start)
+
+
+# ==================== SKILL INDEX ====================
+
+@benchmark
+def bench_skill_index(n: Optional[int] = None):
+    """Top-5 careers by skill coverage over a 50,000-career synthetic catalog."""
+    from skill_index import SkillIndex
+
+    n = n or 10_000
+    rng = random.Random(13)
+    vocabulary = [f"skill {i}" for i in range(3_000)]
+    # Skewed popularity, so a few skills (like 'Communication') appear in many careers
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    catalog = {
+        f"career {i}": rng.choices(vocabulary, weights, k=rng.randint(4, 10)) for i in range(50_000)
+    }
+    start = time.perf_counter()
+    index = SkillIndex(catalog)
+    _report("build index (careers)", len(index), time.perf_counter() - start)
+
+    students = [rng.choices(vocabulary, weights, k=10) for _ in range(n)]
+    start = time.perf_counter()
+    for skills in students:
+        index.top_careers(skills, k=5)
+    _report("top-5 careers per student", n, time.perf_counter() - start)
+
+
+@benchmark
+def bench_career_similarity(n: Optional[int] = None):
+    """TF-IDF similarity of CV texts against a 5,000-career synthetic catalog."""
+    from career_similarity import TfidfIndex
+
+    n = n or 2_000
+    rng = random.Random(17)
+    vocabulary = [f"term{i}" for i in range(20_000)]
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    documents = {f"career {i}": " ".join(rng.choices(vocabulary, weights, k=60)) for i in range(5_000)}
+    start = time.perf_counter()
+    index = TfidfIndex.build(documents)
+    _report("build index (careers)", len(index), time.perf_counter() - start)
+
+    texts = [" ".join(rng.choices(vocabulary, weights, k=300)) for _ in range(n)]
+    start = time.perf_counter()
+    index.top_many(texts, k=5)
+    _report("top-5 careers per CV", n, time.perf_counter() - start)
+
+
+@benchmark
+def bench_career_api(n: Optional[int] = None):
+    """Stage 3 predictions in-process, over one keep-alive HTTP connection, and batched."""
+    import http.client
+    import threading
+    from career_api import make_server, predict
+
+    n = n or 1_000
+    request = {"name": "Bench", "stage": 3, "current_degree": "B.Tech CSE", "cgpa": 8.2,
+               "technical_skills": ["Python", "SQL", "React", "Docker"], "projects": ["Chat app", "ML pipeline"]}
+    start = time.perf_counter()
+    for _ in range(n):
+        predict(request)
+    _report("in-process predict()", n, time.perf_counter() - start)
+
+    server = make_server(port=0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port)
+    try:
+        body = json.dumps(request)
+        start = time.perf_counter()
+        for _ in range(n):
+            conn.request("POST", "/predict", body, {"Content-Type": "application/json"})
+            conn.getresponse().read()
+        _report("POST /predict (keep-alive)", n, time.perf_counter() - start)
+
+        batch = json.dumps([request] * 100)
+        start = time.perf_counter()
+        for _ in range(max(1, n // 100)):
+            conn.request("POST", "/predict/batch", batch, {"Content-Type": "application/json"})
+            conn.getresponse().read()
+        _report("POST /predict/batch (100 per call)", max(1, n // 100) * 100, time.perf_counter() - start)
+    finally:
+        conn.close()
+        server.shutdown()
+        server.server_close()
+
+
+@benchmark
+def bench_predictor_variants(n: Optional[int] = None):
+    """SRS (deloitte) vs enhanced (deloitte1) predictor: construction, employability scoring, stage-3 reports."""
+    import deloitte
+    import deloitte1
+    from predictor_core import SCORING_STRATEGIES
+
+    n = n or 20_000
+    rng = random.Random(29)
+    students = _synthetic_students(n)
+    for student in students:
+        # Fields the SRS front end asks for, mirrored from the shared ones
+        student.update({
+            "internships": student["experience"], "personal_projects": student["projects"],
+            "has_cv": rng.random() < 0.6, "soft_skills": ["Communication"], "preferred_career": "",
+            "current_degree": rng.choice(["B.Tech CSE", "B.Com", "BA Psychology", "B.Tech Mechanical"]),
+            "job_vs_study": rng.choice(["Job", "Higher Studies", "Both"]),
+            "technical_aptitude": rng.uniform(40, 100), "leadership_score": rng.uniform(40, 100),
+            "creative_thinking": rng.uniform(40, 100),
+        })
+    front_ends = {"srs": deloitte.NaviRitiCareerPredictor, "enhanced": deloitte1.NaviRitiCareerPredictor}
+
+    for name, predictor_class in front_ends.items():
+        predictor_class().generate_stage3_output("warm-up", students[0])
+        start = time.perf_counter()
+        for _ in range(n):
+            predictor_class()
+        _report(f"{name}: construct predictor", n, time.perf_counter() - start)
+
+    for name, strategy in SCORING_STRATEGIES.items():
+        start = time.perf_counter()
+        scores = [strategy.score(s, {}, s["psychometric_results"]) for s in students]
+        _report(f"{name}: employability score", n, time.perf_counter() - start)
+        print(f"{'':<4}mean {sum(scores) / n:.1f}, ≥70: {sum(score >= 70 for score in scores) / n:.1%}")
+
+    reports = max(1, n // 10)
+    for name, predictor_class in front_ends.items():
+        predictor = predictor_class()
+        start = time.perf_counter()
+        for student in students[:reports]:
+            predictor.generate_stage3_output("Bench", student)
+        _report(f"{name}: stage-3 report", reports, time.perf_counter() - start)
+
+
+@benchmark
+def bench_report_rendering(n: Optional[int] = None):
+    """Stage-3 reports rendered from compiled templates: per format, streamed, and zipped."""
+    import deloitte1
+    from report_templates import FORMATS, render_report, render_reports, write_report_archive
+
+    n = n or 5_000
+    rng = random.Random(31)
+    predictor = deloitte1.NaviRitiCareerPredictor()
+    students = _synthetic_students(n)
+    for student in students:
+        student["current_degree"] = rng.choice(["B.Tech CSE", "B.Com", "BA Psychology", "B.Tech Mechanical"])
+    reports = [predictor.generate_stage3_output(f"Student {i}", student) for i, student in enumerate(students)]
+
+    for fmt in FORMATS:
+        render_report(reports[0], fmt)
+        start = time.perf_counter()
+        size = sum(len(render_report(report, fmt)) for report in reports)
+        _report(f"render {fmt}", n, time.perf_counter() - start)
+        print(f"{'':<4}{size / n:,.0f} chars/report")
+
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        start = time.perf_counter()
+        count = render_reports(reports, out, "html")
+        _report("stream html (one page)", count, time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reports.zip")
+        start = time.perf_counter()
+        count = write_report_archive(reports, path, "markdown")
+        _report("zip archive (markdown)", count, time.perf_counter() - start)
+        print(f"{'':<4}{os.path.getsize(path) / count:,.0f} bytes/report compressed")
+
+
+@benchmark
+def bench_startup(n: Optional[int] = None):
+    """Fresh-interpreter import time for predictor users who never parse a PDF."""
+    n = n or 10
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    baseline = None
+    for label, code in {"interpreter only": "pass", **_STARTUP_SNIPPETS}.items():
+        start = time.perf_counter()
+        for _ in range(n):
+            subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+        per_run = (time.perf_counter() - start) / n
+        baseline = per_run if baseline is None else baseline
+        print(f"{label:<55} {1000 * per_run:8.1f} ms  (+{1000 * (per_run - baseline):.1f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run (default: all): {', '.join(BENCHMARKS)}")
+    parser.add_argument("-n", type=int, help="Override the record count")
+    args = parser.parse_args(argv)
+
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name](args.n)
+
+
+if __name__ == "__main__":
+    main()
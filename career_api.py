@@ -0,0 +1,372 @@
+"""
+Headless career prediction API: typed requests in, stage reports out.
+
+The interactive collect_stage*_inputs() prompts are replaced by one request
+model per stage, validated up front; predict() is then a pure function of
+the request against a warm predictor that is built once per process
+(catalogs, compiled rules, skill and TF-IDF indexes). make_server() puts it
+behind a threaded HTTP/1.1 server with keep-alive, so a client such as the
+Node server holds a connection open and pays only for the computation:
+
+    GET  /health          → {"status": "ok"}
+    POST /predict         → one request object → one report
+    POST /predict/batch   → [request, ...] → [report or {"error": ...}, ...]
+
+Usage: python career_api.py [--host 127.0.0.1] [--port 8001]
+"""
+import argparse
+import json
+import math
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from deloitte1 import NaviRitiCareerPredictor
+
+# Largest request body accepted, batch included
+MAX_BODY_BYTES = 4 * 1024 * 1024
+MAX_BATCH = 1000
+
+
+class RequestError(ValueError):
+    """A prediction request that is malformed or fails validation."""
+
+
+def _coerce(name: str, kind, value):
+    try:
+        if kind == List[str]:
+            if isinstance(value, str):
+                value = value.split(',')
+            if not isinstance(value, list):
+                raise TypeError
+            return [str(v).strip() for v in value if str(v).strip()]
+        if kind == Dict[str, Any]:
+            if not isinstance(value, dict):
+                raise TypeError
+            return value
+        if kind is int:
+            return int(value or 0)
+        if kind is float:
+            value = float(value or 0)
+            if not math.isfinite(value):
+                raise ValueError
+            return value
+        return str(value).strip()
+    except (TypeError, ValueError, OverflowError):
+        raise RequestError(f"Invalid value for '{name}': {value!r}") from None
+
+
+def _coerce_nested(name: str, schema: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Known keys of a nested object coerced like top-level fields; None drops a key, unknown keys are kept."""
+    return {key: _coerce(f"{name}.{key}", schema[key], value) if key in schema else value
+            for key, value in values.items() if value is not None}
+
+
+_SCORE_FIELDS = (
+    # Stage 1 (1-10 self-ratings, Holland code 0-100)
+    'creativity', 'logical_thinking', 'social_skills', 'leadership',
+    'realistic', 'investigative', 'artistic', 'social', 'enterprising', 'conventional',
+    # Stage 2 aptitudes
+    'logical_reasoning', 'verbal_ability', 'numerical_ability', 'spatial_reasoning', 'abstract_reasoning',
+    # Stage 3 aptitudes
+    'leadership_score', 'technical_aptitude', 'creative_thinking', 'analytical_skills', 'communication',
+    'teamwork', 'problem_solving',
+)
+# What the predictor reads from psychometric_results, as collect_psychometric_results() records it
+PSYCHOMETRIC_SCHEMA: Dict[str, Any] = {
+    **{name: float for name in _SCORE_FIELDS},
+    'interest_areas': List[str], 'career_interests': List[str],
+    'personality_type': str, 'mbti_type': str, 'work_style': str,
+}
+# What the predictor reads from cv_data, as parse_cv_pdf() returns it
+CV_DATA_SCHEMA: Dict[str, Any] = {
+    **{name: List[str] for name in ('skills', 'technical_skills', 'soft_skills', 'experience', 'projects',
+                                    'certifications', 'education', 'achievements', 'languages')},
+    **{name: str for name in ('raw_text', 'name', 'email', 'phone', 'linkedin', 'github', 'portfolio')},
+}
+
+
+class _Request:
+    """
+    from_dict(): required fields checked, values coerced, unknown fields
+    rejected. Nested objects with a 'schema' in their field metadata have
+    their known keys coerced too.
+    """
+
+    stage = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        known = {f.name: f for f in fields(cls)}
+        unknown = set(data) - set(known) - {'stage', 'grade'}
+        if unknown:
+            raise RequestError(f"Unknown fields for stage {cls.stage}: {', '.join(sorted(unknown))}")
+        missing = [name for name, f in known.items()
+                   if name not in data and f.default is MISSING and f.default_factory is MISSING]
+        if missing:
+            raise RequestError(f"Missing fields for stage {cls.stage}: {', '.join(missing)}")
+        values = {name: _coerce(name, known[name].type, value) for name, value in data.items() if name in known}
+        for name, value in values.items():
+            schema = known[name].metadata.get('schema')
+            if schema:
+                values[name] = _coerce_nested(name, schema, value)
+        return cls(**values)
+
+    def inputs(self) -> Dict[str, Any]:
+        """The inputs dict generate_stage*_output() expects, as collect_stage*_inputs() builds it."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in ('name', 'grade')}
+
+
+@dataclass
+class Stage1Request(_Request):
+    """Classes 6-9 (exploration years)."""
+    name: str
+    grade: int
+    subject_preferences: List[str] = field(default_factory=list)
+    extracurricular_activities: List[str] = field(default_factory=list)
+    projects_competitions: List[str] = field(default_factory=list)
+    hobbies: str = ''
+    psychometric_results: Dict[str, Any] = field(default_factory=dict, metadata={'schema': PSYCHOMETRIC_SCHEMA})
+
+    stage = 1
+
+
+@dataclass
+class Stage2Request(_Request):
+    """Classes 10-12 (decision years)."""
+    name: str
+    grade: int
+    stream: str
+    class10_percentage: float = 0.0
+    current_percentage: float = 0.0
+    strong_subjects: List[str] = field(default_factory=list)
+    career_interests: List[str] = field(default_factory=list)
+    competitive_exams: List[str] = field(default_factory=list)
+    extracurricular_achievements: str = ''
+    psychometric_results: Dict[str, Any] = field(default_factory=dict, metadata={'schema': PSYCHOMETRIC_SCHEMA})
+
+    stage = 2
+
+
+@dataclass
+class Stage3Request(_Request):
+    """Undergraduates. `cv_data` is an already-parsed CV (see parse_cv_pdf); CV fields fill empty lists."""
+    name: str
+    current_degree: str
+    university: str = ''
+    current_year: int = 1
+    cgpa: float = 0.0
+    technical_skills: List[str] = field(default_factory=list)
+    experience: List[str] = field(default_factory=list)
+    projects: List[str] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+    preferred_roles: List[str] = field(default_factory=list)
+    preferred_industries: List[str] = field(default_factory=list)
+    cv_data: Dict[str, Any] = field(default_factory=dict, metadata={'schema': CV_DATA_SCHEMA})
+    psychometric_results: Dict[str, Any] = field(default_factory=dict, metadata={'schema': PSYCHOMETRIC_SCHEMA})
+
+    stage = 3
+
+    def inputs(self) -> Dict[str, Any]:
+        inputs = super().inputs()
+        inputs['has_cv'] = bool(self.cv_data)
+        for key, cv_key in (('technical_skills', 'skills'), ('experience', 'experience'),
+                            ('projects', 'projects'), ('certifications', 'certifications')):
+            if not inputs[key] and self.cv_data.get(cv_key):
+                inputs[key] = list(self.cv_data[cv_key])
+        return inputs
+
+
+PredictionRequest = Union[Stage1Request, Stage2Request, Stage3Request]
+REQUEST_TYPES = {cls.stage: cls for cls in (Stage1Request, Stage2Request, Stage3Request)}
+
+
+def parse_request(data: Any) -> PredictionRequest:
+    """
+    A typed request from decoded JSON. The stage is taken from 'stage' when
+    given, otherwise from 'grade' (6-9 → 1, 10-12 → 2, above 12 → 3).
+    """
+    if not isinstance(data, dict):
+        raise RequestError("A prediction request must be a JSON object")
+    stage = data.get('stage')
+    if stage is None:
+        grade = _coerce('grade', int, data.get('grade'))
+        stage = 1 if 6 <= grade <= 9 else 2 if 10 <= grade <= 12 else 3 if grade > 12 else None
+        if stage is None:
+            raise RequestError("Give 'stage' (1-3) or a 'grade' of 6 or above")
+    request_type = REQUEST_TYPES.get(_coerce('stage', int, stage))
+    if request_type is None:
+        raise RequestError(f"Unknown stage: {stage!r}")
+    return request_type.from_dict(data)
+
+
+@lru_cache(maxsize=None)
+def get_predictor() -> NaviRitiCareerPredictor:
+    """Process-wide predictor, with its lazily built indexes loaded up front."""
+    predictor = NaviRitiCareerPredictor()
+    predictor.career_tfidf
+    return predictor
+
+
+def predict(request: Union[PredictionRequest, Dict[str, Any]],
+            predictor: Optional[NaviRitiCareerPredictor] = None) -> Dict[str, Any]:
+    """The stage report for one request; never prompts or prints."""
+    if not isinstance(request, _Request):
+        request = parse_request(request)
+    return _report(request, request.inputs(), predictor or get_predictor())
+
+
+def _report(request: PredictionRequest, inputs: Dict[str, Any], predictor: NaviRitiCareerPredictor,
+            similar: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    if request.stage == 1:
+        return predictor.generate_stage1_output(request.name, request.grade, inputs)
+    if request.stage == 2:
+        return predictor.generate_stage2_output(request.name, request.grade, inputs)
+    return predictor.generate_stage3_output(request.name, inputs, similar)
+
+
+def _error(e: Exception) -> Dict[str, str]:
+    return {'error': str(e) if isinstance(e, RequestError) else f"{type(e).__name__}: {e}"}
+
+
+def predict_many(requests: Sequence[Any], predictor: Optional[NaviRitiCareerPredictor] = None) -> List[Dict[str, Any]]:
+    """
+    predict() for each request; a request that fails yields {"error": ...}
+    in its slot instead of failing the batch. The TF-IDF similar careers of
+    all Stage 3 requests are scored together, in one
+    stage3_similar_careers() pass.
+    """
+    predictor = predictor or get_predictor()
+    parsed: List[Union[Tuple[PredictionRequest, Dict[str, Any]], Dict[str, str]]] = []
+    for request in requests:
+        try:
+            if not isinstance(request, _Request):
+                request = parse_request(request)
+            parsed.append((request, request.inputs()))
+        except Exception as e:
+            parsed.append(_error(e))
+
+    stage3 = [i for i, item in enumerate(parsed) if isinstance(item, tuple) and item[0].stage == 3]
+    similar: Dict[int, List[Dict]] = {}
+    try:
+        similar = dict(zip(stage3, predictor.stage3_similar_careers([parsed[i][1] for i in stage3])))
+    except Exception:
+        pass  # each report then scores its own text, and a request that breaks scoring fails on its own
+
+    results = []
+    for i, item in enumerate(parsed):
+        if isinstance(item, dict):
+            results.append(item)
+            continue
+        try:
+            results.append(_report(*item, predictor, similar.get(i)))
+        except Exception as e:
+            results.append(_error(e))
+    return results
+
+
+# ==================== HTTP ====================
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive: every response carries Content-Length
+    server_version = "NaviRiti/1.0"
+    # Headers and body go out as separate writes; with Nagle on, each response waits on a delayed ACK
+    disable_nagle_algorithm = True
+    quiet = False
+
+    def _send(self, status: int, payload: Any):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        """
+        The whole request body, so the next request on the connection starts
+        where it should. A body whose end can't be trusted is refused and the
+        connection closed after the reply.
+        """
+        if 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            raise RequestError("Chunked request bodies are not supported; send Content-Length")
+        value = self.headers.get('Content-Length') or '0'
+        if not (value.isascii() and value.strip().isdigit()):
+            self.close_connection = True
+            raise RequestError(f"Invalid Content-Length: {value!r}")
+        length = int(value)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(f"Request body over {MAX_BODY_BYTES} bytes")
+        return self.rfile.read(length)
+
+    def _read_json(self) -> Any:
+        body = self._read_body()
+        try:
+            return json.loads(body or b'null')
+        except ValueError as e:
+            raise RequestError(f"Invalid JSON: {e}") from None
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        else:
+            self._send(404, {'error': f"Not found: {self.path}"})
+
+    def do_POST(self):
+        try:
+            if self.path == '/predict':
+                self._send(200, predict(self._read_json()))
+            elif self.path == '/predict/batch':
+                batch = self._read_json()
+                if isinstance(batch, dict):
+                    batch = batch.get('requests')
+                if not isinstance(batch, list):
+                    raise RequestError("A batch must be a JSON array of requests (or {\"requests\": [...]})")
+                if len(batch) > MAX_BATCH:
+                    raise RequestError(f"At most {MAX_BATCH} requests per batch")
+                self._send(200, predict_many(batch))
+            else:
+                self._read_body()
+                self._send(404, {'error': f"Not found: {self.path}"})
+        except RequestError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8001, quiet: bool = False) -> ThreadingHTTPServer:
+    """A ready-to-serve server with the predictor already warm."""
+    get_predictor()
+    handler = type('Handler', (PredictionHandler,), {'quiet': quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Career prediction HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.quiet)
+    print(f"Serving career predictions on http://{args.host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    cli()
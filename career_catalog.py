@@ -0,0 +1,140 @@
+"""
+Career catalogs shared by every predictor.
+
+Built once at import and frozen (read-only mappings over tuples), so any
+number of predictors, request threads and forked workers use the same
+objects instead of rebuilding the dicts per instance.
+"""
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+from skill_index import career_domains
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy: dicts become mapping proxies, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+CAREER_DATABASE: Mapping[str, Tuple[str, ...]] = _freeze({
+    'Technology': ['Software Engineer', 'Data Scientist', 'AI/ML Engineer', 'Cybersecurity Analyst',
+                  'Full Stack Developer', 'DevOps Engineer', 'Cloud Architect', 'Game Developer'],
+    'Medical': ['Doctor (MBBS)', 'Surgeon', 'Dentist', 'Physiotherapist', 'Pharmacist',
+               'Nursing', 'Medical Research', 'Public Health Specialist'],
+    'Engineering': ['Mechanical Engineer', 'Civil Engineer', 'Electrical Engineer', 'Chemical Engineer',
+                   'Aerospace Engineer', 'Automotive Engineer', 'Biomedical Engineer'],
+    'Business': ['Investment Banker', 'Financial Analyst', 'Management Consultant', 'Entrepreneur',
+                'Marketing Manager', 'Business Analyst', 'Product Manager'],
+    'Creative': ['Graphic Designer', 'UI/UX Designer', 'Fashion Designer', 'Animator',
+                'Content Creator', 'Photographer', 'Video Editor', 'Architect'],
+    'Arts': ['Musician', 'Dancer', 'Actor', 'Writer', 'Journalist', 'Fine Artist', 'Film Director'],
+    'Social': ['Psychologist', 'Social Worker', 'NGO Manager', 'HR Manager', 'Teacher',
+              'Counselor', 'Public Relations'],
+    'Law': ['Lawyer', 'Judge', 'Legal Advisor', 'Corporate Lawyer', 'Human Rights Lawyer'],
+    'Science': ['Research Scientist', 'Biotechnologist', 'Environmental Scientist', 'Astronomer',
+               'Physicist', 'Chemist', 'Mathematician'],
+    'Sports': ['Professional Athlete', 'Sports Coach', 'Sports Manager', 'Physiotherapist',
+              'Fitness Trainer', 'Sports Nutritionist']
+})
+
+# Required skills per career, for skill-gap analysis and the skill index
+SKILL_REQUIREMENTS: Mapping[str, Tuple[str, ...]] = _freeze({
+    'Software Engineer': ['Programming', 'Problem Solving', 'Data Structures', 'Algorithms', 'Git'],
+    'Data Scientist': ['Python', 'Statistics', 'Machine Learning', 'SQL', 'Data Visualization'],
+    'Doctor (MBBS)': ['Biology', 'Chemistry', 'Empathy', 'Communication', 'Critical Thinking'],
+    'Financial Analyst': ['Accounting', 'Excel', 'Financial Modeling', 'Analytics', 'Communication'],
+    'Graphic Designer': ['Adobe Suite', 'Creativity', 'Visual Design', 'Typography', 'Color Theory'],
+    'Lawyer': ['Legal Knowledge', 'Communication', 'Research', 'Critical Thinking', 'Writing'],
+    'Teacher': ['Subject Knowledge', 'Communication', 'Patience', 'Creativity', 'Leadership'],
+    'Mechanical Engineer': ['CAD', 'Thermodynamics', 'Mechanics', 'Problem Solving', 'AutoCAD'],
+    'Business Analyst': ['Excel', 'SQL', 'Data Analysis', 'Communication', 'Business Strategy'],
+    'Content Creator': ['Creativity', 'Video Editing', 'Social Media', 'Communication', 'Marketing']
+})
+
+# External psychometric tests, by stage
+PSYCHOMETRIC_TEST_URLS: Mapping[str, Mapping[str, Tuple[Mapping[str, str], ...]]] = _freeze({
+    'stage1': {
+        'personality': [
+            {'name': '16Personalities', 'url': 'https://www.16personalities.com/',
+             'description': 'Free personality test based on Myers-Briggs'},
+            {'name': 'OpenPsychometrics', 'url': 'https://openpsychometrics.org/',
+             'description': 'Multiple free personality tests'},
+            {'name': 'Truity Career Personality Test', 'url': 'https://www.truity.com/test/type-finder-personality-test-new',
+             'description': 'Career-focused personality assessment'}
+        ],
+        'interests': [
+            {'name': 'Career Explorer Holland Code', 'url': 'https://www.careerexplorer.com/career-test/',
+             'description': 'Holland Code (RIASEC) interest assessment'},
+            {'name': 'MyPlan Interest Assessment', 'url': 'https://www.myplan.com/assess/interest-assessment.php',
+             'description': 'Interest profiler for career exploration'}
+        ]
+    },
+    'stage2': {
+        'aptitude': [
+            {'name': 'YouScience Aptitude Test', 'url': 'https://www.youscience.com/',
+             'description': 'Comprehensive aptitude assessment'},
+            {'name': 'Practice Aptitude Tests', 'url': 'https://www.practiceaptitudetests.com/',
+             'description': 'Numerical, Verbal, Logical reasoning tests'},
+            {'name': 'AssessmentDay', 'url': 'https://www.assessmentday.co.uk/',
+             'description': 'Aptitude tests for careers'}
+        ],
+        'career_interest': [
+            {'name': 'O*NET Interest Profiler', 'url': 'https://www.mynextmove.org/explore/ip',
+             'description': 'Official US career interest assessment'},
+            {'name': 'Career One Stop', 'url': 'https://www.careeronestop.org/toolkit/careers/interest-assessment.aspx',
+             'description': 'Government career interest profiler'}
+        ]
+    },
+    'stage3': {
+        'professional': [
+            {'name': 'DISC Personality Test', 'url': 'https://www.123test.com/disc-personality-test/',
+             'description': 'Workplace personality assessment'},
+            {'name': 'CliftonStrengths', 'url': 'https://www.gallup.com/cliftonstrengths/',
+             'description': 'Identify your top talents (paid)'},
+            {'name': 'Skills Matcher', 'url': 'https://nationalcareers.service.gov.uk/skills-assessment',
+             'description': 'Skills assessment for career matching'}
+        ]
+    }
+})
+
+# Undergraduate degrees offered in the stage-3 menu
+DEGREE_OPTIONS: Tuple[str, ...] = _freeze([
+    'B.Tech/B.E. (Computer Science)',
+    'B.Tech/B.E. (Mechanical)',
+    'B.Tech/B.E. (Electrical)',
+    'B.Tech/B.E. (Civil)',
+    'B.Tech/B.E. (Electronics)',
+    'B.Tech/B.E. (Chemical)',
+    'B.Com (Commerce)',
+    'BBA (Business Administration)',
+    'BCA (Computer Applications)',
+    'B.Sc (Science)',
+    'BA (Arts/Humanities)',
+    'MBBS (Medical)',
+    'B.Pharm (Pharmacy)',
+    'LLB (Law)',
+    'B.Des (Design)',
+    'MBA',
+    'M.Tech',
+    'M.Sc',
+    'Other'
+])
+
+# career → domain (first domain wins)
+CAREER_DOMAINS: Mapping[str, str] = MappingProxyType(career_domains(CAREER_DATABASE))
+
+
+def student_stage(grade: int) -> str:
+    """Academic stage for a class (6-12) or a year past school (13+)."""
+    if 6 <= grade <= 9:
+        return "Stage 1: Exploration Years"
+    elif 10 <= grade <= 12:
+        return "Stage 2: Decision Years"
+    elif grade > 12:
+        return "Stage 3: Undergraduate"
+    else:
+        return "Unknown Stage"
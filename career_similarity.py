@@ -0,0 +1,269 @@
+"""
+TF-IDF similarity between free text (a CV) and the career catalog.
+
+Each career becomes a document (title, domain, description from
+career_descriptions.json, required skills), weighted with sublinear TF ×
+smoothed IDF over unigrams and bigrams and L2-normalized. The matrix is
+stored sparse, column-wise: term → (career positions, weights). Cosine
+similarity of a text against every career is then one sparse
+matrix-vector product that only touches the postings of the text's terms.
+Batches go through NumPy when it is installed: the postings are packed
+into CSR arrays once and each chunk of texts is scored with a single
+bincount over the gathered postings. NumPy is only probed for at import
+(find_spec) and imported by the first batch, so importing the predictor
+does not pay for it.
+
+The index is cached to disk as JSON and rebuilt whenever the documents
+change (same fingerprint scheme as intersection_table).
+"""
+import hashlib
+import heapq
+import importlib.util
+import json
+import math
+import os
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Bump when tokenization or weighting changes
+TFIDF_VERSION = 1
+
+# Texts scored per bincount in top_many(); bounds the dense score block to BATCH_SIZE × careers
+BATCH_SIZE = 256
+
+DESCRIPTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "career_descriptions.json")
+CACHE_PATH = os.environ.get(
+    "NAVIRITI_TFIDF_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".career_tfidf.json"),
+)
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or such that the their them they this
+to was were will with who what which how than then also our your you we i my me he she his her not but
+such using used use etc per via over under about across through
+""".split())
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def _stem(token: str) -> str:
+    # Plurals only; CV and catalog wording is otherwise close enough
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def terms(text: str) -> List[str]:
+    """Unigrams and adjacent-word bigrams, lowercased, stop words dropped, plurals folded."""
+    words = [_stem(w) for w in _TOKEN.findall(text.lower()) if w not in STOP_WORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _tf(text: str) -> Dict[str, float]:
+    counts: Dict[str, int] = {}
+    for term in terms(text):
+        counts[term] = counts.get(term, 0) + 1
+    return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {term: w / norm for term, w in vector.items()} if norm else {}
+
+
+class CareerSimilarity(NamedTuple):
+    career: str
+    score: float    # cosine similarity, 0–1
+
+
+class TfidfIndex:
+    def __init__(self, careers: List[str], idf: Dict[str, float],
+                 postings: Dict[str, Tuple[List[int], List[float]]]):
+        self.careers = careers
+        self.idf = idf
+        self.postings = postings
+        self._csr = None
+
+    def __len__(self) -> int:
+        return len(self.careers)
+
+    @classmethod
+    def build(cls, documents: Mapping[str, str]) -> "TfidfIndex":
+        careers = list(documents)
+        tfs = [_tf(documents[career]) for career in careers]
+        df: Dict[str, int] = {}
+        for tf in tfs:
+            for term in tf:
+                df[term] = df.get(term, 0) + 1
+        n = len(careers)
+        idf = {term: math.log((1 + n) / (1 + count)) + 1.0 for term, count in df.items()}
+
+        postings: Dict[str, Tuple[List[int], List[float]]] = {}
+        for position, tf in enumerate(tfs):
+            for term, weight in _normalize({t: w * idf[t] for t, w in tf.items()}).items():
+                ids, weights = postings.setdefault(term, ([], []))
+                ids.append(position)
+                weights.append(weight)
+        return cls(careers, idf, postings)
+
+    def to_json(self) -> Dict:
+        return {"careers": self.careers, "idf": self.idf,
+                "postings": {term: [ids, weights] for term, (ids, weights) in self.postings.items()}}
+
+    @classmethod
+    def from_json(cls, data: Mapping) -> "TfidfIndex":
+        return cls(list(data["careers"]), dict(data["idf"]),
+                   {term: (ids, weights) for term, (ids, weights) in data["postings"].items()})
+
+    def vector(self, text: str) -> Dict[str, float]:
+        """L2-normalized TF-IDF vector of `text` over the catalog vocabulary."""
+        idf = self.idf
+        return _normalize({term: w * idf[term] for term, w in _tf(text).items() if term in idf})
+
+    def scores(self, text: str) -> Dict[int, float]:
+        """Cosine similarity per career position, for careers sharing at least one term."""
+        scores: Dict[int, float] = {}
+        postings = self.postings
+        for term, q in self.vector(text).items():
+            ids, weights = postings[term]
+            for position, weight in zip(ids, weights):
+                scores[position] = scores.get(position, 0.0) + q * weight
+        return scores
+
+    def top(self, text: str, k: int = 5) -> List[CareerSimilarity]:
+        scores = self.scores(text)
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [CareerSimilarity(self.careers[position], score) for position, score in best]
+
+    def _csr_arrays(self):
+        """term → row, plus (indptr, indices, data) of the term × career matrix."""
+        import numpy as np
+
+        if self._csr is None:
+            rows: Dict[str, int] = {}
+            indptr = [0]
+            indices: List[int] = []
+            data: List[float] = []
+            for term, (ids, weights) in self.postings.items():
+                rows[term] = len(rows)
+                indices.extend(ids)
+                data.extend(weights)
+                indptr.append(len(indices))
+            self._csr = (rows, np.array(indptr, dtype=np.int64),
+                         np.array(indices, dtype=np.int64), np.array(data, dtype=np.float64))
+        return self._csr
+
+    def _score_block(self, texts: Sequence[str]):
+        """Dense len(texts) × careers similarity block via one bincount."""
+        import numpy as np
+
+        rows, indptr, indices, data = self._csr_arrays()
+        n = len(self.careers)
+        slices, offsets, scales = [], [], []
+        for i, text in enumerate(texts):
+            for term, q in self.vector(text).items():
+                row = rows[term]
+                slices.append(slice(indptr[row], indptr[row + 1]))
+                offsets.append(i * n)
+                scales.append(q)
+        if not slices:
+            return np.zeros((len(texts), n))
+        lengths = np.array([s.stop - s.start for s in slices], dtype=np.int64)
+        gathered = np.concatenate([indices[s] for s in slices])
+        weights = np.concatenate([data[s] for s in slices]) * np.repeat(scales, lengths)
+        flat = np.bincount(gathered + np.repeat(offsets, lengths), weights=weights, minlength=len(texts) * n)
+        return flat.reshape(len(texts), n)
+
+    def _top_row(self, scores, k: int) -> List[CareerSimilarity]:
+        import numpy as np
+
+        if k <= 0:
+            return []
+        positive = np.flatnonzero(scores > 0)
+        if len(positive) > k:
+            # Keep every career tied with the k-th score so ties resolve by catalog order, as in top()
+            threshold = np.partition(scores[positive], len(positive) - k)[len(positive) - k]
+            positive = positive[scores[positive] >= threshold]
+        order = positive[np.lexsort((positive, -scores[positive]))][:k]
+        return [CareerSimilarity(self.careers[p], float(scores[p])) for p in order]
+
+    def top_many(self, texts: Iterable[str], k: int = 5) -> List[List[CareerSimilarity]]:
+        """top() for a batch of texts, e.g. a whole cohort's CVs."""
+        texts = list(texts)
+        if not NUMPY_AVAILABLE:
+            return [self.top(text, k) for text in texts]
+        results: List[List[CareerSimilarity]] = []
+        for start in range(0, len(texts), BATCH_SIZE):
+            block = self._score_block(texts[start:start + BATCH_SIZE])
+            results.extend(self._top_row(row, k) for row in block)
+        return results
+
+
+# ==================== CATALOG ====================
+
+def load_descriptions(path: str = DESCRIPTIONS_PATH) -> Dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def career_documents(career_database: Mapping[str, Sequence[str]],
+                     skill_requirements: Mapping[str, Sequence[str]],
+                     descriptions: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """One text per career: title, domain(s), description and required skills."""
+    if descriptions is None:
+        descriptions = load_descriptions()
+    domains: Dict[str, List[str]] = {}
+    for domain, careers in career_database.items():
+        for career in careers:
+            domains.setdefault(career, []).append(domain)
+    return {
+        career: " ".join([career, *career_domains, descriptions.get(career, ""),
+                          *skill_requirements.get(career, [])])
+        for career, career_domains in domains.items()
+    }
+
+
+def documents_fingerprint(documents: Mapping[str, str]) -> str:
+    payload = json.dumps({"version": TFIDF_VERSION, "documents": documents}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_cache(path: str, fingerprint: str) -> Optional[TfidfIndex]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("fingerprint") != fingerprint:
+        return None
+    return TfidfIndex.from_json(cached["index"])
+
+
+def _write_cache(path: str, fingerprint: str, index: TfidfIndex):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "index": index.to_json()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Read-only deployments still get the in-memory index
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_tfidf_index(documents: Mapping[str, str], path: str = CACHE_PATH) -> TfidfIndex:
+    fingerprint = documents_fingerprint(documents)
+    index = _read_cache(path, fingerprint)
+    if index is None:
+        index = TfidfIndex.build(documents)
+        _write_cache(path, fingerprint, index)
+    return index
@@ -0,0 +1,203 @@
+"""
+Columnar stage-3 employability scoring for whole cohorts.
+
+score_cohort computes exactly what
+predictor_core.EnhancedScoring (deloitte1's employability rules) gives each student,
+but for a pandas DataFrame, a NumPy structured array or a mapping of
+columns at once, with np.select/np.minimum instead of per-student branches.
+
+Columns (missing ones count as 0, and so do NaN/None cells, e.g. the gaps
+pandas leaves in a column read from a file with blanks):
+    cgpa                       float
+    technical_skills, experience, projects, certifications
+                               counts, or the lists themselves
+    technical_aptitude, communication, analytical_skills
+                               psychometric scores (NaN when not assessed)
+
+cohort_from_students turns stage-3 inputs dicts into these columns.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# (minimum CGPA, points), highest band first
+CGPA_BANDS: Tuple[Tuple[float, int], ...] = ((9.0, 25), (8.0, 20), (7.0, 15), (6.0, 10))
+# column → (points per item, cap)
+COUNT_POINTS: Dict[str, Tuple[int, int]] = {
+    'technical_skills': (3, 25),
+    'experience': (10, 20),
+    'projects': (5, 15),
+    'certifications': (3, 10),
+}
+PSYCHOMETRIC_FIELDS = ('technical_aptitude', 'communication', 'analytical_skills')
+# Awarded when the mean of PSYCHOMETRIC_FIELDS is above the threshold
+PSYCHOMETRIC_BONUS = 5
+PSYCHOMETRIC_THRESHOLD = 80
+MAX_SCORE = 100
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for cohort scoring. Run: pip install numpy")
+
+
+def _column_names(cohort) -> Iterable[str]:
+    dtype = getattr(cohort, 'dtype', None)
+    if dtype is not None and dtype.names:
+        return dtype.names
+    return cohort.keys() if hasattr(cohort, 'keys') else cohort.columns
+
+
+def _size(cohort) -> int:
+    names = list(_column_names(cohort))
+    return len(cohort[names[0]]) if names else 0
+
+
+def _count(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple, set)):
+        return len(value)
+    try:
+        return int(value)
+    except (ValueError, OverflowError):
+        # NaN or infinite: not a count
+        return 0
+
+
+def _counts(values):
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None and dtype != object:
+        values = np.asarray(values)
+        if values.dtype.kind == 'f':
+            # Casting NaN/inf to int64 is undefined (it gives huge negative counts)
+            values = np.where(np.isfinite(values), values, 0)
+        return values.astype(np.int64)
+    # Lists per student: score their lengths, as the per-student function does
+    return np.fromiter((_count(v) for v in values), dtype=np.int64, count=len(values))
+
+
+def score_cohort(cohort):
+    """Employability score (0–100) per row of `cohort`, as an int64 array."""
+    _require_numpy()
+    names = set(_column_names(cohort))
+    n = _size(cohort)
+
+    if 'cgpa' in names:
+        cgpa = np.asarray(cohort['cgpa'], dtype=np.float64)
+        # NaN (missing) fails every comparison and scores 0, like a missing CGPA
+        score = np.select([cgpa >= floor for floor, _ in CGPA_BANDS],
+                          [points for _, points in CGPA_BANDS], 0).astype(np.int64)
+    else:
+        score = np.zeros(n, dtype=np.int64)
+
+    for column, (points, cap) in COUNT_POINTS.items():
+        if column in names:
+            score += np.minimum(_counts(cohort[column]) * points, cap)
+
+    # Summed left to right and divided by 3, matching the per-student float arithmetic
+    total = np.zeros(n, dtype=np.float64)
+    for field in PSYCHOMETRIC_FIELDS:
+        if field in names:
+            total += np.nan_to_num(np.asarray(cohort[field], dtype=np.float64))
+    score += np.where(total / 3 > PSYCHOMETRIC_THRESHOLD, PSYCHOMETRIC_BONUS, 0)
+
+    return np.minimum(score, MAX_SCORE)
+
+
+def cohort_from_students(students: Iterable[Dict]) -> Dict[str, 'np.ndarray']:
+    """Columns for score_cohort from stage-3 inputs dicts (psychometric scores from 'psychometric_results')."""
+    _require_numpy()
+    rows = list(students)
+    columns = {'cgpa': np.fromiter((s.get('cgpa', 0) for s in rows), dtype=np.float64, count=len(rows))}
+    for column in COUNT_POINTS:
+        columns[column] = np.fromiter((len(s.get(column, [])) for s in rows), dtype=np.int64, count=len(rows))
+    for field in PSYCHOMETRIC_FIELDS:
+        columns[field] = np.fromiter(
+            ((s.get('psychometric_results') or {}).get(field, 0) for s in rows), dtype=np.float64, count=len(rows)
+        )
+    return columns
+
+
+def _cohort_with_missing_cells(students: List[Dict]) -> Dict[str, 'np.ndarray']:
+    """
+    The same cohort with every absent field as a NaN/None cell instead: CGPA,
+    count and psychometric columns as floats with NaN, plus object columns of
+    lists with None and NaN, the way a DataFrame holds gaps.
+    """
+    nan = float('nan')
+    n = len(students)
+    psychometric = [s.get('psychometric_results') or {} for s in students]
+    columns = {'cgpa': np.array([s.get('cgpa', nan) for s in students], dtype=np.float64)}
+    for i, column in enumerate(COUNT_POINTS):
+        if i % 2:
+            columns[column] = np.array([len(s[column]) if column in s else nan for s in students], dtype=np.float64)
+        else:
+            cells = np.empty(n, dtype=object)
+            cells[:] = [s[column] if column in s else (None, nan)[j % 2] for j, s in enumerate(students)]
+            columns[column] = cells
+    for i, field in enumerate(PSYCHOMETRIC_FIELDS):
+        values = [p.get(field, nan) for p in psychometric]
+        if i % 2:
+            cells = np.empty(n, dtype=object)
+            cells[:] = [None if v != v else v for v in values]
+            columns[field] = cells
+        else:
+            columns[field] = np.array(values, dtype=np.float64)
+    return columns
+
+
+def verify_cohort_scores(students: List[Dict]) -> List[str]:
+    """
+    Compare score_cohort with the per-student scorer, both on the columns
+    from cohort_from_students and with absent fields as NaN/None cells;
+    returns human-readable mismatches.
+    """
+    from predictor_core import ENHANCED_SCORING
+
+    expected = [
+        ENHANCED_SCORING.score(student, student.get('cv_data', {}), student.get('psychometric_results', {}))
+        for student in students
+    ]
+    problems = []
+    for label, cohort in (('columns', cohort_from_students(students)),
+                          ('missing cells', _cohort_with_missing_cells(students))):
+        scores = score_cohort(cohort)
+        for i, student in enumerate(students):
+            if scores[i] != expected[i]:
+                problems.append(f"student {i} ({label}): cohort {int(scores[i])}, per-student {expected[i]} ({student})")
+    return problems
+
+
+def _edge_case_students(n: int, seed: int = 11) -> List[Dict]:
+    import random
+
+    rng = random.Random(seed)
+    cgpas = [floor + delta for floor, _ in CGPA_BANDS for delta in (-0.01, 0.0, 0.01)] + [0, 10.0]
+    students = []
+    for _ in range(n):
+        student = {column: ['x'] * rng.randint(0, 12) for column in COUNT_POINTS if rng.random() < 0.9}
+        if rng.random() < 0.95:
+            student['cgpa'] = rng.choice(cgpas) if rng.random() < 0.5 else round(rng.uniform(4, 10), 2)
+        if rng.random() < 0.7:
+            # Means just around the threshold, including 80 exactly
+            student['psychometric_results'] = {
+                field: rng.choice([rng.uniform(60, 100), 80, 80.0001, 79.9999])
+                for field in PSYCHOMETRIC_FIELDS if rng.random() < 0.9
+            }
+        students.append(student)
+    return students
+
+
+if __name__ == "__main__":
+    import sys
+
+    problems = verify_cohort_scores(_edge_case_students(20_000))
+    for problem in problems[:20]:
+        print(problem)
+    print(f"{len(problems)} mismatches" if problems else "Cohort scores match the per-student scorer")
+    sys.exit(1 if problems else 0)
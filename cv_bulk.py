@@ -0,0 +1,477 @@
+"""
+Bulk CV ingestion: a directory tree or zip archive of PDFs in, rotating
+NDJSON (or Parquet) parts out, resumable after a restart.
+
+    reader thread ──queue──▶ process pool (extract + parse) ──queue──▶ writer thread
+
+Both queues are bounded, so memory stays flat however large the corpus.
+Each worker extracts through its own CVSandbox child (killed on its wall
+time, capped by its memory rlimit), so one bad PDF costs one record, not
+a worker; zip members over the size limit are rejected from their header.
+Output is appended to part files in sequence; every `checkpoint_every`
+records the current part is fsynced and the IDs it now holds are appended
+to checkpoint.log together with the part's committed size. On restart,
+documents already in the log are skipped and anything written after the
+last commit is truncated away, so no record is lost or duplicated.
+
+Usage: python cv_bulk.py INPUT_DIR_OR_ZIP -o OUTPUT_DIR [--format ndjson|parquet]
+"""
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from cv_sandbox import DEFAULT_LIMITS, CVLimits, CVSandbox, apply_memory_limit
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+CHECKPOINT_FILE = "checkpoint.log"
+_DONE = object()
+
+
+# ==================== INPUT ====================
+
+class TooLarge(NamedTuple):
+    """A zip member over the size limit, judged from its header without reading it."""
+    size: int
+
+
+Document = Tuple[str, Union[str, bytes, TooLarge]]
+
+
+def iter_documents(source: str, skip: Set[str] = frozenset(),
+                   max_file_bytes: Optional[int] = None) -> Iterator[Document]:
+    """
+    (document id, PDF) for every PDF under a directory or in a zip archive,
+    in sorted order. Files in a directory are given by path, so the worker
+    maps them in place; zip members are read into bytes unless the header
+    says they exceed `max_file_bytes`.
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in sorted(archive.infolist(), key=lambda info: info.filename):
+                name = info.filename
+                if not name.lower().endswith('.pdf') or name in skip:
+                    continue
+                if max_file_bytes is not None and info.file_size > max_file_bytes:
+                    yield name, TooLarge(info.file_size)
+                else:
+                    yield name, archive.read(info)
+        return
+
+    paths = []
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for name in files:
+            if name.lower().endswith('.pdf'):
+                paths.append(os.path.relpath(os.path.join(root, name), source))
+    for doc_id in sorted(paths):
+        if doc_id not in skip:
+            yield doc_id, os.path.join(source, doc_id)
+
+
+# ==================== PARSING (worker processes) ====================
+
+_predictor = None
+_sandbox: Optional[CVSandbox] = None
+_limits = DEFAULT_LIMITS
+
+
+def init_worker(limits: CVLimits = DEFAULT_LIMITS):
+    """Pool initializer: every worker extracts under `limits` and its memory cap."""
+    global _limits
+    _limits = limits
+    apply_memory_limit(limits.memory_bytes)
+
+
+def parse_document(doc_id: str, source: Union[str, bytes], include_text: bool = False) -> Dict:
+    """
+    Extract and parse one CV. Extraction runs in this worker's CVSandbox, so
+    a page that hangs or crashes the PDF library costs only the sandbox
+    child. The record's status is the extraction status (ok, truncated,
+    timeout, memory, error); partial text is still parsed.
+    """
+    global _predictor, _sandbox
+    start = time.perf_counter()
+    try:
+        if _predictor is None:
+            from deloitte1 import NaviRitiCareerPredictor
+            _predictor = NaviRitiCareerPredictor()
+        if _sandbox is None:
+            _sandbox = CVSandbox(_limits)
+        extraction = _sandbox.extract(source)
+        cv_data = _predictor._new_cv_data()
+        cv_data['raw_text'] = extraction['raw_text']
+        if cv_data['raw_text']:
+            cv_data = _predictor._extract_cv_information_enhanced(cv_data)
+            cv_data['parsed_successfully'] = True
+        if not include_text:
+            del cv_data['raw_text']
+        record = {'id': doc_id, 'status': extraction['status'], **cv_data}
+        for key in ('truncated_by', 'error'):
+            if extraction[key]:
+                record[key] = extraction[key]
+    except MemoryError:
+        record = {'id': doc_id, 'status': 'memory', 'error': "Document exceeded the memory limit"}
+    except Exception as e:
+        record = {'id': doc_id, 'status': 'error', 'error': str(e)}
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+# ==================== OUTPUT ====================
+
+def _remove_parts_after(directory: str, index: int, extension: str):
+    for name in os.listdir(directory):
+        if name.startswith('part-') and name.endswith(f".{extension}"):
+            try:
+                part = int(name[len('part-'):-len(extension) - 1])
+            except ValueError:
+                continue
+            if part > index:
+                os.remove(os.path.join(directory, name))
+
+
+class NDJSONPartWriter:
+    """Appends records to part-NNNNN.ndjson files, starting a new part past `max_bytes`."""
+    extension = 'ndjson'
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index = 0
+        self._file = None
+
+    @property
+    def part_name(self) -> str:
+        return f"part-{self.index:05d}.{self.extension}"
+
+    def resume(self, index: int, offset: int, committed: bool):
+        """Continue after the last checkpointed commit, dropping anything written after it."""
+        _remove_parts_after(self.directory, index, self.extension)
+        if offset >= self.max_bytes:
+            index, offset = index + 1, 0
+        self.open(index, offset)
+
+    def open(self, index: int, offset: int):
+        self.index = index
+        path = os.path.join(self.directory, self.part_name)
+        self._file = open(path, 'ab')
+        self._file.truncate(offset)
+        self._file.seek(offset)
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    def commit(self) -> int:
+        """Make everything written so far durable; returns the committed size of the current part."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def should_rotate(self, offset: int) -> bool:
+        return offset >= self.max_bytes
+
+    def rotate(self):
+        self._file.close()
+        self.open(self.index + 1, 0)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParquetPartWriter(NDJSONPartWriter):
+    """One Parquet file per commit (Parquet files cannot be appended to)."""
+    extension = 'parquet'
+
+    def resume(self, index: int, offset: int, committed: bool):
+        if not committed:
+            index = -1
+        _remove_parts_after(self.directory, index, self.extension)
+        self.open(index + 1, 0)
+
+    def open(self, index: int, offset: int):
+        self.index = index
+        self._records: List[Dict] = []
+
+    def write(self, record: Dict):
+        self._records.append(record)
+
+    def commit(self) -> int:
+        if not self._records:
+            return 0
+        path = os.path.join(self.directory, self.part_name)
+        tmp_path = f"{path}.tmp"
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(self._records), tmp_path)
+        os.replace(tmp_path, path)
+        self._records = []
+        return os.path.getsize(path)
+
+    def should_rotate(self, offset: int) -> bool:
+        return offset > 0
+
+    def rotate(self):
+        self.open(self.index + 1, 0)
+
+    def close(self):
+        self._records = []
+
+
+# ==================== CHECKPOINT ====================
+
+def read_checkpoint(directory: str) -> Tuple[Set[str], int, int]:
+    """
+    (done IDs, part index, committed offset) of the last commit in
+    checkpoint.log. A torn last line (crash mid-write) is cut off so new
+    commits append after the last complete one.
+    """
+    done: Set[str] = set()
+    index, offset = 0, 0
+    path = os.path.join(directory, CHECKPOINT_FILE)
+    try:
+        with open(path, 'rb+') as f:
+            valid = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                done.update(entry['ids'])
+                index, offset = entry['part'], entry['offset']
+                valid += len(line)
+            f.truncate(valid)
+    except OSError:
+        pass
+    return done, index, offset
+
+
+# ==================== PIPELINE ====================
+
+class BulkIngestion:
+    def __init__(self, source: str, output_dir: str, fmt: str = 'ndjson',
+                 max_workers: Optional[int] = None, max_part_bytes: int = 256 * 1024 * 1024,
+                 checkpoint_every: int = 500, include_text: bool = False, queue_size: int = 64,
+                 limits: CVLimits = DEFAULT_LIMITS):
+        if fmt == 'parquet' and not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet output needs pyarrow. Run: pip install pyarrow")
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Input not found: {source}")
+        if not (os.path.isdir(source) or zipfile.is_zipfile(source)):
+            raise ValueError(f"Input is neither a directory nor a zip archive: {source}")
+        self.source = source
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_part_bytes = max_part_bytes
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.include_text = include_text
+        self.queue_size = queue_size
+        self.limits = limits
+        self.stats = {'skipped': 0, 'written': 0, 'errors': 0, 'limited': 0}
+
+    def run(self) -> Dict[str, int]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        done, index, offset = read_checkpoint(self.output_dir)
+        self.stats['skipped'] = len(done)
+
+        writer_cls = ParquetPartWriter if self.fmt == 'parquet' else NDJSONPartWriter
+        writer = writer_cls(self.output_dir, self.max_part_bytes)
+        writer.resume(index, offset, committed=bool(done))
+
+        documents: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        records: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        errors: List[BaseException] = []
+        stop = threading.Event()
+
+        reader = threading.Thread(target=self._read, args=(done, documents, stop, errors), daemon=True)
+        writer_thread = threading.Thread(target=self._write, args=(writer, records, errors), daemon=True)
+        reader.start()
+        writer_thread.start()
+        try:
+            self._parse(documents, records, errors)
+        finally:
+            # Whatever finished is committed, so a failed run resumes where it stopped
+            stop.set()
+            records.put(_DONE)
+            writer_thread.join()
+            while reader.is_alive():
+                try:
+                    documents.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+        if errors:
+            raise errors[0]
+        return self.stats
+
+    def _read(self, done: Set[str], documents: queue.Queue, stop: threading.Event,
+              errors: List[BaseException]):
+        try:
+            for document in iter_documents(self.source, done, self.limits.max_file_bytes):
+                if stop.is_set():
+                    return
+                documents.put(document)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            documents.put(_DONE)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_worker, initargs=(self.limits,))
+
+    @staticmethod
+    def _failed(doc_id: str, error: str) -> Dict:
+        return {'id': doc_id, 'status': 'error', 'error': error}
+
+    def _parse(self, documents: queue.Queue, records: queue.Queue, errors: List[BaseException]):
+        """
+        Feed documents through the pool. If a worker dies (segfault, OOM kill)
+        the pool is broken and every in-flight document fails with it, so the
+        pool is restarted and those documents are rerun one at a time: the one
+        that kills its worker alone gets an error record, which is
+        checkpointed like any other, so --resume does not retry it.
+        """
+        pool = self._new_pool()
+        in_flight: Dict[Future, Document] = {}
+        suspects: Deque[Document] = deque()
+        alone: Optional[Future] = None
+        exhausted = False
+        try:
+            while (not exhausted or in_flight or suspects) and not errors:
+                if suspects:
+                    if not in_flight:
+                        document = suspects.popleft()
+                        alone = pool.submit(parse_document, *document, self.include_text)
+                        in_flight[alone] = document
+                else:
+                    # Keep the pool busy without pulling the whole corpus into memory
+                    while not exhausted and len(in_flight) < self.max_workers * 2:
+                        document = documents.get()
+                        if document is _DONE:
+                            exhausted = True
+                        elif isinstance(document[1], TooLarge):
+                            records.put(self._failed(document[0], f"File is {document[1].size} bytes; "
+                                                                  f"limit is {self.limits.max_file_bytes}"))
+                        else:
+                            in_flight[pool.submit(parse_document, *document, self.include_text)] = document
+                if not in_flight:
+                    continue
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in finished:
+                    document = in_flight.pop(future)
+                    try:
+                        records.put(future.result())
+                    except BrokenProcessPool:
+                        broken = True
+                        if future is alone:
+                            records.put(self._failed(document[0], "Worker process died while parsing this document"))
+                        else:
+                            suspects.append(document)
+                    except Exception as e:
+                        records.put(self._failed(document[0], f"{type(e).__name__}: {e}"))
+                if broken:
+                    for future, document in in_flight.items():
+                        if future.done() and future.exception() is None:
+                            records.put(future.result())
+                        else:
+                            suspects.append(document)
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = self._new_pool()
+        finally:
+            pool.shutdown(wait=not errors, cancel_futures=True)
+
+    def _write(self, writer: NDJSONPartWriter, records: queue.Queue, errors: List[BaseException]):
+        checkpoint = open(os.path.join(self.output_dir, CHECKPOINT_FILE), 'a', encoding='utf-8')
+        pending: List[str] = []
+
+        def commit():
+            offset = writer.commit()
+            if pending:
+                checkpoint.write(json.dumps({'part': writer.index, 'offset': offset, 'ids': pending}) + '\n')
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+                pending.clear()
+            if writer.should_rotate(offset):
+                writer.rotate()
+
+        try:
+            while True:
+                record = records.get()
+                if record is _DONE:
+                    break
+                if errors:
+                    continue
+                writer.write(record)
+                pending.append(record['id'])
+                self.stats['written'] += 1
+                if record['status'] in ('truncated', 'timeout'):
+                    self.stats['limited'] += 1
+                elif record['status'] != 'ok':
+                    self.stats['errors'] += 1
+                if len(pending) >= self.checkpoint_every:
+                    commit()
+            if not errors:
+                commit()
+        except BaseException as e:
+            errors.append(e)
+            # Keep draining so the parse stage never blocks on a full queue
+            while records.get() is not _DONE:
+                pass
+        finally:
+            writer.close()
+            checkpoint.close()
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk CV ingestion to rotating NDJSON/Parquet parts")
+    parser.add_argument("input", help="Directory of PDFs (searched recursively) or a .zip archive")
+    parser.add_argument("-o", "--output", required=True, help="Output directory (parts + checkpoint.log)")
+    parser.add_argument("-f", "--format", choices=("ndjson", "parquet"), default="ndjson")
+    parser.add_argument("-w", "--workers", type=int, help="Parser processes (default: CPU count)")
+    parser.add_argument("--part-mb", type=int, default=256, help="Start a new NDJSON part past this size")
+    parser.add_argument("--checkpoint-every", type=int, default=500, help="Records per durable commit")
+    parser.add_argument("--include-text", action="store_true", help="Keep raw_text in the output")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_LIMITS.max_pages, help="Pages read per CV")
+    parser.add_argument("--max-chars", type=int, default=DEFAULT_LIMITS.max_chars, help="Characters kept per CV")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_LIMITS.timeout, help="Seconds per CV")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_LIMITS.memory_bytes // (1024 * 1024),
+                        help="Address-space cap per worker process (0 for none)")
+    args = parser.parse_args(argv)
+    limits = DEFAULT_LIMITS._replace(max_pages=args.max_pages, max_chars=args.max_chars, timeout=args.timeout,
+                                     memory_bytes=args.memory_mb * 1024 * 1024)
+
+    try:
+        ingestion = BulkIngestion(
+            args.input, args.output, args.format, args.workers, args.part_mb * 1024 * 1024,
+            args.checkpoint_every, args.include_text, limits=limits,
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    stats = ingestion.run()
+    print(f"Wrote {stats['written']} CVs ({stats['errors']} errors, {stats['limited']} cut at a limit), skipped {stats['skipped']} "
+          f"already done, in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    cli()
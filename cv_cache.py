@@ -0,0 +1,145 @@
+"""
+Content-addressed cache of parsed CVs.
+
+Entries are keyed on SHA-256 of the PDF bytes plus PARSER_VERSION, so a
+re-uploaded CV is served from disk and any parser change invalidates the
+whole cache. The store is a directory of JSON files; when it grows past
+`max_bytes` the least recently used entries are evicted.
+"""
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Bump whenever deloitte1 CV extraction changes what it produces
+PARSER_VERSION = 4
+
+CACHE_DIR = os.environ.get(
+    "NAVIRITI_CV_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cv_cache"),
+)
+# 0 disables the cache
+CACHE_MAX_BYTES = int(os.environ.get("NAVIRITI_CV_CACHE_BYTES", 256 * 1024 * 1024))
+
+_CHUNK = 1 << 20
+
+
+def content_key(data: bytes, version: int = PARSER_VERSION) -> str:
+    digest = hashlib.sha256(f"v{version}:".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def file_key(pdf_path: str, version: int = PARSER_VERSION) -> str:
+    """content_key of a file, read in chunks."""
+    digest = hashlib.sha256(f"v{version}:".encode())
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CVCache:
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._sizes: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self) -> Dict[str, int]:
+        # Entry sizes are read from disk once, then tracked in memory
+        if self._sizes is None:
+            sizes = {}
+            try:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.json'):
+                            sizes[entry.path] = entry.stat().st_size
+            except OSError:
+                pass
+            self._sizes = sizes
+        return self._sizes
+
+    def get(self, key: str) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                cv_data = json.load(f)
+            # mtime doubles as the last-used time for eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return cv_data
+
+    def put(self, key: str, cv_data: Dict):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cv_data, f, ensure_ascii=False)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # A read-only or full disk only costs us the cache
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            sizes = self._scan()
+            sizes[path] = size
+            if sum(sizes.values()) > self.max_bytes:
+                self._evict(sizes)
+
+    def _evict(self, sizes: Dict[str, int]):
+        """Drop least recently used entries until the store is at 90% of max_bytes."""
+        def last_used(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0
+
+        total = sum(sizes.values())
+        target = self.max_bytes * 0.9
+        for path in sorted(sizes, key=last_used):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= sizes.pop(path)
+
+    def clear(self):
+        with self._lock:
+            for path in list(self._scan()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._sizes = {}
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(self._scan().values())
+
+
+@lru_cache(maxsize=None)
+def default_cv_cache() -> CVCache:
+    return CVCache()
@@ -0,0 +1,295 @@
+import heapq
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cv_sandbox import DEFAULT_LIMITS, apply_memory_limit
+from pdf_backends import count_pages, extract_pages
+
+# (file sequence, chunk start, path); chunk start -1 is the page count
+Task = Tuple[int, int, str]
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) with per-page backend fallback (see pdf_backends)."""
+    return extract_pages(pdf_path, start, stop)
+
+
+def join_pages(texts: Iterable[str]) -> str:
+    """Join page texts the way parse_cv_pdf builds raw_text (one newline after each non-empty page)."""
+    return ''.join([f"{text}\n" for text in texts if text])
+
+
+class CVIngestionEngine:
+    """
+    Extracts text from many PDFs in a process pool.
+
+    Each file is split into chunks of `pages_per_task` pages, so a long CV is
+    spread over several workers and many short CVs run side by side. Page
+    texts are reassembled in order and joined once.
+
+    No more tasks are submitted than there are workers, and chunks of files
+    already started go before new files, so a file's `file_timeout` clock
+    starts when its first task starts and is never spent queued behind
+    another file's chunks. A file that runs past it is reported with status
+    'timeout'. Whenever a file ends ('timeout' or 'error') with chunks of it
+    still running, the pool's workers are terminated and the other files'
+    in-flight chunks resubmitted to a fresh pool, so a hung page neither
+    keeps a worker busy nor blocks close().
+
+    Workers run under a `memory_bytes` address-space cap (see cv_sandbox).
+    If a worker dies (segfault, OOM kill), the pool is restarted and the
+    tasks it took down are rerun one at a time; the file whose task kills
+    a worker on its own is reported with status 'error'.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, pages_per_task: int = 4,
+                 file_timeout: float = 60.0, memory_bytes: int = DEFAULT_LIMITS.memory_bytes):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_task = max(1, pages_per_task)
+        self.file_timeout = file_timeout
+        self.memory_bytes = memory_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            # Interrupted mid-run: tasks may still be running, don't wait for them
+            self.terminate()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=apply_memory_limit,
+                                                 initargs=(self.memory_bytes,))
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def terminate(self):
+        """Kill the pool's workers without waiting for running tasks; the next task starts a fresh pool."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if hasattr(executor, 'terminate_workers'):  # Python 3.14+
+            executor.terminate_workers()
+            return
+        # A running task can't be cancelled, so stop the processes running it
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        for process in processes:
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.join()
+
+    def extract(self, pdf_path: str) -> Dict:
+        return self.extract_many([pdf_path])[pdf_path]
+
+    def extract_many(self, pdf_paths: Sequence[str]) -> Dict[str, Dict]:
+        """
+        Extract every PDF. Returns {path: {'raw_text', 'pages', 'status', 'error', 'seconds'}}
+        in input order; status is 'ok', 'timeout' or 'error'.
+        """
+        waiting = deque(dict.fromkeys(pdf_paths))
+        ready: List[Task] = []
+        # Tasks that were running when a worker died, rerun one at a time
+        suspects: Deque[Task] = deque()
+        running: Dict[Future, Task] = {}
+        alone: Optional[Future] = None
+        results: Dict[str, Dict] = {}
+        jobs: Dict[str, Dict] = {}
+        sequence = 0
+
+        while waiting or jobs:
+            if suspects:
+                while suspects and not running:
+                    task = suspects.popleft()
+                    if task[2] in jobs:
+                        alone = self._start(task, running)
+                        if alone is None:
+                            suspects.appendleft(task)
+                            break
+            else:
+                while len(running) < self.max_workers and (ready or waiting):
+                    if ready:
+                        task = heapq.heappop(ready)
+                    else:
+                        path = waiting.popleft()
+                        if not os.path.exists(path):
+                            results[path] = self._result(status='error', error=f"File not found at {path}")
+                            continue
+                        jobs[path] = {'chunks': {}, 'pending': 1, 'started': time.monotonic()}
+                        task = (sequence, -1, path)
+                        sequence += 1
+                    if task[2] in jobs and self._start(task, running) is None:
+                        heapq.heappush(ready, task)
+                        break
+            if not running:
+                if not (ready or waiting or suspects):
+                    break
+                continue
+
+            timeout = None
+            if jobs:
+                next_deadline = min(job['started'] for job in jobs.values()) + self.file_timeout
+                timeout = max(0.0, next_deadline - time.monotonic())
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for future in done:
+                task = running.pop(future)
+                seq, start, path = task
+                job = jobs.get(path)
+                if job is None:
+                    continue
+                try:
+                    value = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    if future is alone:
+                        self._finish(jobs, results, path, status='error',
+                                     error="Worker process died while extracting this file")
+                    else:
+                        suspects.append(task)
+                    continue
+                except Exception as e:
+                    self._finish(jobs, results, path, status='error', error=str(e) or type(e).__name__)
+                    continue
+                job['pending'] -= 1
+                if start >= 0:
+                    job['chunks'][start] = value
+                else:
+                    # Page count arrived: fan the file out into page chunks
+                    for chunk_start in range(0, value, self.pages_per_task):
+                        heapq.heappush(ready, (seq, chunk_start, path))
+                        job['pending'] += 1
+                if not job['pending']:
+                    texts = [text for _, chunk_texts in sorted(job['chunks'].items()) for text in chunk_texts]
+                    self._finish(jobs, results, path, status='ok', texts=texts)
+            if broken:
+                # Everything else on the dead pool fails with it
+                suspects.extend(task for task in running.values() if task[2] in jobs)
+                running.clear()
+                self.terminate()
+
+            now = time.monotonic()
+            expired = [p for p, job in jobs.items() if now - job['started'] >= self.file_timeout]
+            for path in expired:
+                self._finish(jobs, results, path, status='timeout',
+                             error=f"Extraction exceeded {self.file_timeout}s")
+            # Chunks of files already finished (error, timeout) are no longer wanted;
+            # if one is still executing, stop it rather than let it hold a worker
+            orphans = [future for future, task in running.items() if task[2] not in jobs]
+            for future in orphans:
+                del running[future]
+            if any(not future.done() for future in orphans):
+                self.terminate()
+                for task in running.values():
+                    heapq.heappush(ready, task)
+                running.clear()
+
+        return {path: results[path] for path in dict.fromkeys(pdf_paths)}
+
+    def _start(self, task: Task, running: Dict[Future, Task]) -> Optional[Future]:
+        """Submit a task; None if the pool broke since the last wait (it is restarted once idle)."""
+        try:
+            future = self._submit(task)
+        except BrokenProcessPool:
+            if not running:
+                self.terminate()
+            return None
+        running[future] = task
+        return future
+
+    def _submit(self, task: Task) -> Future:
+        _, start, path = task
+        if start < 0:
+            return self.executor.submit(count_pages, path)
+        return self.executor.submit(extract_page_range, path, start, start + self.pages_per_task)
+
+    def _finish(self, jobs, results, path, status, texts=(), error=''):
+        job = jobs.pop(path)
+        results[path] = self._result(status=status, texts=texts, error=error,
+                                     seconds=time.monotonic() - job['started'])
+
+    @staticmethod
+    def _result(status: str, texts: Sequence[str] = (), error: str = '', seconds: float = 0.0) -> Dict:
+        return {
+            'raw_text': join_pages(texts),
+            'pages': len(texts),
+            'status': status,
+            'error': error,
+            'seconds': round(seconds, 4),
+        }
+
+
+def _fail_first_chunk(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Fault injection for verify_extract_many: the first chunk fails once later ones are running, and they hang."""
+    if start == 0:
+        time.sleep(0.5)
+        raise ValueError("injected failure")
+    time.sleep(600)
+    return []
+
+
+class _FirstChunkFailsEngine(CVIngestionEngine):
+    def _submit(self, task: Task) -> Future:
+        _, start, path = task
+        if start >= 0 and os.path.basename(path).startswith('faulty'):
+            return self.executor.submit(_fail_first_chunk, path, start, start + self.pages_per_task)
+        return super()._submit(task)
+
+
+def verify_extract_many(directory: str) -> List[str]:
+    """
+    Run a batch where one file fails on its first chunk while its other
+    chunks hang, next to a good file and a missing one; returns
+    human-readable problems (crash, wrong status, or a hung chunk outliving
+    its file).
+    """
+    from benchmarks import make_synthetic_cv_pdf
+
+    faulty, good = os.path.join(directory, 'faulty.pdf'), os.path.join(directory, 'good.pdf')
+    missing = os.path.join(directory, 'missing.pdf')
+    make_synthetic_cv_pdf(faulty, pages=12)
+    make_synthetic_cv_pdf(good, pages=1, seed=1)
+
+    start = time.monotonic()
+    try:
+        with _FirstChunkFailsEngine(max_workers=2, pages_per_task=4, file_timeout=300) as engine:
+            results = engine.extract_many([faulty, good, missing])
+    except Exception as e:
+        return [f"extract_many raised {type(e).__name__}: {e}"]
+    seconds = time.monotonic() - start
+
+    problems = []
+    for path, status in ((faulty, 'error'), (good, 'ok'), (missing, 'error')):
+        if results[path]['status'] != status:
+            problems.append(f"{os.path.basename(path)}: status {results[path]['status']!r}, expected {status!r}")
+    if results[good]['raw_text'] != join_pages(extract_page_range(good, 0, 1 << 30)):
+        problems.append("good.pdf: text differs from sequential extraction")
+    if seconds > 60:
+        problems.append(f"batch took {seconds:.0f}s: the failed file's hung chunks were left running")
+    return problems
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        problems = verify_extract_many(directory)
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} problems" if problems else "Failed files leave no chunks running")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,260 @@
+"""
+Resource-limited CV text extraction.
+
+extract_limited maps the PDF read-only (mmap, no copy into the Python heap)
+and stops at a page, character and wall-time budget, checked between
+pages. CVSandbox runs it in a long-lived child process under a memory
+rlimit and kills the child if a single document hangs inside a page or
+crashes the PDF library, so one hostile or corrupt upload cannot stall or
+OOM the process that is parsing CVs. parse_cv_pdf extracts and
+preview_cv_pdf streams (preview_limited) through default_sandbox();
+cv_bulk gives each worker process its own sandbox.
+
+Every result carries a status:
+    ok         whole document extracted
+    truncated  page or character cap reached (see 'truncated_by'); text is partial
+    timeout    time budget exceeded; text is whatever was extracted in time
+    memory     the document exceeded the memory limit
+    error      unreadable, too large or not a PDF
+"""
+import atexit
+import mmap
+import multiprocessing
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from pdf_backends import count_pages, iter_pages
+
+try:
+    import resource
+    RLIMIT_AVAILABLE = True
+except ImportError:
+    RLIMIT_AVAILABLE = False
+
+
+class CVLimits(NamedTuple):
+    max_file_bytes: int = 20 * 1024 * 1024
+    max_pages: int = 50
+    max_chars: int = 200_000
+    timeout: float = 30.0
+    memory_bytes: int = 1024 * 1024 * 1024
+
+
+DEFAULT_LIMITS = CVLimits()
+
+
+def _result(status: str, texts: List[str] = (), total_pages: int = 0, error: str = '',
+            truncated_by: str = '', started: Optional[float] = None) -> Dict:
+    return {
+        'status': status,
+        'raw_text': ''.join([f"{text}\n" for text in texts if text]),
+        'pages': len(texts),
+        'total_pages': total_pages,
+        'truncated_by': truncated_by,
+        'error': error,
+        'seconds': round(time.monotonic() - started, 4) if started is not None else 0.0,
+    }
+
+
+def _extract_within(data, limits: CVLimits, started: float) -> Dict:
+    texts: List[str] = []
+    total_pages = 0
+    try:
+        total_pages = count_pages(data)
+        chars = 0
+        pages = iter_pages(data, 0, limits.max_pages)
+        try:
+            for text in pages:
+                if chars + len(text) > limits.max_chars:
+                    texts.append(text[:limits.max_chars - chars])
+                    return _result('truncated', texts, total_pages, truncated_by='chars', started=started)
+                texts.append(text)
+                chars += len(text)
+                if time.monotonic() - started > limits.timeout:
+                    return _result('timeout', texts, total_pages, error=f"Extraction exceeded {limits.timeout}s",
+                                   started=started)
+        finally:
+            pages.close()
+    except MemoryError:
+        texts = None  # release the partial text before building the result
+        return _result('memory', error="Document exceeded the memory limit", started=started)
+    except Exception as e:
+        return _result('error', texts, total_pages, error=str(e), started=started)
+
+    if total_pages > limits.max_pages:
+        return _result('truncated', texts, total_pages, truncated_by='pages', started=started)
+    return _result('ok', texts, total_pages, started=started)
+
+
+def _size_error(source: Union[str, bytes], limits: CVLimits) -> str:
+    """Why the document is refused before reading it ('' if it isn't); OSError if a path can't be read."""
+    size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+    if size > limits.max_file_bytes:
+        return f"File is {size} bytes; limit is {limits.max_file_bytes}"
+    if size == 0 and not isinstance(source, bytes):
+        return "File is empty"
+    return ''
+
+
+def extract_limited(source: Union[str, bytes], limits: CVLimits = DEFAULT_LIMITS) -> Dict:
+    """
+    Extract CV text within `limits`, in this process. Page, character and
+    time caps are checked between pages; use CVSandbox for a hard memory
+    limit and for documents that hang inside a single page.
+    """
+    started = time.monotonic()
+    try:
+        error = _size_error(source, limits)
+        if error:
+            return _result('error', error=error, started=started)
+        if isinstance(source, bytes):
+            return _extract_within(source, limits, started)
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _extract_within(data, limits, started)
+    except OSError as e:
+        return _result('error', error=str(e), started=started)
+
+
+def _preview_result(status: str, error: str = '', started: Optional[float] = None, **fields) -> Dict:
+    return {**fields, 'status': status, 'error': error}
+
+
+def preview_limited(source: Union[str, bytes], fields: Iterable[str], max_pages: Optional[int] = None,
+                    limits: CVLimits = DEFAULT_LIMITS) -> Dict:
+    """
+    cv_stream.stream_cv() under the same file-size and page caps as
+    extract_limited. The preview fields come back with a 'status' ('ok',
+    'memory' or 'error') and an 'error' message.
+    """
+    from cv_stream import stream_cv
+
+    max_pages = limits.max_pages if max_pages is None else min(max_pages, limits.max_pages)
+    try:
+        error = _size_error(source, limits)
+        if error:
+            return _preview_result('error', error)
+        return _preview_result('ok', **stream_cv(source, fields, max_pages))
+    except MemoryError:
+        return _preview_result('memory', "Document exceeded the memory limit")
+    except Exception as e:
+        return _preview_result('error', str(e) or type(e).__name__)
+
+
+def apply_memory_limit(memory_bytes: int):
+    """Cap this process's address space, so runaway allocations raise MemoryError."""
+    if RLIMIT_AVAILABLE and memory_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            memory_bytes = min(memory_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+
+
+def _sandbox_worker(conn, limits: CVLimits):
+    apply_memory_limit(limits.memory_bytes)
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        task, args = job
+        result = task(*args)
+        conn.send(result)
+        if result['status'] == 'memory':
+            # Start from a clean heap for the next document
+            break
+
+
+class CVSandbox:
+    """
+    A child process that extracts CVs one at a time under `limits`. The
+    child is restarted after a timeout (it is killed) or a memory failure.
+    Pass a path rather than bytes where there is one: the child maps the
+    file itself, so the document is never copied through the pipe.
+    Calls from several threads take turns.
+    """
+
+    # Extra seconds the child gets past limits.timeout before it is killed
+    KILL_GRACE = 5.0
+
+    def __init__(self, limits: CVLimits = DEFAULT_LIMITS):
+        self.limits = limits
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _start(self):
+        parent, child = self._context.Pipe()
+        self._process = self._context.Process(target=_sandbox_worker, args=(child, self.limits), daemon=True)
+        self._process.start()
+        child.close()
+        self._conn = parent
+
+    def _kill(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def extract(self, source: Union[str, bytes]) -> Dict:
+        """extract_limited() in the child."""
+        with self._lock:
+            return self._run(extract_limited, (source, self.limits), _result)
+
+    def preview(self, source: Union[str, bytes], fields: Iterable[str], max_pages: Optional[int] = None) -> Dict:
+        """preview_limited() in the child; a killed or crashed child gives just 'status' and 'error'."""
+        with self._lock:
+            return self._run(preview_limited, (source, tuple(fields), max_pages, self.limits), _preview_result)
+
+    def _run(self, task: Callable[..., Dict], args: tuple, failed: Callable[..., Dict]) -> Dict:
+        started = time.monotonic()
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        try:
+            self._conn.send((task, args))
+            if self._conn.poll(self.limits.timeout + self.KILL_GRACE):
+                result = self._conn.recv()
+                if result['status'] == 'memory':
+                    # The child exits after a memory failure; don't hand the next document to it
+                    self._process.join(timeout=1.0)
+                    self._kill()
+                return result
+        except (EOFError, OSError):
+            # The child died mid-document; being killed by a signal usually means the OOM killer
+            self._process.join(timeout=1.0)
+            exitcode = self._process.exitcode
+            self._kill()
+            if exitcode is not None and exitcode < 0:
+                return failed('memory', error=f"Worker killed by signal {-exitcode}", started=started)
+            return failed('error', error="Worker exited unexpectedly", started=started)
+
+        self._kill()
+        return failed('timeout', error=f"Extraction exceeded {self.limits.timeout}s", started=started)
+
+    def close(self):
+        with self._lock:
+            if self._process is not None and self._process.is_alive():
+                try:
+                    self._conn.send(None)
+                    self._process.join(timeout=1.0)
+                except OSError:
+                    pass
+            self._kill()
+
+
+@lru_cache(maxsize=None)
+def default_sandbox() -> CVSandbox:
+    """Process-wide sandbox with the default limits; its child starts on the first extract()."""
+    sandbox = CVSandbox()
+    atexit.register(sandbox.close)
+    return sandbox
@@ -0,0 +1,179 @@
+"""
+Line-oriented CV section segmenter.
+
+Each line is stripped, lowercased and classified once. Section headers
+(Education, Experience, Projects, ...) switch the current section, and every
+line is handed only to the extractor for its section, so a project line
+that mentions a university no longer ends up under education. Under a
+Certifications or Achievements header every line counts. Lines before
+the first header, or under sections we have no extractor for, still go
+through every keyword rule as before.
+"""
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+EDUCATION = 'education'
+EXPERIENCE = 'experience'
+PROJECTS = 'projects'
+SKILLS = 'skills'
+CERTIFICATIONS = 'certifications'
+ACHIEVEMENTS = 'achievements'
+OTHER = 'other'
+
+SECTION_HEADERS: Dict[str, List[str]] = {
+    EDUCATION: ['education', 'educational qualifications', 'educational background', 'academic background',
+                'academic qualifications', 'academics', 'qualifications'],
+    EXPERIENCE: ['experience', 'work experience', 'professional experience', 'employment',
+                 'employment history', 'work history', 'internships', 'internship experience', 'internship'],
+    PROJECTS: ['projects', 'academic projects', 'personal projects', 'key projects', 'project work'],
+    SKILLS: ['skills', 'technical skills', 'key skills', 'core competencies', 'skills and interests',
+             'technologies', 'tools and technologies'],
+    CERTIFICATIONS: ['certifications', 'certificates', 'certification', 'courses', 'licenses and certifications',
+                     'courses and certifications'],
+    ACHIEVEMENTS: ['achievements', 'awards', 'honors', 'honours', 'awards and achievements',
+                   'honors and awards', 'accomplishments'],
+    # Recognised so they end the previous section, but not extracted line by line
+    OTHER: ['summary', 'profile', 'professional summary', 'objective', 'career objective', 'about me',
+            'languages', 'interests', 'hobbies', 'extracurricular activities', 'activities',
+            'positions of responsibility', 'leadership', 'volunteering', 'references', 'declaration',
+            'personal details', 'contact'],
+}
+
+_HEADER_SECTION: Dict[str, str] = {
+    alias: section for section, aliases in SECTION_HEADERS.items() for alias in aliases
+}
+_HEADER_NOISE = re.compile(r'[^a-z ]+')
+_MAX_HEADER_LENGTH = max(len(alias) for alias in _HEADER_SECTION) + 4
+
+EDUCATION_KEYWORDS = ['B.Tech', 'B.E.', 'M.Tech', 'MBA', 'B.Sc', 'M.Sc', 'B.Com', 'BBA', 'BCA',
+                      'Bachelor', 'Master', 'CGPA', 'GPA', 'Percentage', 'University', 'College', 'Institute']
+EXPERIENCE_KEYWORDS = ['intern', 'engineer', 'developer', 'analyst', 'manager', 'consultant',
+                       'assistant', 'associate', 'specialist', 'coordinator', 'lead', 'senior',
+                       'junior', 'trainee', 'executive']
+PROJECT_INDICATORS = ['project', 'developed', 'built', 'created', 'implemented', 'designed']
+CERTIFICATION_KEYWORDS = ['certified', 'certification', 'certificate', 'course', 'completed']
+ACHIEVEMENT_KEYWORDS = ['award', 'achievement', 'won', 'winner', 'ranked', 'scholarship', 'honor']
+
+
+def _substring_regex(keywords: List[str]):
+    # Plain substring semantics (as `keyword in line.lower()`), one scan per line
+    return re.compile('|'.join(re.escape(k.lower()) for k in keywords))
+
+
+_EDUCATION = _substring_regex(EDUCATION_KEYWORDS)
+_EXPERIENCE = _substring_regex(EXPERIENCE_KEYWORDS)
+_PROJECT = _substring_regex(PROJECT_INDICATORS)
+_CERTIFICATION = _substring_regex(CERTIFICATION_KEYWORDS)
+_ACHIEVEMENT = _substring_regex(ACHIEVEMENT_KEYWORDS)
+_YEAR = re.compile(r'20\d{2}|19\d{2}')
+
+
+class CVLine(NamedTuple):
+    text: str                # stripped
+    lower: str
+    section: Optional[str]   # None before the first header
+    is_header: bool
+
+
+def header_section(lower: str) -> Optional[str]:
+    """Section a (lowercased, stripped) line introduces, or None if it is not a header."""
+    if not lower or len(lower) > _MAX_HEADER_LENGTH:
+        return None
+    key = ' '.join(_HEADER_NOISE.sub(' ', lower.replace('&', ' and ')).split())
+    return _HEADER_SECTION.get(key)
+
+
+def segment(text: str) -> List[CVLine]:
+    lines = []
+    section = None
+    for raw in text.split('\n'):
+        stripped = raw.strip()
+        lower = stripped.lower()
+        header = header_section(lower)
+        if header is not None:
+            section = header
+        lines.append(CVLine(stripped, lower, section, header is not None))
+    return lines
+
+
+# ==================== EXTRACTORS ====================
+# Each takes (lines, i, in_section) and returns an entry or None. in_section
+# is True when the line sits under the extractor's own header. Neighbouring
+# lines are only used when they belong to the same section and are not headers.
+
+def _neighbour(lines: List[CVLine], i: int, j: int) -> Optional[CVLine]:
+    if 0 <= j < len(lines) and not lines[j].is_header and lines[j].section == lines[i].section:
+        return lines[j]
+    return None
+
+
+def _education(lines: List[CVLine], i: int, in_section: bool) -> Optional[str]:
+    line = lines[i]
+    if len(line.text) > 5 and _EDUCATION.search(line.lower):
+        nxt = _neighbour(lines, i, i + 1)
+        return f"{line.text} | {nxt.text}" if nxt and nxt.text else line.text
+    return None
+
+
+def _experience(lines: List[CVLine], i: int, in_section: bool) -> Optional[str]:
+    line = lines[i]
+    if not _EXPERIENCE.search(line.lower):
+        return None
+    prev = _neighbour(lines, i, i - 1)
+    if not (_YEAR.search(line.text) or (prev and _YEAR.search(prev.text))):
+        return None
+    desc_lines = []
+    for j in range(i + 1, i + 4):
+        nxt = _neighbour(lines, i, j)
+        if not nxt or not nxt.text or _EXPERIENCE.search(nxt.lower):
+            break
+        desc_lines.append(nxt.text)
+    return f"{line.text} | {' '.join(desc_lines)}" if desc_lines else line.text
+
+
+def _project(lines: List[CVLine], i: int, in_section: bool) -> Optional[str]:
+    line = lines[i]
+    if not _PROJECT.search(line.lower):
+        return None
+    nxt = _neighbour(lines, i, i + 1)
+    return f"{line.text} | {nxt.text}" if nxt and len(nxt.text) > 10 else line.text
+
+
+def _certification(lines: List[CVLine], i: int, in_section: bool) -> Optional[str]:
+    # Under a Certifications header every line is one; elsewhere it needs a keyword
+    line = lines[i]
+    return line.text if len(line.text) > 5 and (in_section or _CERTIFICATION.search(line.lower)) else None
+
+
+def _achievement(lines: List[CVLine], i: int, in_section: bool) -> Optional[str]:
+    line = lines[i]
+    return line.text if len(line.text) > 5 and (in_section or _ACHIEVEMENT.search(line.lower)) else None
+
+
+EXTRACTORS: Dict[str, Callable[[List[CVLine], int, bool], Optional[str]]] = {
+    EDUCATION: _education,
+    EXPERIENCE: _experience,
+    PROJECTS: _project,
+    CERTIFICATIONS: _certification,
+    ACHIEVEMENTS: _achievement,
+}
+
+
+def extract_sections(lines: List[CVLine]) -> Dict[str, List[str]]:
+    """Entries per section (in document order, duplicates kept) from a single pass over the lines."""
+    entries: Dict[str, List[str]] = {section: [] for section in EXTRACTORS}
+    for i, line in enumerate(lines):
+        if line.is_header or not line.text or line.section == SKILLS:
+            continue
+        extractor = EXTRACTORS.get(line.section)
+        if extractor is not None:
+            entry = extractor(lines, i, True)
+            if entry:
+                entries[line.section].append(entry)
+        else:
+            # Unknown or unstructured part of the CV: every rule applies
+            for section, rule in EXTRACTORS.items():
+                entry = rule(lines, i, False)
+                if entry:
+                    entries[section].append(entry)
+    return entries
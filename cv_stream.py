@@ -0,0 +1,118 @@
+"""
+Page-streaming CV parsing.
+
+Pages are pulled one at a time from pdf_backends.iter_pages and fed to an
+incremental extractor. Once every requested field has been found the
+remaining pages are never extracted, so a contact preview of a 40-page CV
+usually costs one page. Only the fields that need the whole document
+('skills', 'sections') keep reading to the end, and only 'sections' keeps
+the page text in memory.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+
+from cv_sections import extract_sections, segment
+from deloitte1 import CV_KEYWORD_MATCHER, CV_SECTION_LIMITS, detect_name, extract_contact_fields
+from pdf_backends import Source, iter_pages
+
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github', 'portfolio')
+# Fields that are final as soon as they are found
+POINT_FIELDS = CONTACT_FIELDS + ('name',)
+# Fields that can only be complete after the last page
+DOCUMENT_FIELDS = ('skills', 'sections')
+FIELD_GROUPS = {'contact': CONTACT_FIELDS}
+
+DEFAULT_FIELDS = ('name', 'email', 'phone')
+
+# The name is looked for in the first lines of the document, as in parse_cv_pdf
+_NAME_LINES = 10
+
+
+def expand_fields(fields: Iterable[str]) -> Set[str]:
+    expanded = set()
+    for field in fields:
+        expanded.update(FIELD_GROUPS.get(field, (field,)))
+    unknown = expanded - set(POINT_FIELDS) - set(DOCUMENT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown CV fields: {', '.join(sorted(unknown))}")
+    return expanded
+
+
+class IncrementalCVExtractor:
+    """Accumulates CV fields page by page; `complete` turns True once nothing more can change."""
+
+    def __init__(self, fields: Iterable[str] = DEFAULT_FIELDS):
+        self.fields = expand_fields(fields)
+        self.pages_read = 0
+        self._found: Dict[str, str] = {}
+        self._head: List = []
+        self._keywords: Dict[str, Set[str]] = {category: set() for category in CV_KEYWORD_MATCHER.vocabularies}
+        self._texts: List[str] = []
+
+    @property
+    def complete(self) -> bool:
+        if self.fields & set(DOCUMENT_FIELDS):
+            return False
+        # The name can only come from the first lines, so it is settled once they have been seen
+        name_settled = len(self._head) >= _NAME_LINES
+        return all(field in self._found or (field == 'name' and name_settled) for field in self.fields)
+
+    def feed(self, text: str):
+        self.pages_read += 1
+        if not text:
+            return
+
+        wanted_contacts = [f for f in CONTACT_FIELDS if f in self.fields and f not in self._found]
+        if wanted_contacts:
+            contacts = extract_contact_fields(text)
+            for field in wanted_contacts:
+                if field in contacts:
+                    self._found[field] = contacts[field]
+
+        if 'name' in self.fields and 'name' not in self._found and len(self._head) < _NAME_LINES:
+            self._head.extend(segment(text)[:_NAME_LINES - len(self._head)])
+            name = detect_name(self._head)
+            if name:
+                self._found['name'] = name
+
+        if 'skills' in self.fields:
+            for category, keywords in CV_KEYWORD_MATCHER.present(text).items():
+                self._keywords[category].update(keywords)
+
+        if 'sections' in self.fields:
+            self._texts.append(f"{text}\n")
+
+    def result(self) -> Dict:
+        cv_data: Dict = {field: self._found.get(field, '') for field in POINT_FIELDS if field in self.fields}
+
+        if 'skills' in self.fields:
+            vocabularies = CV_KEYWORD_MATCHER.vocabularies
+            found = self._keywords
+            cv_data['technical_skills'] = [k.title() for k in vocabularies['technical'] if k in found['technical']]
+            cv_data['soft_skills'] = [k.title() for k in vocabularies['soft'] if k in found['soft']]
+            cv_data['languages'] = [k.title() for k in vocabularies['language'] if k in found['language']]
+            cv_data['skills'] = cv_data['technical_skills'] + cv_data['soft_skills']
+
+        if 'sections' in self.fields:
+            for section, entries in extract_sections(segment(''.join(self._texts))).items():
+                cv_data[section] = list(dict.fromkeys(entries))[:CV_SECTION_LIMITS[section]]
+
+        cv_data['pages_read'] = self.pages_read
+        return cv_data
+
+
+def stream_cv(source: Source, fields: Iterable[str] = DEFAULT_FIELDS,
+              max_pages: Optional[int] = None) -> Dict:
+    """
+    Extract `fields` from a PDF (path or bytes), reading pages only until
+    they are all found or `max_pages` pages have been read.
+    """
+    extractor = IncrementalCVExtractor(fields)
+    pages = iter_pages(source, 0, max_pages)
+    try:
+        for text in pages:
+            extractor.feed(text)
+            if extractor.complete:
+                break
+    finally:
+        pages.close()
+    return extractor.result()
@@ -0,0 +1,115 @@
+import re
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+
+# Accepted birth-date formats, in the order they are tried.
+DATE_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%m-%d", "%m/%d", "%Y/%m/%d")
+
+# One compiled pattern per format: (year group or None, month group, day group)
+_FORMAT_PATTERNS: Dict[str, Pattern] = {
+    "%Y-%m-%d": re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"),
+    "%m-%d":    re.compile(r"()(\d{1,2})-(\d{1,2})"),
+    "%m/%d":    re.compile(r"()(\d{1,2})/(\d{1,2})"),
+    "%Y/%m/%d": re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"),
+}
+
+DATE_FORMAT_ERROR = "Please enter date in format YYYY-MM-DD or MM-DD."
+
+# Per-row error: (row index, raw value, message)
+RowError = Tuple[int, str, str]
+
+
+def _build(match, year: int) -> date:
+    y, m, d = match.groups()
+    return date(int(y) if y else year, int(m), int(d))
+
+
+def parse_date(d: str, today: Optional[date] = None) -> date:
+    """
+    Parse a single birth date without exception-driven format trials.
+    Year-less formats (MM-DD, MM/DD) take the year from `today`.
+    """
+    d = d.strip()
+    for fmt in DATE_FORMATS:
+        match = _FORMAT_PATTERNS[fmt].fullmatch(d)
+        if match:
+            if today is None and not match.group(1):
+                today = date.today()
+            try:
+                return _build(match, today.year if today else 0)
+            except ValueError:
+                break
+    raise ValueError(DATE_FORMAT_ERROR)
+
+
+def infer_date_format(values: Iterable[str], sample_size: int = 64) -> str:
+    """Pick the format that matches the most of the first `sample_size` non-empty values."""
+    counts = dict.fromkeys(DATE_FORMATS, 0)
+    seen = 0
+    for value in values:
+        value = value.strip()
+        if not value:
+            continue
+        for fmt in DATE_FORMATS:
+            if _FORMAT_PATTERNS[fmt].fullmatch(value):
+                counts[fmt] += 1
+                break
+        seen += 1
+        if seen >= sample_size:
+            break
+
+    best = max(DATE_FORMATS, key=lambda fmt: counts[fmt])
+    if counts[best] == 0:
+        raise ValueError(DATE_FORMAT_ERROR)
+    return best
+
+
+def parse_date_column(
+    values: Sequence[str],
+    fmt: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Tuple[List[Optional[date]], List[RowError]]:
+    """
+    Parse a whole column of birth dates.
+
+    The format is inferred once for the batch (unless given), `today` is
+    resolved once and repeated values are parsed only once. Rows that do not match the batch format fall back to
+    `parse_date`; rows that still fail become None and are reported in the
+    returned error list instead of raising.
+    """
+    if today is None:
+        today = date.today()
+    if fmt is None:
+        try:
+            fmt = infer_date_format(values)
+        except ValueError:
+            fmt = DATE_FORMATS[0]
+    if fmt not in _FORMAT_PATTERNS:
+        raise ValueError(f"Unsupported date format: {fmt}")
+
+    fullmatch = _FORMAT_PATTERNS[fmt].fullmatch
+    year = today.year
+    # Birth dates repeat heavily across a cohort, so memoize per distinct string
+    seen: Dict[str, date] = {}
+    dates: List[Optional[date]] = []
+    errors: List[RowError] = []
+    append = dates.append
+
+    for i, raw in enumerate(values):
+        parsed = seen.get(raw)
+        if parsed is not None:
+            append(parsed)
+            continue
+        value = raw.strip()
+        match = fullmatch(value)
+        try:
+            parsed = _build(match, year) if match else parse_date(value, today)
+        except ValueError as e:
+            append(None)
+            errors.append((i, raw, str(e)))
+            continue
+        seen[raw] = parsed
+        append(parsed)
+
+    return dates, errors
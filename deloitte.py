@@ -3,61 +3,16 @@ from datetime import datetime
 from typing import Dict, List, Any
 import os
 
-class NaviRitiCareerPredictor:
+from predictor_core import SRS_SCORING, PredictorCore
+
+class NaviRitiCareerPredictor(PredictorCore):
     """
     NaviRiti Career Prediction System - Phase 1 (Release 1.0)
     Complete Student-Centric Approach with All SRS Inputs
     """
     
-    def __init__(self):
-        self.career_database = self._initialize_career_database()
-        self.skill_requirements = self._initialize_skill_requirements()
-        
-    def _initialize_career_database(self) -> Dict:
-        """Initialize comprehensive career database"""
-        return {
-            'Technology': ['Software Engineer', 'Data Scientist', 'AI/ML Engineer', 'Cybersecurity Analyst', 
-                          'Full Stack Developer', 'DevOps Engineer', 'Cloud Architect', 'Game Developer'],
-            'Medical': ['Doctor (MBBS)', 'Surgeon', 'Dentist', 'Physiotherapist', 'Pharmacist', 
-                       'Nursing', 'Medical Research', 'Public Health Specialist'],
-            'Engineering': ['Mechanical Engineer', 'Civil Engineer', 'Electrical Engineer', 'Chemical Engineer',
-                           'Aerospace Engineer', 'Automotive Engineer', 'Biomedical Engineer'],
-            'Business': ['Investment Banker', 'Financial Analyst', 'Management Consultant', 'Entrepreneur',
-                        'Marketing Manager', 'Business Analyst', 'Product Manager'],
-            'Creative': ['Graphic Designer', 'UI/UX Designer', 'Fashion Designer', 'Animator', 
-                        'Content Creator', 'Photographer', 'Video Editor', 'Architect'],
-            'Arts': ['Musician', 'Dancer', 'Actor', 'Writer', 'Journalist', 'Fine Artist', 'Film Director'],
-            'Social': ['Psychologist', 'Social Worker', 'NGO Manager', 'HR Manager', 'Teacher', 
-                      'Counselor', 'Public Relations'],
-            'Law': ['Lawyer', 'Judge', 'Legal Advisor', 'Corporate Lawyer', 'Human Rights Lawyer'],
-            'Science': ['Research Scientist', 'Biotechnologist', 'Environmental Scientist', 'Astronomer',
-                       'Physicist', 'Chemist', 'Mathematician'],
-            'Sports': ['Professional Athlete', 'Sports Coach', 'Sports Manager', 'Physiotherapist',
-                      'Fitness Trainer', 'Sports Nutritionist']
-        }
-    
-    def _initialize_skill_requirements(self) -> Dict:
-        """Initialize skill requirements for different careers"""
-        return {
-            'Software Engineer': ['Programming', 'Problem Solving', 'Data Structures', 'Algorithms', 'Git'],
-            'Data Scientist': ['Python', 'Statistics', 'Machine Learning', 'SQL', 'Data Visualization'],
-            'Doctor (MBBS)': ['Biology', 'Chemistry', 'Empathy', 'Communication', 'Critical Thinking'],
-            'Financial Analyst': ['Accounting', 'Excel', 'Financial Modeling', 'Analytics', 'Communication'],
-            'Graphic Designer': ['Adobe Suite', 'Creativity', 'Visual Design', 'Typography', 'Color Theory'],
-            'Lawyer': ['Legal Knowledge', 'Communication', 'Research', 'Critical Thinking', 'Writing'],
-            'Teacher': ['Subject Knowledge', 'Communication', 'Patience', 'Creativity', 'Leadership']
-        }
-    
-    def get_student_stage(self, grade: int) -> str:
-        """Determine student's academic stage"""
-        if 6 <= grade <= 9:
-            return "Stage 1: Exploration Years"
-        elif 10 <= grade <= 12:
-            return "Stage 2: Decision Years"
-        elif grade > 12:
-            return "Stage 3: Undergraduate"
-        else:
-            return "Unknown Stage"
+    scoring = SRS_SCORING
+    report_variant = 'srs'
     
     # ==================== STAGE 1: EXPLORATION YEARS (6-9) ====================
     
@@ -274,28 +229,11 @@ class NaviRitiCareerPredictor:
             'higher_education_paths': []
         }
         
-        # Career prediction based on stream and aptitudes
+        # Career prediction based on stream and aptitudes (rules: career_rules.json 'stream_paths')
         stream = inputs['stream_choice'].upper()
-        
-        if 'PCM' in stream:
-            careers = ['Software Engineer', 'Data Scientist', 'Mechanical Engineer', 
-                      'Civil Engineer', 'Aerospace Engineer', 'Architect']
-            exams = ['JEE Main', 'JEE Advanced', 'BITSAT', 'VITEEE', 'NATA (Architecture)']
-        elif 'PCB' in stream:
-            careers = ['Doctor (MBBS)', 'Dentist (BDS)', 'Pharmacist', 'Biotechnologist',
-                      'Physiotherapist', 'Medical Research']
-            exams = ['NEET', 'AIIMS', 'JIPMER', 'State Medical Exams']
-        elif 'COMMERCE' in stream:
-            careers = ['Chartered Accountant', 'Investment Banker', 'Financial Analyst',
-                      'Business Analyst', 'Entrepreneur', 'Economist']
-            exams = ['CA Foundation', 'CS Foundation', 'CLAT', 'IPMAT', 'CUET']
-        elif 'ARTS' in stream or 'HUMANITIES' in stream:
-            careers = ['Lawyer', 'Civil Servant (IAS/IPS)', 'Journalist', 'Psychologist',
-                      'Social Worker', 'Content Creator', 'Teacher']
-            exams = ['CLAT', 'UPSC CSE', 'CUET', 'JMI Entrance', 'DU JAT']
-        else:
-            careers = ['Explore multiple paths based on interests']
-            exams = []
+        path = self.rules.evaluate('stream_paths', {'stream': stream})[0]
+        careers = path['careers']
+        exams = path['exams']
         
         # Refine based on psychometric results
         if inputs['logical_reasoning'] > 70:
@@ -483,23 +421,9 @@ class NaviRitiCareerPredictor:
             'learning_resources': []
         }
         
-        # Career mapping based on degree and skills
+        # Career mapping based on degree and skills (rules: career_rules.json 'degree_careers')
         degree = inputs['current_degree'].lower()
-        careers = []
-        
-        if 'tech' in degree or 'computer' in degree or 'it' in degree:
-            careers = ['Software Engineer', 'Data Scientist', 'Full Stack Developer', 
-                      'DevOps Engineer', 'Product Manager']
-        elif 'mech' in degree or 'civil' in degree or 'electrical' in degree:
-            careers = ['Core Engineer', 'Project Manager', 'Consultant', 'R&D Engineer']
-        elif 'commerce' in degree or 'bba' in degree or 'mba' in degree:
-            careers = ['Financial Analyst', 'Business Analyst', 'Marketing Manager', 
-                      'Consultant', 'Entrepreneur']
-        elif 'arts' in degree or 'humanities' in degree:
-            careers = ['Content Strategist', 'UX Researcher', 'Policy Analyst', 
-                      'HR Manager', 'Counselor']
-        else:
-            careers = ['Explore based on skills and interests']
+        careers = self.rules.evaluate('degree_careers', {'degree': degree})
         
         # Refine based on skills and psychometric scores
         if inputs['technical_aptitude'] > 75:
@@ -511,21 +435,8 @@ class NaviRitiCareerPredictor:
         
         output['career_mapping'] = list(dict.fromkeys(careers))[:6]
         
-        # Calculate employability score
-        score = 0
-        if inputs['cgpa'] >= 7.5:
-            score += 25
-        elif inputs['cgpa'] >= 6.5:
-            score += 15
-        
-        score += min(len(inputs['internships']) * 15, 30)
-        score += min(len(inputs['certifications']) * 5, 15)
-        score += min(len(inputs['personal_projects']) * 10, 20)
-        
-        if inputs['has_cv']:
-            score += 10
-        
-        output['employability_score'] = min(score, 100)
+        # Calculate employability score (predictor_core.SRSScoring)
+        output['employability_score'] = self.employability_score(inputs)
         
         # Skill gap analysis
         if output['career_mapping']:
@@ -620,16 +531,8 @@ class NaviRitiCareerPredictor:
             'immediate_actions': self._get_immediate_actions(inputs)
         }
         
-        # Recommend companies/sectors
-        if 'software' in degree.lower() or 'computer' in degree.lower():
-            output['recommended_companies'] = ['Tech Giants (Google, Microsoft, Amazon)', 
-                                              'Product Companies (Atlassian, Adobe)',
-                                              'Startups', 'Service Companies (TCS, Infosys, Wipro)']
-        elif 'commerce' in degree.lower() or 'finance' in degree.lower():
-            output['recommended_companies'] = ['Big 4 (Deloitte, PwC, EY, KPMG)',
-                                              'Investment Banks', 'Consulting Firms', 'FinTech']
-        else:
-            output['recommended_companies'] = ['Research target companies based on your career goals']
+        # Recommend companies/sectors (rules: career_rules.json 'recommended_companies')
+        output['recommended_companies'] = self.rules.evaluate('recommended_companies', {'degree': degree})
         
         # Learning resources
         output['learning_resources'] = {
@@ -728,210 +631,6 @@ class NaviRitiCareerPredictor:
         
         return actions
     
-    def print_stage1_report(self, output: Dict):
-        """Print Stage 1 Exploration Report"""
-        print("\n" + "="*80)
-        print("📊 EXPLORATION REPORT - STAGE 1")
-        print("="*80)
-        print(f"\nStudent: {output['student_name']}")
-        print(f"Grade: {output['grade']}")
-        print(f"Stage: {output['stage']}")
-        
-        report = output['exploration_report']
-        print("\n" + "─"*80)
-        print("🎯 IDENTIFIED INTERESTS & INCLINATIONS")
-        print("─"*80)
-        print(f"\n📚 Subject Inclinations: {', '.join(report['subject_inclinations'])}")
-        print(f"🎨 Creative Interests: {', '.join(report['creative_interests'])}")
-        print(f"🏆 Achievements: {', '.join(report['achievements']) if report['achievements'] else 'None yet - keep exploring!'}")
-        
-        print(f"\n💡 Personality Insights:")
-        print(f"   Type: {report['personality_insights']['type']}")
-        print(f"   Strengths: {', '.join(report['personality_insights']['strengths'])}")
-        
-        print("\n" + "─"*80)
-        print("🌟 SUGGESTED PATHWAYS TO EXPLORE")
-        print("─"*80)
-        for i, pathway in enumerate(output['suggested_pathways'], 1):
-            print(f"   {i}. {pathway}")
-        
-        print("\n" + "─"*80)
-        print("👀 CAREER AWARENESS (Fields to Explore - No Pressure!)")
-        print("─"*80)
-        for insight in output['awareness_insights']:
-            print(f"   • {insight}")
-        
-        print("\n" + "─"*80)
-        print("🎪 CLUBS & WORKSHOPS TO JOIN")
-        print("─"*80)
-        for club in output['clubs_workshops']:
-            print(f"   • {club}")
-        
-        print("\n" + "─"*80)
-        print("💬 GUIDANCE NOTE")
-        print("─"*80)
-        print("""
-   At this stage, the focus is on EXPLORATION, not decision-making.
-   
-   ✓ Try different activities and subjects
-   ✓ Participate in competitions and projects
-   ✓ Discover what excites and energizes you
-   ✓ Don't worry about choosing a final career yet
-   ✓ Build diverse skills and experiences
-   
-   Remember: This is YOUR journey of discovery! 🚀
-        """)
-        print("="*80)
-    
-    def print_stage2_report(self, output: Dict):
-        """Print Stage 2 Career Prediction Report"""
-        print("\n" + "="*80)
-        print("🎯 CAREER PREDICTION & ROADMAP - STAGE 2")
-        print("="*80)
-        print(f"\nStudent: {output['student_name']}")
-        print(f"Grade: {output['grade']}")
-        print(f"Stream: {output['stream']}")
-        print(f"Stage: {output['stage']}")
-        
-        print("\n" + "─"*80)
-        print("🏆 TOP RECOMMENDED CAREERS")
-        print("─"*80)
-        for i, career in enumerate(output['predicted_careers'], 1):
-            print(f"   {i}. {career}")
-        
-        print("\n" + "─"*80)
-        print("🔄 ALTERNATE/BACKUP CAREERS")
-        print("─"*80)
-        for career in output['alternate_careers']:
-            print(f"   • {career}")
-        
-        print("\n" + "─"*80)
-        print("📝 COMPETITIVE EXAMS TO TARGET")
-        print("─"*80)
-        for exam in output['competitive_exams']:
-            print(f"   • {exam}")
-        
-        print("\n" + "─"*80)
-        print("🎯 SKILLS TO DEVELOP")
-        print("─"*80)
-        for skill in output['skills_to_develop']:
-            print(f"   • {skill}")
-        
-        print("\n" + "─"*80)
-        print("💼 INTERNSHIP RECOMMENDATIONS")
-        print("─"*80)
-        for rec in output['internship_recommendations']:
-            print(f"   • {rec}")
-        
-        print("\n" + "─"*80)
-        print("🎓 HIGHER EDUCATION PATHS")
-        print("─"*80)
-        for path in output['higher_education_paths']:
-            print(f"   • {path}")
-        
-        # Print detailed roadmap
-        if output['career_roadmap']:
-            print("\n" + "="*80)
-            print(f"🗺️  DETAILED CAREER ROADMAP: {output['career_roadmap']['career']}")
-            print("="*80)
-            
-            for milestone in output['career_roadmap']['milestones']:
-                print(f"\n📍 {milestone['stage']}")
-                print(f"   Focus: {milestone['focus']}")
-                print(f"   Actions:")
-                for action in milestone['actions']:
-                    print(f"      • {action}")
-        
-        print("\n" + "="*80)
-    
-    def print_stage3_report(self, output: Dict):
-        """Print Stage 3 Career Readiness Report"""
-        print("\n" + "="*80)
-        print("🚀 CAREER MAPPING & EMPLOYABILITY REPORT - STAGE 3")
-        print("="*80)
-        print(f"\nStudent: {output['student_name']}")
-        print(f"Degree: {output['degree']}")
-        print(f"Stage: {output['stage']}")
-        
-        print("\n" + "─"*80)
-        print(f"📊 EMPLOYABILITY SCORE: {output['employability_score']}/100")
-        print("─"*80)
-        
-        readiness = output['job_readiness']
-        print(f"\n✓ Technical Readiness: {readiness['technical_readiness']}")
-        print(f"✓ Experience Level: {readiness['experience_level']}")
-        print(f"✓ Profile Strength: {readiness['profile_strength']}")
-        
-        print("\n" + "─"*80)
-        print("🎯 CAREER MAPPING (Employability Focus)")
-        print("─"*80)
-        for i, career in enumerate(output['career_mapping'], 1):
-            print(f"   {i}. {career}")
-        
-        # Skill gap analysis
-        if output['skill_gap_analysis']:
-            gap = output['skill_gap_analysis']
-            print("\n" + "─"*80)
-            print(f"📈 SKILL GAP ANALYSIS - Target: {gap['target_career']}")
-            print("─"*80)
-            
-            print(f"\n✅ Skills You Have:")
-            for skill in gap['skills_you_have']:
-                print(f"   ✓ {skill}")
-            
-            print(f"\n📚 Skills to Develop:")
-            for skill in gap['skills_to_develop']:
-                print(f"   → {skill}")
-            
-            if gap['additional_skills']:
-                print(f"\n⭐ Additional Skills (Bonus):")
-                for skill in gap['additional_skills']:
-                    print(f"   + {skill}")
-        
-        # Graduate pathways
-        pathways = output['graduate_pathways']
-        print("\n" + "─"*80)
-        print(f"🎓 GRADUATE PATHWAY: {pathways['primary']}")
-        print("─"*80)
-        print(f"\nFocus: {pathways['focus']}")
-        print(f"Timeline: {pathways['timeline']}")
-        print(f"\nAction Plan:")
-        for action in pathways['actions']:
-            print(f"   • {action}")
-        
-        # Resume enhancement
-        print("\n" + "─"*80)
-        print("📄 RESUME ENHANCEMENT SUGGESTIONS")
-        print("─"*80)
-        for suggestion in output['resume_enhancement']:
-            print(f"   {suggestion}")
-        
-        # Immediate actions
-        print("\n" + "─"*80)
-        print("🚨 IMMEDIATE ACTIONS REQUIRED")
-        print("─"*80)
-        for action in readiness['immediate_actions']:
-            print(f"   {action}")
-        
-        # Company recommendations
-        print("\n" + "─"*80)
-        print("🏢 TARGET COMPANIES/SECTORS")
-        print("─"*80)
-        for company in output['recommended_companies']:
-            print(f"   • {company}")
-        
-        # Learning resources
-        print("\n" + "─"*80)
-        print("📚 LEARNING RESOURCES")
-        print("─"*80)
-        resources = output['learning_resources']
-        print(f"\n🎓 Online Courses: {', '.join(resources['online_courses'])}")
-        print(f"💻 Practice Platforms: {', '.join(resources['practice_platforms'])}")
-        print(f"🤝 Networking: {', '.join(resources['networking'])}")
-        print(f"💼 Career Prep: {', '.join(resources['career_prep'])}")
-        
-        print("\n" + "="*80)
-    
     def save_report(self, output: Dict, filename: str = None):
         """Save report to JSON file"""
         if not filename:
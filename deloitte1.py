@@ -1,144 +1,137 @@
 import json
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
 import re
 
-# PDF Processing Libraries
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    print("⚠️  PyPDF2 not installed. Run: pip install PyPDF2")
+from cv_cache import default_cv_cache, file_key
+from cv_sections import CVLine, extract_sections, segment
+from keyword_matcher import KeywordMatcher
+from predictor_core import PredictorCore
+# PDF libraries are imported on first parse; PDF_AVAILABLE/PDFPLUMBER_AVAILABLE only probe for them
+from pdf_backends import PDF_AVAILABLE, PDFPLUMBER_AVAILABLE, available_backends
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    print("⚠️  pdfplumber not installed. Run: pip install pdfplumber")
+CV_TECHNICAL_KEYWORDS = [
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin',
+    # Web Technologies
+    'html', 'css', 'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask', 'spring', 'asp.net',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra',
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'terraform', 'ansible',
+    # Data Science & ML
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
+    'data analysis', 'data visualization', 'tableau', 'power bi', 'matplotlib', 'seaborn',
+    # Tools
+    'excel', 'powerpoint', 'jira', 'confluence', 'figma', 'adobe photoshop', 'adobe illustrator',
+    # Frameworks
+    'restful api', 'graphql', 'microservices', 'agile', 'scrum', 'ci/cd'
+]
 
-class NaviRitiCareerPredictor:
+CV_SOFT_SKILL_KEYWORDS = [
+    'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
+    'time management', 'project management', 'analytical', 'creative', 'adaptable',
+    'collaboration', 'presentation', 'negotiation', 'conflict resolution'
+]
+
+CV_LANGUAGE_KEYWORDS = ['english', 'hindi', 'spanish', 'french', 'german', 'mandarin', 'japanese']
+
+CV_KEYWORD_MATCHER = KeywordMatcher({
+    'technical': CV_TECHNICAL_KEYWORDS,
+    'soft': CV_SOFT_SKILL_KEYWORDS,
+    'language': CV_LANGUAGE_KEYWORDS,
+})
+
+# Maximum entries kept per CV section (after removing duplicates)
+CV_SECTION_LIMITS = {'education': 5, 'experience': 10, 'projects': 10, 'certifications': 10, 'achievements': 10}
+
+# Contact patterns, compiled once per process
+CV_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+CV_PHONE_PATTERN = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+CV_LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+CV_GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+CV_URL_PATTERN = re.compile(r'https?://(?:www\.)?[\w\-\.]+\.[\w]{2,}')
+
+
+def _match_at_literal(pattern, text: str, literal: str):
+    """First match of a pattern that starts with `literal`, trying only where the literal occurs."""
+    i = text.find(literal)
+    while i != -1:
+        m = pattern.match(text, i)
+        if m:
+            return m
+        i = text.find(literal, i + 1)
+    return None
+
+
+def _search_lines_with(pattern, text: str, literal: str):
+    """First match of a single-line pattern, searching only lines that contain `literal`."""
+    i = text.find(literal)
+    while i != -1:
+        start = text.rfind('\n', 0, i) + 1
+        end = text.find('\n', i)
+        end = len(text) if end == -1 else end
+        m = pattern.search(text, start, end)
+        if m:
+            return m
+        i = text.find(literal, end)
+    return None
+
+
+def extract_contact_fields(text: str) -> Dict[str, str]:
+    """First email, phone, LinkedIn, GitHub and portfolio URL in `text` (absent fields omitted)."""
+    found = {}
+    text_lower = text.lower()
+
+    m = _search_lines_with(CV_EMAIL_PATTERN, text, '@')
+    if m:
+        found['email'] = m.group()
+    m = CV_PHONE_PATTERN.search(text)
+    if m:
+        found['phone'] = m.group().strip()
+    m = _match_at_literal(CV_LINKEDIN_PATTERN, text_lower, 'linkedin.com/in/')
+    if m:
+        found['linkedin'] = m.group()
+    m = _match_at_literal(CV_GITHUB_PATTERN, text_lower, 'github.com/')
+    if m:
+        found['github'] = m.group()
+
+    i = text.find('http')
+    while i != -1:
+        m = CV_URL_PATTERN.match(text, i)
+        if m:
+            url = m.group().lower()
+            if 'linkedin' not in url and 'github' not in url:
+                found['portfolio'] = m.group()
+                break
+            i = m.end()
+        else:
+            i += 1
+        i = text.find('http', i)
+    return found
+
+
+def detect_name(lines: List[CVLine]) -> str:
+    """The first line that looks like a person's name (callers pass the first 10 lines)."""
+    for line in lines:
+        line_clean = line.text
+        if len(line_clean) > 0 and 2 <= len(line_clean.split()) <= 5 and not line.is_header:
+            if not any(char.isdigit() for char in line_clean) and '@' not in line_clean:
+                if not any(keyword in line.lower for keyword in ['resume', 'cv', 'curriculum', 'profile']):
+                    return line_clean
+    return ''
+
+
+class NaviRitiCareerPredictor(PredictorCore):
     """
     NaviRiti Career Prediction System - Enhanced Version
     Features: Grade/Degree Selection, Enhanced PDF CV Parsing with JSON Export
     """
     
-    def __init__(self):
-        self.career_database = self._initialize_career_database()
-        self.skill_requirements = self._initialize_skill_requirements()
-        self.psychometric_test_urls = self._initialize_psychometric_resources()
-        self.degree_options = self._initialize_degree_options()
-        
-    def _initialize_degree_options(self) -> List[str]:
-        """Initialize undergraduate degree options"""
-        return [
-            'B.Tech/B.E. (Computer Science)',
-            'B.Tech/B.E. (Mechanical)',
-            'B.Tech/B.E. (Electrical)',
-            'B.Tech/B.E. (Civil)',
-            'B.Tech/B.E. (Electronics)',
-            'B.Tech/B.E. (Chemical)',
-            'B.Com (Commerce)',
-            'BBA (Business Administration)',
-            'BCA (Computer Applications)',
-            'B.Sc (Science)',
-            'BA (Arts/Humanities)',
-            'MBBS (Medical)',
-            'B.Pharm (Pharmacy)',
-            'LLB (Law)',
-            'B.Des (Design)',
-            'MBA',
-            'M.Tech',
-            'M.Sc',
-            'Other'
-        ]
-    
-    def _initialize_career_database(self) -> Dict:
-        """Initialize comprehensive career database"""
-        return {
-            'Technology': ['Software Engineer', 'Data Scientist', 'AI/ML Engineer', 'Cybersecurity Analyst', 
-                          'Full Stack Developer', 'DevOps Engineer', 'Cloud Architect', 'Game Developer'],
-            'Medical': ['Doctor (MBBS)', 'Surgeon', 'Dentist', 'Physiotherapist', 'Pharmacist', 
-                       'Nursing', 'Medical Research', 'Public Health Specialist'],
-            'Engineering': ['Mechanical Engineer', 'Civil Engineer', 'Electrical Engineer', 'Chemical Engineer',
-                           'Aerospace Engineer', 'Automotive Engineer', 'Biomedical Engineer'],
-            'Business': ['Investment Banker', 'Financial Analyst', 'Management Consultant', 'Entrepreneur',
-                        'Marketing Manager', 'Business Analyst', 'Product Manager'],
-            'Creative': ['Graphic Designer', 'UI/UX Designer', 'Fashion Designer', 'Animator', 
-                        'Content Creator', 'Photographer', 'Video Editor', 'Architect'],
-            'Arts': ['Musician', 'Dancer', 'Actor', 'Writer', 'Journalist', 'Fine Artist', 'Film Director'],
-            'Social': ['Psychologist', 'Social Worker', 'NGO Manager', 'HR Manager', 'Teacher', 
-                      'Counselor', 'Public Relations'],
-            'Law': ['Lawyer', 'Judge', 'Legal Advisor', 'Corporate Lawyer', 'Human Rights Lawyer'],
-            'Science': ['Research Scientist', 'Biotechnologist', 'Environmental Scientist', 'Astronomer',
-                       'Physicist', 'Chemist', 'Mathematician'],
-            'Sports': ['Professional Athlete', 'Sports Coach', 'Sports Manager', 'Physiotherapist',
-                      'Fitness Trainer', 'Sports Nutritionist']
-        }
-    
-    def _initialize_skill_requirements(self) -> Dict:
-        """Initialize skill requirements for different careers"""
-        return {
-            'Software Engineer': ['Programming', 'Problem Solving', 'Data Structures', 'Algorithms', 'Git'],
-            'Data Scientist': ['Python', 'Statistics', 'Machine Learning', 'SQL', 'Data Visualization'],
-            'Doctor (MBBS)': ['Biology', 'Chemistry', 'Empathy', 'Communication', 'Critical Thinking'],
-            'Financial Analyst': ['Accounting', 'Excel', 'Financial Modeling', 'Analytics', 'Communication'],
-            'Graphic Designer': ['Adobe Suite', 'Creativity', 'Visual Design', 'Typography', 'Color Theory'],
-            'Lawyer': ['Legal Knowledge', 'Communication', 'Research', 'Critical Thinking', 'Writing'],
-            'Teacher': ['Subject Knowledge', 'Communication', 'Patience', 'Creativity', 'Leadership'],
-            'Mechanical Engineer': ['CAD', 'Thermodynamics', 'Mechanics', 'Problem Solving', 'AutoCAD'],
-            'Business Analyst': ['Excel', 'SQL', 'Data Analysis', 'Communication', 'Business Strategy'],
-            'Content Creator': ['Creativity', 'Video Editing', 'Social Media', 'Communication', 'Marketing']
-        }
-    
-    def _initialize_psychometric_resources(self) -> Dict:
-        """Initialize external psychometric test resources"""
-        return {
-            'stage1': {
-                'personality': [
-                    {'name': '16Personalities', 'url': 'https://www.16personalities.com/', 
-                     'description': 'Free personality test based on Myers-Briggs'},
-                    {'name': 'OpenPsychometrics', 'url': 'https://openpsychometrics.org/', 
-                     'description': 'Multiple free personality tests'},
-                    {'name': 'Truity Career Personality Test', 'url': 'https://www.truity.com/test/type-finder-personality-test-new',
-                     'description': 'Career-focused personality assessment'}
-                ],
-                'interests': [
-                    {'name': 'Career Explorer Holland Code', 'url': 'https://www.careerexplorer.com/career-test/',
-                     'description': 'Holland Code (RIASEC) interest assessment'},
-                    {'name': 'MyPlan Interest Assessment', 'url': 'https://www.myplan.com/assess/interest-assessment.php',
-                     'description': 'Interest profiler for career exploration'}
-                ]
-            },
-            'stage2': {
-                'aptitude': [
-                    {'name': 'YouScience Aptitude Test', 'url': 'https://www.youscience.com/',
-                     'description': 'Comprehensive aptitude assessment'},
-                    {'name': 'Practice Aptitude Tests', 'url': 'https://www.practiceaptitudetests.com/',
-                     'description': 'Numerical, Verbal, Logical reasoning tests'},
-                    {'name': 'AssessmentDay', 'url': 'https://www.assessmentday.co.uk/',
-                     'description': 'Aptitude tests for careers'}
-                ],
-                'career_interest': [
-                    {'name': 'O*NET Interest Profiler', 'url': 'https://www.mynextmove.org/explore/ip',
-                     'description': 'Official US career interest assessment'},
-                    {'name': 'Career One Stop', 'url': 'https://www.careeronestop.org/toolkit/careers/interest-assessment.aspx',
-                     'description': 'Government career interest profiler'}
-                ]
-            },
-            'stage3': {
-                'professional': [
-                    {'name': 'DISC Personality Test', 'url': 'https://www.123test.com/disc-personality-test/',
-                     'description': 'Workplace personality assessment'},
-                    {'name': 'CliftonStrengths', 'url': 'https://www.gallup.com/cliftonstrengths/',
-                     'description': 'Identify your top talents (paid)'},
-                    {'name': 'Skills Matcher', 'url': 'https://nationalcareers.service.gov.uk/skills-assessment',
-                     'description': 'Skills assessment for career matching'}
-                ]
-            }
-        }
+    @property
+    def cv_cache(self):
+        return default_cv_cache()
     
     # ==================== ENHANCED PDF CV PARSING ====================
     
@@ -150,40 +143,30 @@ class NaviRitiCareerPredictor:
             print(f"❌ Error: File not found at {pdf_path}")
             return {}
         
-        cv_data = {
-            'raw_text': '',
-            'name': '',
-            'email': '',
-            'phone': '',
-            'linkedin': '',
-            'github': '',
-            'portfolio': '',
-            'education': [],
-            'experience': [],
-            'skills': [],
-            'technical_skills': [],
-            'soft_skills': [],
-            'projects': [],
-            'certifications': [],
-            'achievements': [],
-            'languages': [],
-            'parsed_successfully': False,
-            'parsed_at': datetime.now().isoformat()
-        }
+        cache_key = file_key(pdf_path)
+        cached = self._load_cached_cv(pdf_path, cache_key)
+        if cached is not None:
+            print("⚡ Unchanged CV, using cached parse")
+            return cached
+        
+        cv_data = self._new_cv_data()
         
         try:
-            if PDFPLUMBER_AVAILABLE:
-                cv_data = self._parse_with_pdfplumber(pdf_path, cv_data)
-            elif PDF_AVAILABLE:
-                cv_data = self._parse_with_pypdf2(pdf_path, cv_data)
-            else:
+            if not available_backends():
                 print("❌ No PDF library available. Install PyPDF2 or pdfplumber")
                 return cv_data
+            cv_data = self._parse_with_backends(pdf_path, cv_data)
             
-            if cv_data['raw_text']:
+            if cv_data['raw_text'] and 'extraction_status' in cv_data:
+                # Partial text (timeout, truncated, memory): use it for this session only, never cache it
+                cv_data = self._extract_cv_information_enhanced(cv_data)
+                print("⚠️ CV only partly read; extracted fields may be incomplete and are not cached")
+            elif cv_data['raw_text']:
                 cv_data = self._extract_cv_information_enhanced(cv_data)
                 cv_data['parsed_successfully'] = True
                 
+                self.cv_cache.put(cache_key, cv_data)
+                
                 # Save extracted data to JSON
                 json_filename = self._save_cv_data_to_json(pdf_path, cv_data)
                 cv_data['saved_json'] = json_filename
@@ -196,11 +179,92 @@ class NaviRitiCareerPredictor:
         
         return cv_data
     
+    def parse_cv_pdfs(self, pdf_paths: List[str], max_workers: Optional[int] = None,
+                      file_timeout: float = 60.0) -> Dict[str, Dict]:
+        """Parse many CVs; text extraction runs in parallel (see cv_ingest.CVIngestionEngine)"""
+        from cv_ingest import CVIngestionEngine
+
+        results = {}
+        cache_keys = {}
+        for pdf_path in dict.fromkeys(pdf_paths):
+            if os.path.exists(pdf_path):
+                cache_keys[pdf_path] = file_key(pdf_path)
+                cached = self._load_cached_cv(pdf_path, cache_keys[pdf_path])
+                if cached is not None:
+                    results[pdf_path] = cached
+
+        with CVIngestionEngine(max_workers=max_workers, file_timeout=file_timeout) as engine:
+            extracted = engine.extract_many([p for p in pdf_paths if p not in results])
+
+        for pdf_path, extraction in extracted.items():
+            cv_data = self._new_cv_data()
+            cv_data['raw_text'] = extraction['raw_text']
+            if extraction['status'] != 'ok':
+                cv_data['error'] = extraction['error']
+            elif cv_data['raw_text']:
+                cv_data = self._extract_cv_information_enhanced(cv_data)
+                cv_data['parsed_successfully'] = True
+                self.cv_cache.put(cache_keys[pdf_path], cv_data)
+                cv_data['saved_json'] = self._save_cv_data_to_json(pdf_path, cv_data)
+            results[pdf_path] = cv_data
+        return {pdf_path: results[pdf_path] for pdf_path in dict.fromkeys(pdf_paths)}
+    
+    def preview_cv_pdf(self, pdf_path: str, fields=('name', 'email', 'phone'),
+                       max_pages: Optional[int] = None) -> Dict:
+        """Quick look at a CV: reads pages only until `fields` are found (see cv_stream), in the CV sandbox"""
+        from cv_sandbox import default_sandbox
+        from cv_stream import expand_fields
+        
+        if not os.path.exists(pdf_path):
+            print(f"❌ Error: File not found at {pdf_path}")
+            return {}
+        expand_fields(fields)  # unknown fields raise here, not in the sandbox
+        preview = default_sandbox().preview(pdf_path, fields, max_pages)
+        if preview['status'] != 'ok':
+            print(f"⚠️ CV preview {preview['status']}: {preview['error']}")
+        return preview
+    
+    def _load_cached_cv(self, pdf_path: str, cache_key: str) -> Optional[Dict]:
+        """Cached parse for unchanged PDF content; the JSON export is only rewritten if missing"""
+        cv_data = self.cv_cache.get(cache_key)
+        if cv_data is None:
+            return None
+        json_filename = self._json_filename(pdf_path)
+        if not os.path.exists(json_filename):
+            self._save_cv_data_to_json(pdf_path, cv_data)
+        cv_data['saved_json'] = json_filename
+        return cv_data
+    
+    def _new_cv_data(self) -> Dict:
+        return {
+            'raw_text': '',
+            'name': '',
+            'email': '',
+            'phone': '',
+            'linkedin': '',
+            'github': '',
+            'portfolio': '',
+            'education': [],
+            'experience': [],
+            'skills': [],
+            'technical_skills': [],
+            'soft_skills': [],
+            'projects': [],
+            'certifications': [],
+            'achievements': [],
+            'languages': [],
+            'parsed_successfully': False,
+            'parsed_at': datetime.now().isoformat()
+        }
+    
+    def _json_filename(self, pdf_path: str) -> str:
+        # PDF filename without extension
+        base_name = os.path.splitext(pdf_path)[0]
+        return f"{base_name}_extracted.json"
+    
     def _save_cv_data_to_json(self, pdf_path: str, cv_data: Dict) -> str:
         """Save extracted CV data to JSON file with same name as PDF"""
-        # Get PDF filename without extension
-        base_name = os.path.splitext(pdf_path)[0]
-        json_filename = f"{base_name}_extracted.json"
+        json_filename = self._json_filename(pdf_path)
         
         # Create a clean copy without raw_text for better readability
         clean_data = {k: v for k, v in cv_data.items() if k != 'raw_text'}
@@ -211,193 +275,52 @@ class NaviRitiCareerPredictor:
         print(f"💾 Extracted CV data saved to: {json_filename}")
         return json_filename
     
-    def _parse_with_pdfplumber(self, pdf_path: str, cv_data: Dict) -> Dict:
-        """Parse PDF using pdfplumber"""
-        import pdfplumber
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    cv_data['raw_text'] += text + "\n"
-        
-        return cv_data
-    
-    def _parse_with_pypdf2(self, pdf_path: str, cv_data: Dict) -> Dict:
-        """Parse PDF using PyPDF2"""
-        import PyPDF2
+    def _parse_with_backends(self, pdf_path: str, cv_data: Dict) -> Dict:
+        """Parse PDF with the fastest backend, in a sandboxed process within page/size/time/memory limits (see cv_sandbox)"""
+        from cv_sandbox import default_sandbox
         
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    cv_data['raw_text'] += text + "\n"
+        extraction = default_sandbox().extract(pdf_path)
+        cv_data['raw_text'] += extraction['raw_text']
+        if extraction['status'] != 'ok':
+            cv_data['extraction_status'] = extraction['status']
+            print(f"⚠️ CV extraction {extraction['status']}: {extraction['error'] or extraction['truncated_by']}")
         
         return cv_data
     
     def _extract_cv_information_enhanced(self, cv_data: Dict) -> Dict:
         """Enhanced extraction of structured information from CV text"""
         text = cv_data['raw_text']
-        lines = text.split('\n')
-        text_lower = text.lower()
-        
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            cv_data['email'] = emails[0]
-        
-        # Extract phone
-        phone_pattern = r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            cv_data['phone'] = phones[0].strip()
-        
-        # Extract LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin = re.findall(linkedin_pattern, text_lower)
-        if linkedin:
-            cv_data['linkedin'] = linkedin[0]
-        
-        # Extract GitHub
-        github_pattern = r'github\.com/[\w-]+'
-        github = re.findall(github_pattern, text_lower)
-        if github:
-            cv_data['github'] = github[0]
-        
-        # Extract portfolio/website
-        url_pattern = r'https?://(?:www\.)?[\w\-\.]+\.[\w]{2,}'
-        urls = re.findall(url_pattern, text)
-        for url in urls:
-            if 'linkedin' not in url.lower() and 'github' not in url.lower():
-                cv_data['portfolio'] = url
-                break
+        lines = segment(text)
         
-        # Extract name (improved)
-        for line in lines[:10]:
-            line_clean = line.strip()
-            if len(line_clean) > 0 and 2 <= len(line_clean.split()) <= 5:
-                if not any(char.isdigit() for char in line_clean) and '@' not in line_clean:
-                    if not any(keyword in line_clean.lower() for keyword in ['resume', 'cv', 'curriculum', 'profile']):
-                        cv_data['name'] = line_clean
-                        break
-        
-        # Enhanced Technical Skills Extraction
-        technical_keywords = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin',
-            # Web Technologies
-            'html', 'css', 'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask', 'spring', 'asp.net',
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra',
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'terraform', 'ansible',
-            # Data Science & ML
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'data analysis', 'data visualization', 'tableau', 'power bi', 'matplotlib', 'seaborn',
-            # Tools
-            'excel', 'powerpoint', 'jira', 'confluence', 'figma', 'adobe photoshop', 'adobe illustrator',
-            # Frameworks
-            'restful api', 'graphql', 'microservices', 'agile', 'scrum', 'ci/cd'
-        ]
+        # Email, phone, LinkedIn, GitHub and portfolio URL: a separate search per field
+        # (all but the phone only try positions at their literal: '@', the domain, 'http')
+        cv_data.update(extract_contact_fields(text))
         
-        for skill in technical_keywords:
-            if skill in text_lower:
-                cv_data['technical_skills'].append(skill.title())
-        
-        # Soft Skills Extraction
-        soft_skill_keywords = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
-            'time management', 'project management', 'analytical', 'creative', 'adaptable',
-            'collaboration', 'presentation', 'negotiation', 'conflict resolution'
-        ]
+        # Extract name (improved)
+        name = detect_name(lines[:10])
+        if name:
+            cv_data['name'] = name
         
-        for skill in soft_skill_keywords:
-            if skill in text_lower:
-                cv_data['soft_skills'].append(skill.title())
+        # Technical skills, soft skills and languages in one pass over the text
+        keywords = CV_KEYWORD_MATCHER.present(text)
+        cv_data['technical_skills'].extend(skill.title() for skill in keywords['technical'])
+        cv_data['soft_skills'].extend(skill.title() for skill in keywords['soft'])
+        cv_data['languages'].extend(lang.title() for lang in keywords['language'])
         
         # Combined skills list
         cv_data['skills'] = cv_data['technical_skills'] + cv_data['soft_skills']
         
-        # Enhanced Education Extraction
-        education_keywords = [
-            'B.Tech', 'B.E.', 'M.Tech', 'MBA', 'B.Sc', 'M.Sc', 'B.Com', 'BBA', 'BCA',
-            'Bachelor', 'Master', 'CGPA', 'GPA', 'Percentage', 'University', 'College', 'Institute'
-        ]
-        
-        for i, line in enumerate(lines):
-            for keyword in education_keywords:
-                if keyword.lower() in line.lower() and len(line.strip()) > 5:
-                    # Try to capture next line as well for complete info
-                    edu_entry = line.strip()
-                    if i + 1 < len(lines) and len(lines[i + 1].strip()) > 0:
-                        edu_entry += " | " + lines[i + 1].strip()
-                    cv_data['education'].append(edu_entry)
-                    break
-        
-        # Enhanced Experience Extraction
-        experience_keywords = [
-            'intern', 'engineer', 'developer', 'analyst', 'manager', 'consultant', 
-            'assistant', 'associate', 'specialist', 'coordinator', 'lead', 'senior',
-            'junior', 'trainee', 'executive'
-        ]
-        year_pattern = r'20\d{2}|19\d{2}'
-        
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in experience_keywords):
-                if re.search(year_pattern, line) or (i > 0 and re.search(year_pattern, lines[i - 1])):
-                    exp_entry = line.strip()
-                    # Capture description lines
-                    desc_lines = []
-                    for j in range(i + 1, min(i + 4, len(lines))):
-                        if lines[j].strip() and not any(kw in lines[j].lower() for kw in experience_keywords):
-                            desc_lines.append(lines[j].strip())
-                        else:
-                            break
-                    if desc_lines:
-                        exp_entry += " | " + " ".join(desc_lines)
-                    cv_data['experience'].append(exp_entry)
-        
-        # Enhanced Projects Extraction
-        project_indicators = ['project', 'developed', 'built', 'created', 'implemented', 'designed']
-        for i, line in enumerate(lines):
-            if any(indicator in line.lower() for indicator in project_indicators):
-                project_entry = line.strip()
-                # Get tech stack and description
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if next_line and len(next_line) > 10:
-                        project_entry += " | " + next_line
-                cv_data['projects'].append(project_entry)
-        
-        # Certifications Extraction
-        cert_keywords = ['certified', 'certification', 'certificate', 'course', 'completed']
-        for line in lines:
-            if any(keyword in line.lower() for keyword in cert_keywords) and len(line.strip()) > 5:
-                cv_data['certifications'].append(line.strip())
-        
-        # Achievements Extraction
-        achievement_keywords = ['award', 'achievement', 'won', 'winner', 'ranked', 'scholarship', 'honor']
-        for line in lines:
-            if any(keyword in line.lower() for keyword in achievement_keywords) and len(line.strip()) > 5:
-                cv_data['achievements'].append(line.strip())
-        
-        # Languages Extraction
-        language_keywords = ['english', 'hindi', 'spanish', 'french', 'german', 'mandarin', 'japanese']
-        for lang in language_keywords:
-            if lang in text_lower:
-                cv_data['languages'].append(lang.title())
+        # Education, experience, projects, certifications and achievements in one pass,
+        # each line only feeding the extractor for the section it sits in
+        for section, entries in extract_sections(lines).items():
+            cv_data[section].extend(entries)
         
         # Remove duplicates and limit entries
         cv_data['technical_skills'] = list(dict.fromkeys(cv_data['technical_skills']))
         cv_data['soft_skills'] = list(dict.fromkeys(cv_data['soft_skills']))
         cv_data['skills'] = list(dict.fromkeys(cv_data['skills']))
-        cv_data['education'] = list(dict.fromkeys(cv_data['education']))[:5]
-        cv_data['experience'] = list(dict.fromkeys(cv_data['experience']))[:10]
-        cv_data['projects'] = list(dict.fromkeys(cv_data['projects']))[:10]
-        cv_data['certifications'] = list(dict.fromkeys(cv_data['certifications']))[:10]
-        cv_data['achievements'] = list(dict.fromkeys(cv_data['achievements']))[:10]
+        for section, limit in CV_SECTION_LIMITS.items():
+            cv_data[section] = list(dict.fromkeys(cv_data[section]))[:limit]
         cv_data['languages'] = list(dict.fromkeys(cv_data['languages']))
         
         return cv_data
@@ -457,15 +380,6 @@ class NaviRitiCareerPredictor:
             else:
                 print("❌ Invalid choice! Please enter 1 or 2.")
     
-    def get_student_stage(self, grade: int) -> str:
-        """Determine student's academic stage"""
-        if 6 <= grade <= 9:
-            return "Stage 1: Exploration Years"
-        elif 10 <= grade <= 12:
-            return "Stage 2: Decision Years"
-        else:
-            return "Unknown Stage "
-    
     # ==================== PSYCHOMETRIC TEST INTEGRATION ====================
     
     def display_psychometric_resources(self, stage: str):
@@ -657,17 +571,6 @@ class NaviRitiCareerPredictor:
         }
         return mapping.get(mbti_type, 'Unique Individual')
     
-    def get_student_stage(self, grade: int) -> str:
-        """Determine student's academic stage"""
-        if 6 <= grade <= 9:
-            return "Stage 1: Exploration Years"
-        elif 10 <= grade <= 12:
-            return "Stage 2: Decision Years"
-        elif grade > 12:
-            return "Stage 3: Undergraduate"
-        else:
-            return "Unknown Stage"
-    
     # ==================== STAGE 1: EXPLORATION YEARS ====================
     
     def collect_stage1_inputs(self) -> Dict:
@@ -872,43 +775,8 @@ class NaviRitiCareerPredictor:
             return "Needs Improvement"
     
     def _predict_careers_stage2(self, inputs: Dict, psychometric: Dict) -> List[Dict]:
-        """Predict careers for Stage 2"""
-        careers = []
-        stream = inputs['stream'].lower()
-        
-        if 'science' in stream:
-            if 'pcm' in stream or 'math' in stream:
-                careers.extend([
-                    {'career': 'Software Engineer', 'match': 90, 'domain': 'Technology'},
-                    {'career': 'Data Scientist', 'match': 85, 'domain': 'Technology'},
-                    {'career': 'Mechanical Engineer', 'match': 80, 'domain': 'Engineering'}
-                ])
-            if 'pcb' in stream or 'bio' in stream:
-                careers.extend([
-                    {'career': 'Doctor (MBBS)', 'match': 95, 'domain': 'Medical'},
-                    {'career': 'Biotechnologist', 'match': 85, 'domain': 'Science'},
-                    {'career': 'Pharmacist', 'match': 80, 'domain': 'Medical'}
-                ])
-        
-        elif 'commerce' in stream:
-            careers.extend([
-                {'career': 'Chartered Accountant', 'match': 90, 'domain': 'Business'},
-                {'career': 'Financial Analyst', 'match': 85, 'domain': 'Business'},
-                {'career': 'Investment Banker', 'match': 80, 'domain': 'Business'}
-            ])
-        
-        elif 'arts' in stream or 'humanities' in stream:
-            careers.extend([
-                {'career': 'Lawyer', 'match': 88, 'domain': 'Law'},
-                {'career': 'Psychologist', 'match': 85, 'domain': 'Social'},
-                {'career': 'Journalist', 'match': 82, 'domain': 'Arts'}
-            ])
-        
-        if psychometric.get('logical_reasoning', 0) > 80:
-            careers.append({'career': 'Software Engineer', 'match': 92, 'domain': 'Technology'})
-        
-        if psychometric.get('numerical_ability', 0) > 80:
-            careers.append({'career': 'Data Scientist', 'match': 90, 'domain': 'Technology'})
+        """Predict careers for Stage 2 (rules: career_rules.json 'stage2_careers')"""
+        careers = self.rules.evaluate('stage2_careers', {'stream': inputs['stream'], 'psychometric': psychometric})
         
         unique_careers = {c['career']: c for c in careers}
         return sorted(unique_careers.values(), key=lambda x: x['match'], reverse=True)[:8]
@@ -1037,8 +905,8 @@ class NaviRitiCareerPredictor:
         
         return inputs
     
-    def generate_stage3_output(self, name: str, inputs: Dict) -> Dict:
-        """Generate Stage 3 outputs"""
+    def generate_stage3_output(self, name: str, inputs: Dict, similar: Optional[List[Dict]] = None) -> Dict:
+        """Generate Stage 3 outputs; `similar` is this student's entry from stage3_similar_careers() when batching"""
         output = {
             'stage': 'Stage 3: Undergraduate',
             'student_name': name,
@@ -1047,6 +915,8 @@ class NaviRitiCareerPredictor:
             'career_predictions': [],
             'job_role_mapping': [],
             'skill_gap_analysis': {},
+            'skill_matched_careers': [],
+            'similar_careers': [],
             'industry_recommendations': [],
             'preparation_roadmap': {}
         }
@@ -1054,119 +924,38 @@ class NaviRitiCareerPredictor:
         cv_data = inputs.get('cv_data', {})
         psychometric = inputs.get('psychometric_results', {})
         
-        output['employability_score'] = self._calculate_employability_score(inputs, cv_data, psychometric)
+        output['employability_score'] = self.employability_score(inputs, cv_data, psychometric)
         output['career_predictions'] = self._predict_careers_stage3(inputs, cv_data, psychometric)
         output['job_role_mapping'] = self._map_job_roles(inputs, cv_data)
         output['skill_gap_analysis'] = self._analyze_skill_gaps(inputs, output['career_predictions'])
+        output['skill_matched_careers'] = self._match_careers_by_skills(inputs, cv_data)
+        if similar is None:
+            similar = self.similar_careers(self._profile_text(inputs, cv_data))
+        output['similar_careers'] = similar
         output['industry_recommendations'] = self._recommend_industries(inputs, psychometric)
         output['preparation_roadmap'] = self._create_preparation_roadmap(inputs, output)
         
         return output
     
-    def _calculate_employability_score(self, inputs: Dict, cv_data: Dict, psychometric: Dict) -> int:
-        """Calculate employability score"""
-        score = 0
-        
-        cgpa = inputs.get('cgpa', 0)
-        if cgpa >= 9.0:
-            score += 25
-        elif cgpa >= 8.0:
-            score += 20
-        elif cgpa >= 7.0:
-            score += 15
-        elif cgpa >= 6.0:
-            score += 10
-        
-        skills_count = len(inputs.get('technical_skills', []))
-        score += min(skills_count * 3, 25)
-        
-        exp_count = len(inputs.get('experience', []))
-        score += min(exp_count * 10, 20)
-        
-        project_count = len(inputs.get('projects', []))
-        score += min(project_count * 5, 15)
-        
-        cert_count = len(inputs.get('certifications', []))
-        score += min(cert_count * 3, 10)
-        
-        if psychometric:
-            avg_psychometric = sum([
-                psychometric.get('technical_aptitude', 0),
-                psychometric.get('communication', 0),
-                psychometric.get('analytical_skills', 0)
-            ]) / 3
-            if avg_psychometric > 80:
-                score += 5
-        
-        return min(score, 100)
+    def calculate_employability_scores(self, cohort):
+        """Employability scores for a whole cohort of columns at once (see cohort_scoring.score_cohort)"""
+        from cohort_scoring import score_cohort
+        return score_cohort(cohort)
     
     def _predict_careers_stage3(self, inputs: Dict, cv_data: Dict, psychometric: Dict) -> List[Dict]:
-        """Predict careers for Stage 3"""
-        careers = []
-        degree = inputs['current_degree'].lower()
-        skills = inputs.get('technical_skills', [])
-        
-        if 'computer' in degree or 'cse' in degree or 'it' in degree:
-            careers.extend([
-                {'career': 'Software Engineer', 'match': 95, 'salary_range': '₹6-15 LPA'},
-                {'career': 'Data Scientist', 'match': 90, 'salary_range': '₹8-20 LPA'},
-                {'career': 'Full Stack Developer', 'match': 88, 'salary_range': '₹5-12 LPA'},
-                {'career': 'AI/ML Engineer', 'match': 85, 'salary_range': '₹10-25 LPA'}
-            ])
-        
-        elif 'mechanical' in degree or 'civil' in degree:
-            careers.extend([
-                {'career': 'Mechanical Engineer', 'match': 90, 'salary_range': '₹4-10 LPA'},
-                {'career': 'Design Engineer', 'match': 85, 'salary_range': '₹5-12 LPA'}
-            ])
-        
-        elif 'commerce' in degree or 'bcom' in degree:
-            careers.extend([
-                {'career': 'Financial Analyst', 'match': 88, 'salary_range': '₹4-10 LPA'},
-                {'career': 'Accountant', 'match': 85, 'salary_range': '₹3-8 LPA'}
-            ])
-        
-        elif 'mba' in degree:
-            careers.extend([
-                {'career': 'Product Manager', 'match': 92, 'salary_range': '₹10-25 LPA'},
-                {'career': 'Management Consultant', 'match': 90, 'salary_range': '₹12-30 LPA'}
-            ])
-        
-        skill_str = ' '.join(skills).lower()
-        if 'python' in skill_str or 'java' in skill_str:
-            careers.append({'career': 'Backend Developer', 'match': 90, 'salary_range': '₹6-14 LPA'})
-        
-        if 'react' in skill_str or 'angular' in skill_str:
-            careers.append({'career': 'Frontend Developer', 'match': 88, 'salary_range': '₹5-12 LPA'})
-        
-        if psychometric.get('leadership_score', 0) > 80:
-            careers.append({'career': 'Team Lead', 'match': 85, 'salary_range': '₹12-25 LPA'})
+        """Predict careers for Stage 3 (rules: career_rules.json 'stage3_careers')"""
+        careers = self.rules.evaluate('stage3_careers', {
+            'degree': inputs['current_degree'],
+            'skills': inputs.get('technical_skills', []),
+            'psychometric': psychometric,
+        })
         
         unique_careers = {c['career']: c for c in careers}
         return sorted(unique_careers.values(), key=lambda x: x['match'], reverse=True)[:10]
     
     def _map_job_roles(self, inputs: Dict, cv_data: Dict) -> List[Dict]:
-        """Map job roles"""
-        job_roles = []
-        skills = inputs.get('technical_skills', [])
-        skill_str = ' '.join(skills).lower()
-        
-        if any(skill in skill_str for skill in ['python', 'java', 'javascript']):
-            job_roles.append({
-                'role': 'Software Development Engineer',
-                'companies': ['Google', 'Microsoft', 'Amazon', 'Adobe'],
-                'required_skills': ['DSA', 'OOP', 'System Design'],
-                'readiness': 'High' if len(skills) >= 5 else 'Medium'
-            })
-        
-        if 'data' in skill_str or 'sql' in skill_str:
-            job_roles.append({
-                'role': 'Data Analyst',
-                'companies': ['Deloitte', 'EY', 'McKinsey'],
-                'required_skills': ['SQL', 'Excel', 'Tableau', 'Python'],
-                'readiness': 'Medium'
-            })
-        
+        """Map job roles (rules: career_rules.json 'job_roles')"""
+        job_roles = self.rules.evaluate('job_roles', {'skills': inputs.get('technical_skills', [])})
         return job_roles[:8]
     
     def _analyze_skill_gaps(self, inputs: Dict, career_predictions: List[Dict]) -> Dict:
@@ -1189,6 +978,46 @@ class NaviRitiCareerPredictor:
         
         return gaps
     
+    def _match_careers_by_skills(self, inputs: Dict, cv_data: Dict, top_k: int = 5) -> List[Dict]:
+        """Best-covered careers across the whole catalog (see skill_index)"""
+        skills = inputs.get('technical_skills', []) + cv_data.get('soft_skills', [])
+        return [
+            {
+                'career': match.career,
+                'domain': match.domain,
+                'coverage': int(match.coverage * 100),
+                'matched_skills': match.matched_skills,
+                'missing_skills': match.missing_skills,
+            }
+            for match in self.skill_index.top_careers(skills, k=top_k)
+        ]
+    
+    def _profile_text(self, inputs: Dict, cv_data: Dict) -> str:
+        """Free text describing the student: degree, skills and the CV itself"""
+        parts = [inputs.get('current_degree', ''), ' '.join(inputs.get('technical_skills', []))]
+        if cv_data.get('raw_text'):
+            parts.append(cv_data['raw_text'])
+        else:
+            parts.extend(cv_data.get('skills', []) + cv_data.get('projects', []) + cv_data.get('experience', []))
+        return '\n'.join(parts)
+    
+    def similar_careers(self, text: str, top_k: int = 5) -> List[Dict]:
+        """Careers whose catalog description reads most like `text` (TF-IDF cosine, see career_similarity)"""
+        return self.similar_careers_many([text], top_k)[0]
+    
+    def similar_careers_many(self, texts: List[str], top_k: int = 5) -> List[List[Dict]]:
+        """similar_careers() for a batch of CV texts"""
+        domains = self.skill_index.domains
+        return [
+            [{'career': m.career, 'domain': domains.get(m.career), 'similarity': int(m.score * 100)} for m in matches]
+            for matches in self.career_tfidf.top_many(texts, k=top_k)
+        ]
+    
+    def stage3_similar_careers(self, inputs_list: List[Dict], top_k: int = 5) -> List[List[Dict]]:
+        """similar_careers() of many students' Stage 3 inputs, scored in one similar_careers_many() pass"""
+        return self.similar_careers_many(
+            [self._profile_text(inputs, inputs.get('cv_data', {})) for inputs in inputs_list], top_k)
+    
     def _get_learning_resources(self, skills: List[str]) -> List[str]:
         """Get learning resources"""
         resources = []
@@ -1206,21 +1035,8 @@ class NaviRitiCareerPredictor:
         return resources
     
     def _recommend_industries(self, inputs: Dict, psychometric: Dict) -> List[Dict]:
-        """Recommend industries"""
-        industries = []
-        degree = inputs['current_degree'].lower()
-        
-        if 'computer' in degree or 'tech' in degree:
-            industries.extend([
-                {'industry': 'IT Services', 'growth': 'High', 'avg_salary': '₹6-12 LPA'},
-                {'industry': 'Product Companies', 'growth': 'Very High', 'avg_salary': '₹10-25 LPA'}
-            ])
-        
-        if 'mechanical' in degree:
-            industries.extend([
-                {'industry': 'Manufacturing', 'growth': 'Medium', 'avg_salary': '₹4-10 LPA'}
-            ])
-        
+        """Recommend industries (rules: career_rules.json 'industries')"""
+        industries = self.rules.evaluate('industries', {'degree': inputs['current_degree']})
         return industries[:8]
     
     def _create_preparation_roadmap(self, inputs: Dict, output: Dict) -> Dict:
@@ -1254,100 +1070,6 @@ class NaviRitiCareerPredictor:
     
     # ==================== REPORT GENERATION ====================
     
-    def print_stage1_report(self, output: Dict):
-        """Print Stage 1 report"""
-        print("\n" + "="*80)
-        print("📊 NAVIRITI CAREER EXPLORATION REPORT - STAGE 1")
-        print("="*80)
-        print(f"Student: {output['student_name']}")
-        print(f"Grade: {output['grade']}")
-        print("="*80)
-        
-        report = output['exploration_report']
-        print("\n📚 SUBJECT INCLINATIONS:")
-        for subject in report['subject_inclinations']:
-            print(f"   • {subject}")
-        
-        print("\n🎨 CREATIVE INTERESTS:")
-        for interest in report['creative_interests']:
-            print(f"   • {interest}")
-        
-        print("\n👤 PERSONALITY INSIGHTS:")
-        print(f"   Type: {report['personality_insights']['type']}")
-        print("   Strengths:", ", ".join(report['personality_insights']['strengths']))
-        
-        print("\n🛤️  SUGGESTED PATHWAYS:")
-        for pathway in output['suggested_pathways']:
-            print(f"   • {pathway}")
-        
-        print("\n" + "="*80)
-    
-    def print_stage2_report(self, output: Dict):
-        """Print Stage 2 report"""
-        print("\n" + "="*80)
-        print("📊 NAVIRITI CAREER PREDICTION REPORT - STAGE 2")
-        print("="*80)
-        print(f"Student: {output['student_name']}")
-        print(f"Grade: {output['grade']}")
-        print(f"Stream: {output['stream']}")
-        print("="*80)
-        
-        print("\n📚 ACADEMIC PROFILE:")
-        prof = output['academic_profile']
-        print(f"   Class 10: {prof['class10_percentage']}%")
-        print(f"   Current: {prof['current_percentage']}%")
-        print(f"   Rating: {prof['academic_rating']}")
-        
-        print("\n🎯 CAREER RECOMMENDATIONS:")
-        for career in output['career_recommendations'][:5]:
-            print(f"   • {career['career']} - Match: {career['match']}% ({career['domain']})")
-        
-        print("\n📖 EXAM GUIDANCE:")
-        for exam, guide in output['exam_guidance'].items():
-            print(f"\n   {exam}:")
-            print(f"      Time: {guide['preparation_time']}")
-            print(f"      Subjects: {', '.join(guide['key_subjects'])}")
-        
-        print("\n" + "="*80)
-    
-    def print_stage3_report(self, output: Dict):
-        """Print Stage 3 report"""
-        print("\n" + "="*80)
-        print("📊 NAVIRITI CAREER PREDICTION REPORT - STAGE 3")
-        print("="*80)
-        print(f"Student: {output['student_name']}")
-        print(f"Degree: {output['degree']}")
-        print(f"Employability Score: {output['employability_score']}/100")
-        print("="*80)
-        
-        print("\n🎯 TOP CAREER PREDICTIONS:")
-        for career in output['career_predictions'][:5]:
-            print(f"   • {career['career']} - Match: {career['match']}%")
-            print(f"     Salary: {career['salary_range']}")
-        
-        print("\n💼 JOB ROLE MAPPING:")
-        for job in output['job_role_mapping'][:3]:
-            print(f"\n   {job['role']}:")
-            print(f"      Companies: {', '.join(job['companies'][:3])}")
-            print(f"      Readiness: {job['readiness']}")
-        
-        print("\n📊 SKILL GAP ANALYSIS:")
-        for career, gap in list(output['skill_gap_analysis'].items())[:2]:
-            print(f"\n   {career}:")
-            print(f"      Completion: {gap['completion_percentage']}%")
-            print(f"      Missing: {', '.join(gap['missing_skills'][:3])}")
-        
-        print("\n🗺️ PREPARATION ROADMAP:")
-        print("\n   Immediate Actions:")
-        for action in output['preparation_roadmap']['immediate_actions']:
-            print(f"      • {action}")
-        
-        print("\n   Short-term Goals (3-6 months):")
-        for goal in output['preparation_roadmap']['short_term_goals']:
-            print(f"      • {goal}")
-        
-        print("\n" + "="*80)
-    
     def save_report(self, output: Dict, filename: str = None):
         """Save report to JSON"""
         if filename is None:
@@ -0,0 +1,145 @@
+"""
+Precomputed zodiac × planet job intersections (12 × 9 entries), cached on
+disk. Importing only reads the cache: when it is missing or its source
+fingerprint is stale, the table is built in memory. Writing the cache is an
+explicit build step:
+
+    python intersection_table.py --build     # write .intersection_table.json
+    python intersection_table.py             # check it against a fresh build
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from planet import PLANET_MAPPING
+from zodiac import ZODIAC_PROFILE, ZODIAC_SIGNS
+
+# Bump when job_index matching logic changes in a way the fingerprint cannot see
+TABLE_VERSION = 1
+
+CACHE_PATH = os.environ.get(
+    "NAVIRITI_INTERSECTION_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".intersection_table.json"),
+)
+
+PLANET_NUMBERS: Tuple[int, ...] = tuple(sorted(PLANET_MAPPING))
+
+IntersectionTable = Tuple[Tuple[Tuple[str, ...], ...], ...]
+
+
+def source_fingerprint() -> str:
+    from job_index import SPELLING_VARIANTS, TITLE_SYNONYMS
+
+    payload = json.dumps({
+        "version": TABLE_VERSION,
+        "signs": list(ZODIAC_SIGNS),
+        "zodiac": {sign: ZODIAC_PROFILE[sign]["jobs"] for sign in ZODIAC_SIGNS},
+        "planet": {str(n): PLANET_MAPPING[n]["jobs"] for n in PLANET_NUMBERS},
+        "spelling": SPELLING_VARIANTS,
+        "synonyms": TITLE_SYNONYMS,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_intersection_table() -> IntersectionTable:
+    """table[sign_index][planet_number - 1] → matching job titles (zodiac spelling)."""
+    from job_index import get_job_index
+
+    index = get_job_index()
+    return tuple(
+        tuple(
+            tuple(index.intersect_titles(ZODIAC_PROFILE[sign]["jobs"], PLANET_MAPPING[n]["jobs"]))
+            for n in PLANET_NUMBERS
+        )
+        for sign in ZODIAC_SIGNS
+    )
+
+
+def _read_cache_file(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _as_table(rows) -> IntersectionTable:
+    return tuple(tuple(tuple(jobs) for jobs in row) for row in rows)
+
+
+def _read_cache(path: str, fingerprint: str) -> Optional[IntersectionTable]:
+    cached = _read_cache_file(path)
+    if cached is None or cached.get("fingerprint") != fingerprint:
+        return None
+    return _as_table(cached["table"])
+
+
+def write_intersection_table(path: str = CACHE_PATH) -> IntersectionTable:
+    """Build the table and write it to `path`; raises OSError if it cannot be written."""
+    table = build_intersection_table()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": source_fingerprint(), "table": table}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return table
+
+
+def load_intersection_table(path: str = CACHE_PATH) -> IntersectionTable:
+    """The cached table if it matches the source data, else a fresh in-memory build (nothing is written)."""
+    table = _read_cache(path, source_fingerprint())
+    if table is None:
+        table = build_intersection_table()
+    return table
+
+
+INTERSECTION_TABLE: IntersectionTable = load_intersection_table()
+
+
+def lookup(sign_index: int, planet_number: int) -> Tuple[str, ...]:
+    return INTERSECTION_TABLE[sign_index][planet_number - 1]
+
+
+def verify_intersection_table(path: str = CACHE_PATH) -> List[str]:
+    """Compare the table cached at `path` against a fresh build; returns human-readable mismatches."""
+    cached = _read_cache_file(path)
+    if cached is None:
+        return [f"no readable cached table at {path} (run: python intersection_table.py --build)"]
+    problems = []
+    if cached.get("fingerprint") != source_fingerprint():
+        problems.append("cached fingerprint does not match the source data (imports fall back to an in-memory build)")
+    try:
+        table = _as_table(cached["table"])
+    except (KeyError, TypeError):
+        return problems + ["cached file has no table"]
+    if len(table) != len(ZODIAC_SIGNS) or any(len(row) != len(PLANET_NUMBERS) for row in table):
+        return problems + [f"table shape does not match {len(ZODIAC_SIGNS)} signs × {len(PLANET_NUMBERS)} planets"]
+    fresh = build_intersection_table()
+    for i, sign in enumerate(ZODIAC_SIGNS):
+        for j, number in enumerate(PLANET_NUMBERS):
+            if table[i][j] != fresh[i][j]:
+                problems.append(f"{sign} × {number}: cached {list(table[i][j])}, expected {list(fresh[i][j])}")
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or check the cached zodiac × planet intersection table")
+    parser.add_argument("--build", action="store_true", help="Write the cache, then check it")
+    parser.add_argument("--path", default=CACHE_PATH, help="Cache file (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.build:
+        write_intersection_table(args.path)
+        print(f"Wrote {args.path}")
+    problems = verify_intersection_table(args.path)
+    for problem in problems:
+        print(problem)
+    print("Intersection table is out of sync" if problems else "Intersection table OK")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,193 @@
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from planet import PLANET_MAPPING
+from zodiac import ZODIAC_PROFILE
+
+try:
+    from star import NAKSHATRA_OCCUPATIONS
+except ImportError:
+    # star.py needs swisseph/geopy/timezonefinder; the index works without it
+    NAKSHATRA_OCCUPATIONS = {}
+
+
+# British → American spellings, applied per token
+SPELLING_VARIANTS: Dict[str, str] = {
+    "counsellor": "counselor",
+    "counselling": "counseling",
+    "jewellery": "jewelry",
+    "organisation": "organization",
+    "programme": "program",
+    "defence": "defense",
+    "labour": "labor",
+}
+
+# Whole-title synonyms, keyed on the normalized (pre-stemming) title
+TITLE_SYNONYMS: Dict[str, str] = {
+    "software developer": "software engineer",
+    "software development engineer": "software engineer",
+    "military officer": "military",
+    "startup founder": "entrepreneur",
+    "professional athlete": "athlete",
+    "doctor mbbs": "doctor",
+    "ai ml engineer": "ai engineer",
+    "counseling": "counselor",
+    "teaching": "teacher",
+    "psychology": "psychologist",
+    "surgery": "surgeon",
+    "journalism": "journalist",
+    "research": "researcher",
+}
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def _stem(token: str) -> str:
+    """Light suffix stripping so plural/-ing/-e variants share a key."""
+    if len(token) > 4 and token.endswith("ies"):
+        token = token[:-3] + "y"
+    elif len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = token[:-1]
+    if len(token) > 5 and token.endswith("ing"):
+        token = token[:-3]
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def normalize(title: str) -> str:
+    """Lowercase, drop punctuation, collapse whitespace and fix spelling variants."""
+    tokens = _NON_WORD.sub(" ", title.lower()).split()
+    return " ".join(SPELLING_VARIANTS.get(t, t) for t in tokens)
+
+
+def canonical_key(title: str) -> str:
+    normalized = normalize(title)
+    normalized = TITLE_SYNONYMS.get(normalized, normalized)
+    return " ".join(_stem(t) for t in normalized.split())
+
+
+class JobIndex:
+    """
+    Job-title vocabulary with canonical IDs.
+    Every title is interned to an integer ID; a list of titles becomes a
+    bitset (a Python int with one bit per ID), so intersecting profiles is a
+    bitwise AND.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._titles: List[str] = []
+        self.sources: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def intern(self, title: str) -> int:
+        """Canonical ID for a title, adding it to the vocabulary if unseen."""
+        key = canonical_key(title)
+        job_id = self._ids.get(key)
+        if job_id is None:
+            with self._lock:
+                job_id = self._ids.get(key)
+                if job_id is None:
+                    job_id = self._ids[key] = len(self._titles)
+                    self._titles.append(title)
+        return job_id
+
+    def lookup(self, title: str) -> Optional[int]:
+        """Canonical ID for a title, or None if unseen; never grows the vocabulary."""
+        return self._ids.get(canonical_key(title))
+
+    def title(self, job_id: int) -> str:
+        """Display title (first spelling seen) for a canonical ID."""
+        return self._titles[job_id]
+
+    def bitset(self, titles: Iterable[str]) -> int:
+        bits = 0
+        for title in titles:
+            bits |= 1 << self.intern(title)
+        return bits
+
+    def add_source(self, name: str, titles: Iterable[str]) -> int:
+        bits = self.sources[name] = self.bitset(titles)
+        return bits
+
+    def ids(self, bits: int) -> List[int]:
+        """Canonical IDs set in a bitset, in ascending order."""
+        ids = []
+        while bits:
+            low = bits & -bits
+            ids.append(low.bit_length() - 1)
+            bits ^= low
+        return ids
+
+    def titles(self, bits: int) -> List[str]:
+        return [self._titles[i] for i in self.ids(bits)]
+
+    def intersect_titles(self, jobs1: Sequence[str], jobs2: Sequence[str]) -> List[str]:
+        """
+        Titles of jobs1 (in their order) whose canonical ID also appears in jobs2.
+        Read-only: titles the index hasn't seen are matched on their canonical
+        key instead of being interned, so queries never grow the shared index.
+        """
+        other = 0
+        unseen: Set[str] = set()
+        for job in jobs2:
+            job_id = self.lookup(job)
+            if job_id is None:
+                unseen.add(canonical_key(job))
+            else:
+                other |= 1 << job_id
+        result = []
+        for job in jobs1:
+            job_id = self.lookup(job)
+            if job_id is None:
+                key = canonical_key(job)
+                if key in unseen:
+                    result.append(job)
+                    unseen.discard(key)
+                continue
+            bit = 1 << job_id
+            if other & bit:
+                result.append(job)
+                other &= ~bit
+        return result
+
+    def rank(self, bitsets: Sequence[int], min_count: int = 2) -> List[Tuple[str, int]]:
+        """
+        Rank jobs by how many of the given profile bitsets contain them.
+        Ties are broken by canonical ID, so results are deterministic.
+        """
+        counts: Dict[int, int] = {}
+        for bits in bitsets:
+            for job_id in self.ids(bits):
+                counts[job_id] = counts.get(job_id, 0) + 1
+        ranked = sorted(
+            (job_id for job_id, count in counts.items() if count >= min_count),
+            key=lambda job_id: (-counts[job_id], job_id),
+        )
+        return [(self._titles[job_id], counts[job_id]) for job_id in ranked]
+
+
+def _career_database() -> Mapping[str, Sequence[str]]:
+    from career_catalog import CAREER_DATABASE
+    return CAREER_DATABASE
+
+
+@lru_cache(maxsize=None)
+def get_job_index() -> JobIndex:
+    """Shared index over every job list the profile modules know about."""
+    index = JobIndex()
+    for sign, profile in ZODIAC_PROFILE.items():
+        index.add_source(f"zodiac:{sign}", profile["jobs"])
+    for number, data in PLANET_MAPPING.items():
+        index.add_source(f"planet:{number}", data["jobs"])
+    for nakshatra, occupations in NAKSHATRA_OCCUPATIONS.items():
+        index.add_source(f"nakshatra:{nakshatra}", occupations)
+    for domain, careers in _career_database().items():
+        index.add_source(f"career:{domain}", careers)
+    return index
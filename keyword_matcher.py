@@ -0,0 +1,72 @@
+"""
+Single-pass multi-keyword matching.
+
+All keywords are compiled into one alternation (longest first) with token
+boundaries, so a text is scanned once however large the vocabulary, and
+'java' does not match inside 'javascript' nor 'sql' inside 'mysql'.
+"""
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Sequence
+
+# A keyword may not be glued to letters/digits on either side; trailing + or #
+# would make it a different token ('c' vs 'c++', 'f' vs 'f#')
+_BEFORE = r"(?<![a-z0-9_])"
+_AFTER = r"(?![a-z0-9_+#])"
+_SPACES = re.compile(r"\s+")
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+def _pattern(keyword: str) -> str:
+    # Multi-word keywords also match across line breaks and repeated spaces
+    return r"\s+".join(re.escape(word) for word in keyword.split())
+
+
+class KeywordMatcher:
+    """
+    Matches keywords from one or more named categories, case-insensitively,
+    in a single left-to-right scan. Overlapping candidates resolve to the
+    longest keyword.
+    """
+
+    def __init__(self, vocabularies: Mapping[str, Sequence[str]]):
+        self.vocabularies: Dict[str, List[str]] = {}
+        self._category: Dict[str, str] = {}
+        for category, keywords in vocabularies.items():
+            self.vocabularies[category] = []
+            for keyword in keywords:
+                key = _SPACES.sub(" ", keyword.strip().lower())
+                if key and key not in self._category:
+                    self._category[key] = category
+                    self.vocabularies[category].append(key)
+
+        alternation = "|".join(_pattern(k) for k in sorted(self._category, key=len, reverse=True))
+        # Positions must refer to the caller's text, so finditer matches case-insensitively
+        self._regex = re.compile(f"{_BEFORE}(?:{alternation}){_AFTER}", re.IGNORECASE)
+        # present() only needs the keywords: scanning lowercased text with a
+        # first-character lookahead is about three times faster
+        first_chars = re.escape("".join(sorted({k[0] for k in self._category})))
+        self._lower_regex = re.compile(f"(?=[{first_chars}]){_BEFORE}(?:{alternation}){_AFTER}")
+
+    def finditer(self, text: str) -> Iterable[KeywordMatch]:
+        category = self._category
+        for m in self._regex.finditer(text):
+            keyword = _SPACES.sub(" ", m.group().lower())
+            yield KeywordMatch(keyword, category[keyword], m.start(), m.end())
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every match with its position, in text order."""
+        return list(self.finditer(text))
+
+    def present(self, text: str) -> Dict[str, List[str]]:
+        """Keywords found in `text`, per category, in vocabulary order."""
+        found = {_SPACES.sub(" ", m) for m in set(self._lower_regex.findall(text.lower()))}
+        return {
+            category: [k for k in keywords if k in found]
+            for category, keywords in self.vocabularies.items()
+        }
@@ -1,30 +1,34 @@
 # main.py
-from planet import get_time_profile
-from zodiac import get_zodiac_profile
+import argparse
+import csv
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, TextIO, Union
 
-
-def normalize(j: str) -> str:
-    return " ".join(j.lower().strip().split())
+from intersection_table import lookup
+from job_index import get_job_index
+from planet import TIME_PROFILES, time_to_number
+from zodiac import ZODIAC_PROFILES, get_zodiac_index
 
 
 def intersect_jobs(jobs1, jobs2):
-    n1 = {normalize(j): j for j in jobs1}
-    n2 = {normalize(j): j for j in jobs2}
-    common = set(n1.keys()) & set(n2.keys())
-    return [n1[c] for c in common]
+    """Jobs from jobs1 that match jobs2 after spelling, synonym and stem normalization."""
+    return get_job_index().intersect_titles(jobs1, jobs2)
 
 
 def main():
     date_input = input("Enter birth date (YYYY-MM-DD or MM-DD): ").strip()
     time_input = input("Enter birth time (HH:MM): ").strip()
 
-    zodiac_profile = get_zodiac_profile(date_input)
-    planet_profile = get_time_profile(time_input)
+    sign_index = get_zodiac_index(date_input)
+    planet_index = time_to_number(time_input)
+    zodiac_profile = ZODIAC_PROFILES[sign_index]
+    planet_profile = TIME_PROFILES[planet_index]
 
     zodiac_jobs = zodiac_profile["jobs"]
     planet_jobs = planet_profile["jobs"]
 
-    intersection = intersect_jobs(zodiac_jobs, planet_jobs)
+    intersection = lookup(sign_index, planet_index)
 
     print("\n--- RESULTS ---")
     print(f"Zodiac Sign: {zodiac_profile['sign']}")
@@ -38,8 +42,136 @@ def main():
         for job in intersection:
             print(" •", job)
     else:
-        print("No exact job matches found.")
+        print("No matching jobs found.")
+
+
+# ==================== BATCH MODE ====================
+
+DATE_FIELDS = ("date", "birth_date")
+TIME_FIELDS = ("time", "birth_time")
+
+
+def _field(record: Dict[str, Any], names) -> str:
+    for name in names:
+        value = record.get(name)
+        if value:
+            return str(value)
+    raise ValueError(f"Missing field: {names[0]}")
+
+
+class InvalidRecord(NamedTuple):
+    """An input line that isn't a record; profile_record reports it inline."""
+    line: int
+    error: str
+
+
+Record = Union[Dict[str, Any], InvalidRecord]
+
+
+def read_records(stream: TextIO, fmt: str = "csv") -> Iterator[Record]:
+    """
+    Stream records from CSV (with a header row) or JSONL, one at a time.
+    A JSONL line that isn't a JSON object yields an InvalidRecord instead of
+    stopping the batch.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield InvalidRecord(number, f"Invalid JSON: {e}")
+                continue
+            if isinstance(record, dict):
+                yield record
+            else:
+                yield InvalidRecord(number, f"Expected a JSON object, got {type(record).__name__}")
+    else:
+        raise ValueError(f"Unsupported input format: {fmt}")
+
+
+def profile_record(record: Record) -> Dict[str, Any]:
+    """Zodiac + planet profile and job intersection for one record; errors are reported inline."""
+    if isinstance(record, InvalidRecord):
+        return {"line": record.line, "error": record.error}
+    if not isinstance(record, dict):
+        return {"error": f"Expected a record object, got {type(record).__name__}"}
+    result: Dict[str, Any] = {"id": record.get("id")} if "id" in record else {}
+    try:
+        sign_index = get_zodiac_index(_field(record, DATE_FIELDS))
+        planet_index = time_to_number(_field(record, TIME_FIELDS))
+    except ValueError as e:
+        result["error"] = str(e)
+        return result
+
+    zodiac_profile = ZODIAC_PROFILES[sign_index]
+    planet_profile = TIME_PROFILES[planet_index]
+
+    result.update({
+        "sign": zodiac_profile["sign"],
+        "planet": planet_profile["planet"],
+        "index": planet_profile["index"],
+        "zodiac_jobs": zodiac_profile["jobs"],
+        "planet_jobs": planet_profile["jobs"],
+        "intersection": lookup(sign_index, planet_index),
+    })
+    return result
+
+
+def profile_records(records: Iterable[Record]) -> Iterator[Dict[str, Any]]:
+    for record in records:
+        yield profile_record(record)
+
+
+def write_ndjson(results: Iterable[Dict[str, Any]], out: TextIO) -> int:
+    count = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def run_batch(stream: TextIO, out: TextIO, fmt: str = "csv") -> int:
+    """Generator pipeline: read → profile → NDJSON; memory use does not grow with input size."""
+    return write_ndjson(profile_records(read_records(stream, fmt)), out)
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Zodiac + planet career profiles")
+    parser.add_argument("input", nargs="?",
+                        help="CSV/JSONL file with date,time columns ('-' for stdin); "
+                             "omit for interactive mode")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=("csv", "jsonl"),
+                        help="Input format (default: from file extension)")
+    args = parser.parse_args(argv)
+
+    if args.input is None:
+        main()
+        return
+
+    fmt = _detect_format(args.input, args.format)
+    stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        count = run_batch(stream, out, fmt)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"Profiled {count} records", file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
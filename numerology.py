@@ -0,0 +1,134 @@
+import string
+from datetime import date
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from date_parser import parse_date
+from planet import MINUTE_TO_INDEX, TIME_PROFILES, reduce_to_single_digit, time_to_number
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Pythagorean: A-I → 1-9, J-R → 1-9, S-Z → 1-8
+PYTHAGOREAN: Dict[str, int] = {
+    letter: i % 9 + 1 for i, letter in enumerate(string.ascii_uppercase)
+}
+
+# Chaldean: based on letter sounds, no letter maps to 9
+CHALDEAN: Dict[str, int] = {
+    letter: value
+    for value, letters in (
+        (1, "AIJQY"), (2, "BKR"), (3, "CGLS"), (4, "DMT"),
+        (5, "EHNX"), (6, "UVW"), (7, "OZ"), (8, "FP"),
+    )
+    for letter in letters
+}
+
+LETTER_TABLES: Dict[str, Dict[str, int]] = {
+    "pythagorean": PYTHAGOREAN,
+    "chaldean": CHALDEAN,
+}
+
+
+def digital_root(n: int) -> int:
+    """Digital root 1–9 in closed form: 1 + (n - 1) % 9."""
+    return reduce_to_single_digit(n)
+
+
+def date_number(birth_date: Union[str, date]) -> int:
+    """
+    Birth date → index number (1–9).
+    Example: "1995-08-14" → 1+9+9+5+0+8+1+4 = 37 → 3+7 = 10 → 1
+    """
+    d = parse_date(birth_date) if isinstance(birth_date, str) else birth_date
+    # 10000 and 100 are both 1 (mod 9), so the digit sum of YYYYMMDD
+    # reduces the same way as year + month + day
+    return digital_root(d.year + d.month + d.day)
+
+
+def time_number(time_str: str) -> int:
+    """Birth time (HH:MM) → index number (1–9)."""
+    return time_to_number(time_str)
+
+
+def name_number(name: str, system: str = "pythagorean") -> int:
+    """
+    Name → index number (1–9) using a Pythagorean or Chaldean letter table.
+    Non-letters are ignored.
+    """
+    try:
+        table = LETTER_TABLES[system.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown numerology system: {system}") from None
+    get = table.get
+    return digital_root(sum(get(c, 0) for c in name.upper()))
+
+
+def get_number_profile(number: int) -> Mapping[str, Any]:
+    """Shared read-only PLANET_MAPPING profile for an index number."""
+    return TIME_PROFILES[number]
+
+
+def get_numerology_profile(
+    birth_date: Optional[Union[str, date]] = None,
+    birth_time: Optional[str] = None,
+    name: Optional[str] = None,
+    system: str = "pythagorean",
+) -> Dict[str, Mapping[str, Any]]:
+    """Profile for whichever of birth date, birth time and name are given."""
+    profile = {}
+    if birth_date is not None:
+        profile["date"] = get_number_profile(date_number(birth_date))
+    if birth_time is not None:
+        profile["time"] = get_number_profile(time_number(birth_time))
+    if name is not None:
+        profile["name"] = get_number_profile(name_number(name, system))
+    return profile
+
+
+# ==================== VECTORIZED (NumPy) ====================
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for vectorized numerology. Run: pip install numpy")
+
+
+def digital_root_array(values):
+    """Element-wise digital root of an integer array."""
+    _require_numpy()
+    v = np.asarray(values, dtype=np.int64)
+    return np.where(v > 0, 1 + (v - 1) % 9, 1).astype(np.int8)
+
+
+def date_number_array(years, months, days):
+    """Element-wise date_number for year/month/day columns."""
+    _require_numpy()
+    return digital_root_array(
+        np.asarray(years, dtype=np.int64)
+        + np.asarray(months, dtype=np.int64)
+        + np.asarray(days, dtype=np.int64)
+    )
+
+
+def time_number_array(hours, minutes):
+    """Element-wise time_number for hour/minute columns."""
+    _require_numpy()
+    # HH:MM reduces like hours + minutes, since 100 is 1 (mod 9)
+    return digital_root_array(
+        np.asarray(hours, dtype=np.int64) + np.asarray(minutes, dtype=np.int64)
+    )
+
+
+def minute_number_array(minutes):
+    """Element-wise time_number for minute-of-day values (0–1439) via the lookup table."""
+    _require_numpy()
+    return np.frombuffer(MINUTE_TO_INDEX, dtype=np.uint8)[np.asarray(minutes, dtype=np.intp)]
+
+
+def name_number_array(names: Iterable[str], system: str = "pythagorean"):
+    """name_number over a column of names."""
+    _require_numpy()
+    return np.fromiter((name_number(n, system) for n in names), dtype=np.int8)
@@ -0,0 +1,402 @@
+"""
+Pluggable PDF text-extraction backends.
+
+Backends are tried cheapest first. Pages whose text looks poor (too short,
+or too many unmapped/garbled glyphs) are re-extracted with the next, more
+expensive backend, so layout-aware extraction only runs where it is needed.
+A backend that raises on a document (a malformed PDF it can't parse) hands
+the document to the next one; extraction fails only when every backend does.
+
+PDF libraries are heavy (pdfplumber pulls in pdfminer), so availability is
+probed with find_spec and a library is only imported on first use.
+"""
+import importlib
+import importlib.util
+import io
+import re
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import lru_cache
+from types import ModuleType
+from typing import BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Pages with fewer characters than this (after stripping) are re-extracted
+MIN_CHARS_PER_PAGE = 50
+# Share of characters that are control/replacement/private-use glyphs or "(cid:N)" tokens
+MAX_GARBLED_RATIO = 0.05
+# Text extracted without word spacing shows up as very long "words"
+MAX_MEAN_WORD_LENGTH = 20
+
+_GARBLED = re.compile(r"\(cid:\d+\)|[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\ufffd\ue000-\uf8ff]")
+
+# A PDF is passed as a path, as its bytes (e.g. a member of a zip archive) or
+# as a seekable binary stream such as an mmap, which is read in place
+Source = Union[str, bytes, BinaryIO]
+Pages = Optional[Union[range, Sequence[int]]]
+Extractor = Callable[[Source, Pages], Iterable[str]]
+
+
+@lru_cache(maxsize=None)
+def is_installed(module_name: str) -> bool:
+    """Whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+_modules: Dict[str, ModuleType] = {}
+
+
+def load_module(module_name: str) -> ModuleType:
+    """Import a module on first use and keep it for later calls."""
+    module = _modules.get(module_name)
+    if module is None:
+        module = _modules[module_name] = importlib.import_module(module_name)
+    return module
+
+
+PDF_AVAILABLE = is_installed("PyPDF2")
+PDFPLUMBER_AVAILABLE = is_installed("pdfplumber")
+
+
+class Backend:
+    def __init__(self, name: str, extract: Extractor, cost: int, layout_aware: bool,
+                 requires: Tuple[str, ...]):
+        self.name = name
+        self.extract = extract
+        self.cost = cost
+        self.layout_aware = layout_aware
+        self.requires = requires
+
+    @property
+    def available(self) -> bool:
+        return all(is_installed(module) for module in self.requires)
+
+    def __repr__(self):
+        return f"Backend({self.name!r}, cost={self.cost})"
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def register_backend(name: str, cost: int, layout_aware: bool = False, requires: Tuple[str, ...] = ()):
+    """
+    Register `extract(source, pages)`, yielding the text of each page. `cost` orders
+    backends (cheapest is tried first); `pages` is None for the whole document.
+    The backend is only offered when every module in `requires` is installed;
+    the extractor should import them with load_module.
+    """
+    def decorator(fn: Extractor) -> Extractor:
+        BACKENDS[name] = Backend(name, fn, cost, layout_aware, requires)
+        return fn
+    return decorator
+
+
+def available_backends() -> List[Backend]:
+    return sorted((b for b in BACKENDS.values() if b.available), key=lambda b: b.cost)
+
+
+def _stream(source: Source):
+    """A path for the backend to open itself, or a binary stream positioned at the start."""
+    if isinstance(source, str):
+        return source
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def _open(source: Source):
+    stream = _stream(source)
+    # Streams we were handed belong to the caller and stay open
+    return open(stream, 'rb') if isinstance(stream, str) else nullcontext(stream)
+
+
+def _select(pages: Pages, count: int) -> Sequence[int]:
+    if pages is None:
+        return range(count)
+    if isinstance(pages, range):
+        return range(max(0, pages.start), min(pages.stop, count))
+    # Lazily, so a _PageFeed can supply page numbers while the document stays open
+    return (i for i in pages if 0 <= i < count)
+
+
+@register_backend("pypdf2", cost=1, requires=("PyPDF2",))
+def _extract_pypdf2(source: Source, pages: Pages = None) -> Iterator[str]:
+    PyPDF2 = load_module("PyPDF2")
+    with _open(source) as file:
+        reader = PyPDF2.PdfReader(file)
+        for i in _select(pages, len(reader.pages)):
+            yield reader.pages[i].extract_text() or ''
+
+
+@register_backend("pdfplumber", cost=5, layout_aware=True, requires=("pdfplumber",))
+def _extract_pdfplumber(source: Source, pages: Pages = None) -> Iterator[str]:
+    pdfplumber = load_module("pdfplumber")
+    with pdfplumber.open(_stream(source)) as pdf:
+        for i in _select(pages, len(pdf.pages)):
+            page = pdf.pages[i]
+            text = page.extract_text() or ''
+            page.close()
+            yield text
+
+
+def _count_pypdf2(source: Source) -> int:
+    with _open(source) as file:
+        return len(load_module("PyPDF2").PdfReader(file).pages)
+
+
+def _count_pdfplumber(source: Source) -> int:
+    with load_module("pdfplumber").open(_stream(source)) as pdf:
+        return len(pdf.pages)
+
+
+def count_pages(source: Source) -> int:
+    """
+    Number of pages (PyPDF2 first: it only reads the page tree). If it
+    can't parse the document, pdfplumber is tried before giving up.
+    """
+    counters = [(name, count) for name, count, available in (
+        ("pypdf2", _count_pypdf2, PDF_AVAILABLE),
+        ("pdfplumber", _count_pdfplumber, PDFPLUMBER_AVAILABLE),
+    ) if available]
+    if not counters:
+        raise RuntimeError("No PDF library available. Install PyPDF2 or pdfplumber")
+    errors = []
+    for name, count in counters:
+        try:
+            return count(source)
+        except Exception as e:
+            errors.append((name, e))
+    _raise_all_failed(errors)
+
+
+# ==================== QUALITY ====================
+
+def garbled_ratio(text: str) -> float:
+    if not text:
+        return 0.0
+    return sum(len(m) for m in _GARBLED.findall(text)) / len(text)
+
+
+def is_poor_page(text: str) -> bool:
+    stripped = text.strip()
+    if len(stripped) < MIN_CHARS_PER_PAGE:
+        return True
+    words = stripped.split()
+    if len(stripped) / len(words) > MAX_MEAN_WORD_LENGTH:
+        return True
+    return garbled_ratio(stripped) > MAX_GARBLED_RATIO
+
+
+def quality_score(text: str) -> float:
+    """Usable characters on a page; used to pick between two extractions."""
+    stripped = text.strip()
+    return len(stripped) * (1.0 - garbled_ratio(stripped))
+
+
+# ==================== EXTRACTION ====================
+
+def _record(name: str, pages: int, seconds: float, fallback: bool):
+    with _stats_lock:
+        stats = _stats.setdefault(name, {'calls': 0, 'pages': 0, 'seconds': 0.0, 'fallback_pages': 0})
+        stats['calls'] += 1
+        stats['pages'] += pages
+        stats['seconds'] += seconds
+        if fallback:
+            stats['fallback_pages'] += pages
+
+
+def _run(backend: Backend, source: Source, pages: Pages, fallback: bool) -> List[str]:
+    start = time.perf_counter()
+    texts = list(backend.extract(source, pages))
+    _record(backend.name, len(texts), time.perf_counter() - start, fallback)
+    return texts
+
+
+def _run_first(backends: Sequence[Backend], source: Source, pages: Pages) -> Tuple[int, List[str]]:
+    """(position, texts) from the first backend that reads the document without raising."""
+    errors = []
+    for position, backend in enumerate(backends):
+        try:
+            return position, _run(backend, source, pages, position > 0)
+        except Exception as e:
+            errors.append((backend.name, e))
+    _raise_all_failed(errors)
+
+
+def _raise_all_failed(errors: Sequence[Tuple[str, Exception]]):
+    if len(errors) == 1:
+        raise errors[0][1]
+    raise RuntimeError("No PDF backend could read the document: "
+                       + "; ".join(f"{name}: {e}" for name, e in errors)) from errors[-1][1]
+
+
+def extract_pages(source: Source, start: int = 0, stop: Optional[int] = None,
+                  backends: Optional[Sequence[Backend]] = None) -> List[str]:
+    """
+    Text of pages [start, stop) of a PDF (path or bytes), one string per
+    page. The cheapest backend that can open the document reads every page
+    (one that raises, e.g. on a malformed PDF, hands over to the next); poor
+    pages are retried with each heavier backend in turn and the better of
+    the two extractions is kept. Raises only if every backend fails.
+    """
+    backends = list(backends) if backends is not None else available_backends()
+    if not backends:
+        raise RuntimeError("No PDF library available. Install PyPDF2 or pdfplumber")
+
+    position, texts = _run_first(backends, source, range(start, stop if stop is not None else 1 << 31))
+    poor = [i for i, text in enumerate(texts) if is_poor_page(text)]
+
+    for backend in backends[position + 1:]:
+        if not poor:
+            break
+        try:
+            retried = _run(backend, source, [start + i for i in poor], True)
+        except Exception:
+            continue
+        still_poor = []
+        for i, text in zip(poor, retried):
+            if quality_score(text) > quality_score(texts[i]):
+                texts[i] = text
+            if is_poor_page(texts[i]):
+                still_poor.append(i)
+        poor = still_poor
+
+    return texts
+
+
+class _PageFeed:
+    """Page numbers handed to a backend's extract() one at a time, as they are asked for."""
+
+    def __init__(self):
+        self._pages: Deque[int] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> int:
+        if not self._pages:
+            raise StopIteration
+        return self._pages.popleft()
+
+    def push(self, page: int):
+        self._pages.append(page)
+
+
+class _Retrier:
+    """
+    Re-extracts single pages with one backend for the length of a stream.
+    The document is opened on the first retry and kept open, so a scanned
+    CV with every page poor costs one open, not one per page.
+    """
+
+    def __init__(self, backend: Backend, source: Source):
+        self.backend = backend
+        self.source = source
+        self._feed = _PageFeed()
+        self._pages: Optional[Iterator[str]] = None
+        self._failed = False
+        self.count, self.seconds = 0, 0.0
+
+    def extract(self, page: int) -> Optional[str]:
+        """Text of `page`, or None if this backend can't read it."""
+        if self._failed:
+            return None
+        began = time.perf_counter()
+        try:
+            if self._pages is None:
+                self._pages = iter(self.backend.extract(self.source, self._feed))
+            self._feed.push(page)
+            text = next(self._pages, None)
+        except Exception:
+            self._failed = True
+            return None
+        finally:
+            self.seconds += time.perf_counter() - began
+        if text is None:
+            # Page out of this backend's range: the extractor has finished, reopen on the next retry
+            self._pages = None
+            return None
+        self.count += 1
+        return text
+
+    def close(self):
+        if self._pages is not None and hasattr(self._pages, 'close'):
+            self._pages.close()
+        self._pages = None
+        if self.count:
+            _record(self.backend.name, self.count, self.seconds, True)
+
+
+def iter_pages(source: Source, start: int = 0, stop: Optional[int] = None,
+               backends: Optional[Sequence[Backend]] = None) -> Iterator[str]:
+    """
+    Like extract_pages, but yields each page as soon as it is extracted, so
+    callers can stop early and only one page is held at a time. Poor pages
+    are retried one by one with the heavier backends, each keeping its copy
+    of the document open for the whole stream. If the reading backend
+    raises, the next one carries on from the page it failed on.
+    """
+    backends = list(backends) if backends is not None else available_backends()
+    if not backends:
+        raise RuntimeError("No PDF library available. Install PyPDF2 or pdfplumber")
+
+    stop = stop if stop is not None else 1 << 31
+    count = 0
+    errors = []
+    retriers = [_Retrier(backend, source) for backend in backends]
+    try:
+        for position, reader in enumerate(backends):
+            pages = iter(reader.extract(source, range(start + count, stop)))
+            read, seconds = 0, 0.0
+            try:
+                while True:
+                    began = time.perf_counter()
+                    try:
+                        text = next(pages, None)
+                    except Exception as e:
+                        errors.append((reader.name, e))
+                        break
+                    finally:
+                        seconds += time.perf_counter() - began
+                    if text is None:
+                        return
+                    if is_poor_page(text):
+                        for retrier in retriers[position + 1:]:
+                            retried = retrier.extract(start + count)
+                            if retried is not None and quality_score(retried) > quality_score(text):
+                                text = retried
+                            if not is_poor_page(text):
+                                break
+                    count += 1
+                    read += 1
+                    yield text
+            finally:
+                if hasattr(pages, 'close'):
+                    pages.close()
+                _record(reader.name, read, seconds, position > 0)
+        _raise_all_failed(errors)
+    finally:
+        for retrier in retriers:
+            retrier.close()
+
+
+def backend_stats() -> Dict[str, Dict[str, float]]:
+    """Per-backend totals for this process, plus mean milliseconds per page."""
+    with _stats_lock:
+        report = {name: dict(stats) for name, stats in _stats.items()}
+    for stats in report.values():
+        stats['ms_per_page'] = round(1000 * stats['seconds'] / stats['pages'], 3) if stats['pages'] else 0.0
+    return report
+
+
+def reset_backend_stats():
+    with _stats_lock:
+        _stats.clear()
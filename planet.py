@@ -1,3 +1,7 @@
+import re
+from array import array
+from types import MappingProxyType
+
 PLANET_MAPPING = {
     1: {
         "planet": "Sun",
@@ -48,10 +52,42 @@ PLANET_MAPPING = {
 
 
 def reduce_to_single_digit(n):
-    """Reduce any number to a single digit 1–9."""
-    while n > 9:
-        n = sum(int(d) for d in str(n))
-    return 1 if n == 0 else n
+    """Reduce any number to a single digit 1–9 (closed-form digital root)."""
+    return 1 + (n - 1) % 9 if n > 0 else 1
+
+
+def _digit_sum_number(time_str):
+    return reduce_to_single_digit(sum(int(c) for c in time_str if c.isdigit()))
+
+
+_TIME_PATTERN = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def parse_time(time_str):
+    """Parse "HH:MM" → minute of day (0–1439)."""
+    match = _TIME_PATTERN.fullmatch(time_str.strip())
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if hour < 24 and minute < 60:
+            return hour * 60 + minute
+    raise ValueError("Please enter time in format HH:MM.")
+
+
+# MINUTE_TO_INDEX[minute of day] → index number (1–9), one entry per HH:MM
+MINUTE_TO_INDEX = array("B", (
+    _digit_sum_number(f"{m // 60:02d}:{m % 60:02d}") for m in range(1440)
+))
+
+# One shared read-only profile per index number
+TIME_PROFILES = {
+    number: MappingProxyType({
+        "index": number,
+        "planet": data["planet"],
+        "qualities": tuple(data["qualities"]),
+        "jobs": tuple(data["jobs"])
+    })
+    for number, data in PLANET_MAPPING.items()
+}
 
 
 def time_to_number(time_str):
@@ -59,26 +95,41 @@ def time_to_number(time_str):
     Convert time (HH:MM) → index number (1–9).
     Example: "14:27" → 1+4+2+7 = 14 → 1+4 = 5
     """
-    digits = [int(c) for c in time_str if c.isdigit()]
-    total = sum(digits)
-    return reduce_to_single_digit(total)
+    try:
+        return MINUTE_TO_INDEX[parse_time(time_str)]
+    except ValueError:
+        # Not a valid HH:MM: keep the lenient digit-sum behaviour
+        return _digit_sum_number(time_str)
 
 
 def get_time_profile(time_str):
     """
     Main function:
     Input = "HH:MM"
-    Output = index, planet, qualities, and jobs
+    Output = index, planet, qualities, and jobs (shared, read-only)
     """
-    number = time_to_number(time_str)
-    data = PLANET_MAPPING[number]
+    return TIME_PROFILES[time_to_number(time_str)]
 
-    return {
-        "index": number,
-        "planet": data["planet"],
-        "qualities": data["qualities"],
-        "jobs": data["jobs"]
-    }
+
+def get_time_indices(times):
+    """
+    Batch variant of time_to_number for a column of "HH:MM" strings, with
+    the same lenient digit-sum fallback for strings that are not valid
+    HH:MM. Returns one index per row (0 for rows that are not strings) and
+    the per-row errors for those rows as (row, value, message).
+    """
+    indices = array("B", bytes(len(times)))
+    errors = []
+    table = MINUTE_TO_INDEX
+    for i, value in enumerate(times):
+        if not isinstance(value, str):
+            errors.append((i, value, f"Expected a time string, got {type(value).__name__}"))
+            continue
+        try:
+            indices[i] = table[parse_time(value)]
+        except ValueError:
+            indices[i] = _digit_sum_number(value)
+    return indices, errors
 
 
 if __name__ == "__main__":
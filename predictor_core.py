@@ -0,0 +1,180 @@
+"""
+Core shared by both NaviRitiCareerPredictor front ends: deloitte.py (the
+SRS release) and deloitte1.py (the enhanced release with CV parsing).
+
+PredictorCore exposes the frozen catalogs from career_catalog as class
+attributes. The derived structures are process-wide singletons: compiled
+rules, the skill index and the TF-IDF index. Constructing a predictor
+therefore copies and builds nothing. The two releases score employability
+differently, and each rule set is an EmployabilityScoring strategy. A
+front end picks one by default, and a caller can pass another, by name or
+instance. Each front end also names its report layouts in
+report_templates, through report_variant.
+
+Rules, indexes and report templates are imported by the accessor that
+first needs them, so importing a front end costs only the catalogs.
+"""
+import sys
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+from career_catalog import (CAREER_DATABASE, CAREER_DOMAINS, DEGREE_OPTIONS, PSYCHOMETRIC_TEST_URLS,
+                            SKILL_REQUIREMENTS, student_stage)
+
+if TYPE_CHECKING:
+    from career_similarity import TfidfIndex
+    from rule_engine import RuleEngine
+    from skill_index import SkillIndex
+
+
+class EmployabilityScoring(ABC):
+    """Stage-3 employability score (0-100) from a student's inputs."""
+
+    name = ''
+
+    @abstractmethod
+    def score(self, inputs: Dict, cv_data: Optional[Dict] = None, psychometric: Optional[Dict] = None) -> int:
+        """The score for one student."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class SRSScoring(EmployabilityScoring):
+    """
+    deloitte.py rules: CGPA (out of 10), internships, certifications,
+    personal projects and having a CV.
+    """
+
+    name = 'srs'
+
+    def score(self, inputs: Dict, cv_data: Optional[Dict] = None, psychometric: Optional[Dict] = None) -> int:
+        score = 0
+        if inputs['cgpa'] >= 7.5:
+            score += 25
+        elif inputs['cgpa'] >= 6.5:
+            score += 15
+
+        score += min(len(inputs['internships']) * 15, 30)
+        score += min(len(inputs['certifications']) * 5, 15)
+        score += min(len(inputs['personal_projects']) * 10, 20)
+
+        if inputs['has_cv']:
+            score += 10
+
+        return min(score, 100)
+
+
+class EnhancedScoring(EmployabilityScoring):
+    """
+    deloitte1.py rules: CGPA bands, technical skills, experience, projects,
+    certifications, plus a bonus for strong psychometric results.
+    cohort_scoring.score_cohort is the columnar form of these rules.
+    """
+
+    name = 'enhanced'
+
+    def score(self, inputs: Dict, cv_data: Optional[Dict] = None, psychometric: Optional[Dict] = None) -> int:
+        score = 0
+
+        cgpa = inputs.get('cgpa', 0)
+        if cgpa >= 9.0:
+            score += 25
+        elif cgpa >= 8.0:
+            score += 20
+        elif cgpa >= 7.0:
+            score += 15
+        elif cgpa >= 6.0:
+            score += 10
+
+        skills_count = len(inputs.get('technical_skills', []))
+        score += min(skills_count * 3, 25)
+
+        exp_count = len(inputs.get('experience', []))
+        score += min(exp_count * 10, 20)
+
+        project_count = len(inputs.get('projects', []))
+        score += min(project_count * 5, 15)
+
+        cert_count = len(inputs.get('certifications', []))
+        score += min(cert_count * 3, 10)
+
+        if psychometric:
+            avg_psychometric = sum([
+                psychometric.get('technical_aptitude', 0),
+                psychometric.get('communication', 0),
+                psychometric.get('analytical_skills', 0)
+            ]) / 3
+            if avg_psychometric > 80:
+                score += 5
+
+        return min(score, 100)
+
+
+SRS_SCORING = SRSScoring()
+ENHANCED_SCORING = EnhancedScoring()
+SCORING_STRATEGIES: Dict[str, EmployabilityScoring] = {s.name: s for s in (SRS_SCORING, ENHANCED_SCORING)}
+
+
+@lru_cache(maxsize=None)
+def shared_skill_index() -> "SkillIndex":
+    from skill_index import SkillIndex
+    return SkillIndex(SKILL_REQUIREMENTS, CAREER_DOMAINS)
+
+
+@lru_cache(maxsize=None)
+def shared_tfidf_index() -> "TfidfIndex":
+    """Built (or read from disk) on first use."""
+    from career_similarity import career_documents, load_tfidf_index
+    return load_tfidf_index(career_documents(CAREER_DATABASE, SKILL_REQUIREMENTS))
+
+
+class PredictorCore:
+    career_database = CAREER_DATABASE
+    skill_requirements = SKILL_REQUIREMENTS
+    psychometric_test_urls = PSYCHOMETRIC_TEST_URLS
+    degree_options = DEGREE_OPTIONS
+    scoring: EmployabilityScoring = ENHANCED_SCORING
+    report_variant = 'enhanced'
+
+    def __init__(self, scoring: Union[str, EmployabilityScoring, None] = None):
+        if isinstance(scoring, str):
+            if scoring not in SCORING_STRATEGIES:
+                raise ValueError(f"Unknown scoring: {scoring!r} (expected one of {', '.join(SCORING_STRATEGIES)})")
+            scoring = SCORING_STRATEGIES[scoring]
+        if scoring is not None:
+            self.scoring = scoring
+
+    @property
+    def rules(self) -> "RuleEngine":
+        from rule_engine import default_rule_engine
+        return default_rule_engine()
+
+    @property
+    def skill_index(self) -> "SkillIndex":
+        return shared_skill_index()
+
+    @property
+    def career_tfidf(self) -> "TfidfIndex":
+        return shared_tfidf_index()
+
+    def get_student_stage(self, grade: int) -> str:
+        """Determine student's academic stage"""
+        return student_stage(grade)
+
+    def employability_score(self, inputs: Dict, cv_data: Optional[Dict] = None,
+                            psychometric: Optional[Dict] = None) -> int:
+        """Stage-3 employability score under this predictor's scoring strategy"""
+        return self.scoring.score(inputs, cv_data, psychometric)
+
+    def render_report(self, output: Dict, fmt: str = 'text') -> str:
+        """A stage report as text, markdown or html (see report_templates)"""
+        from report_templates import render_report
+        return render_report(output, fmt, self.report_variant)
+
+    def print_report(self, output: Dict):
+        """Print a stage report"""
+        sys.stdout.write(self.render_report(output))
+
+    print_stage1_report = print_stage2_report = print_stage3_report = print_report
@@ -0,0 +1,611 @@
+"""
+Stage reports rendered from compiled templates (text, Markdown, HTML).
+
+Each report layout is declared once as a list of nodes (banner, section,
+heading, line, bulleted items, loops, conditionals). compile_template turns
+a layout into one closure per node for a given format, so placeholders are
+parsed, literal text is escaped and the per-format markup is chosen once;
+rendering a report only walks the closures and appends to a buffer. The
+text format reproduces the console report the predictors used to print.
+
+Placeholders are {dotted.path} into the report, or into the loop
+variables item / i (1-based) / key / value. Filters follow '|':
+join (", ".join), first:N (first N items), or:TEXT (TEXT when empty).
+
+render_reports streams many reports into one text stream and
+write_report_archive writes them into one zip file. Both compile each
+template once, however many reports there are.
+"""
+import html
+import re
+import zipfile
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+FORMATS = ('text', 'markdown', 'html')
+EXTENSIONS = {'text': 'txt', 'markdown': 'md', 'html': 'html'}
+WIDTH = 80
+
+HTML_PAGE_START = ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>NaviRiti Reports</title></head>'
+                   '<body>\n')
+HTML_PAGE_END = '</body></html>\n'
+
+
+# ==================== LAYOUT NODES ====================
+
+class Banner(NamedTuple):
+    """Report or part title between heavy rules."""
+    text: str
+
+
+class Rule(NamedTuple):
+    gap: bool = False   # blank line before (text)
+
+
+class Section(NamedTuple):
+    """Section title between light rules."""
+    text: str
+
+
+class Heading(NamedTuple):
+    text: str
+    indent: int = 0
+    gap: bool = True
+
+
+class Line(NamedTuple):
+    text: str
+    indent: int = 0
+    gap: bool = False
+
+
+class Detail(NamedTuple):
+    """Extra line under a list item, optionally only when `when` is non-empty."""
+    text: str
+    when: Optional[str] = None
+
+
+class Items(NamedTuple):
+    """One list item per element of `path`."""
+    path: str
+    text: str = '{item}'
+    marker: str = '•'       # '' for none; numbered lists ignore it
+    indent: int = 3
+    limit: Optional[int] = None
+    numbered: bool = False
+    details: Tuple[Detail, ...] = ()
+
+
+class Each(NamedTuple):
+    """`body` once per element of `path` (per key/value when `pairs`)."""
+    path: str
+    body: Sequence[Any]
+    limit: Optional[int] = None
+    pairs: bool = False
+
+
+class When(NamedTuple):
+    """`body` only when `path` is non-empty."""
+    path: str
+    body: Sequence[Any]
+
+
+class Note(NamedTuple):
+    """Fixed prose; the text format prints it verbatim."""
+    text: str
+
+
+# ==================== PLACEHOLDERS ====================
+
+_FIELD = re.compile(r'\{([^{}]+)\}')
+_LOOP_VARIABLES = frozenset({'item', 'i', 'key', 'value'})
+
+Scope = Tuple[Dict[str, Any], Dict[str, Any]]   # (report, loop variables)
+
+
+def _getter(path: str) -> Callable[[Scope], Any]:
+    """Value at a dotted path, or None when any step is missing."""
+    head, *rest = path.strip().split('.')
+    from_loop = head in _LOOP_VARIABLES
+
+    def get(scope: Scope) -> Any:
+        value = (scope[1] if from_loop else scope[0]).get(head)
+        for key in rest:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+    return get
+
+
+def _filter(spec: str) -> Callable[[Any], Any]:
+    name, _, arg = spec.partition(':')
+    name = name.strip()
+    if name == 'join':
+        return lambda value: ', '.join(str(v) for v in value) if value else ''
+    if name == 'first':
+        n = int(arg)
+        return lambda value: value[:n] if value else value
+    if name == 'or':
+        return lambda value: value if value else arg
+    raise ValueError(f"Unknown template filter: {name!r}")
+
+
+def _compile_text(template: str, escape: Callable[[str], str]) -> Callable[[Scope], str]:
+    """Template string → function of the scope; literals escaped now, values when rendered."""
+    parts: List[Any] = []
+    position = 0
+    for match in _FIELD.finditer(template):
+        if match.start() > position:
+            parts.append(escape(template[position:match.start()]))
+        path, *filters = match.group(1).split('|')
+        get = _getter(path)
+        steps = [_filter(f) for f in filters]
+
+        def field(scope: Scope, get=get, steps=steps) -> str:
+            value = get(scope)
+            for step in steps:
+                value = step(value)
+            return escape('' if value is None else str(value))
+        parts.append(field)
+        position = match.end()
+    if position < len(template):
+        parts.append(escape(template[position:]))
+
+    if all(isinstance(p, str) for p in parts):
+        constant = ''.join(parts)
+        return lambda scope: constant
+    if len(parts) == 1:
+        return parts[0]
+    return lambda scope: ''.join(p if isinstance(p, str) else p(scope) for p in parts)
+
+
+# ==================== FORMATS ====================
+
+Emit = Callable[[Scope, Callable[[str], None]], None]
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+_MARKDOWN_SPECIAL = re.compile(r'([\\`*_\[\]<>#|])')
+
+
+def _markdown_escape(text: str) -> str:
+    return _MARKDOWN_SPECIAL.sub(r'\\\1', text)
+
+
+class _TextFormat:
+    escape = staticmethod(_identity)
+
+    def banner(self, text):
+        return lambda scope, write: write(f"\n{'=' * WIDTH}\n{text(scope)}\n{'=' * WIDTH}\n")
+
+    def rule(self, gap):
+        line = ('\n' if gap else '') + '=' * WIDTH + '\n'
+        return lambda scope, write: write(line)
+
+    def section(self, text):
+        return lambda scope, write: write(f"\n{'─' * WIDTH}\n{text(scope)}\n{'─' * WIDTH}\n")
+
+    def line(self, text, indent, gap, heading=False):
+        prefix = ('\n' if gap else '') + ' ' * indent
+        return lambda scope, write: write(f"{prefix}{text(scope)}\n")
+
+    def items(self, path, text, marker, indent, limit, numbered, details):
+        bullet = ' ' * indent + (marker + ' ' if marker else '')
+        detail_indent = ' ' * (indent + 2)
+
+        def emit(scope, write):
+            for i, item in enumerate((path(scope) or [])[:limit], 1):
+                inner = (scope[0], {**scope[1], 'item': item, 'i': i})
+                write(f"{' ' * indent}{i}. {text(inner)}\n" if numbered else f"{bullet}{text(inner)}\n")
+                for detail, when in details:
+                    if when is None or when(inner):
+                        write(f"{detail_indent}{detail(inner)}\n")
+        return emit
+
+    def note(self, text):
+        return lambda scope, write: write(text + '\n')
+
+
+class _MarkdownFormat:
+    escape = staticmethod(_markdown_escape)
+
+    def banner(self, text):
+        return lambda scope, write: write(f"\n# {text(scope)}\n\n")
+
+    def rule(self, gap):
+        return lambda scope, write: write("\n---\n")
+
+    def section(self, text):
+        return lambda scope, write: write(f"\n## {text(scope)}\n\n")
+
+    def line(self, text, indent, gap, heading=False):
+        if heading:
+            level = '####' if indent else '###'
+            return lambda scope, write: write(f"\n{level} {text(scope)}\n\n")
+        prefix = '\n' if gap else ''
+        return lambda scope, write: write(f"{prefix}{text(scope)}  \n")
+
+    def items(self, path, text, marker, indent, limit, numbered, details):
+        def emit(scope, write):
+            for i, item in enumerate((path(scope) or [])[:limit], 1):
+                inner = (scope[0], {**scope[1], 'item': item, 'i': i})
+                write(f"{i}. {text(inner)}\n" if numbered else f"- {text(inner)}\n")
+                for detail, when in details:
+                    if when is None or when(inner):
+                        write(f"  {detail(inner)}\n")
+            write('\n')
+        return emit
+
+    def note(self, text):
+        body = ''.join(f"{_markdown_escape(line.strip())}  \n" for line in text.splitlines() if line.strip())
+        return lambda scope, write: write(f"\n{body}\n")
+
+
+class _HtmlFormat:
+    escape = staticmethod(html.escape)
+
+    def banner(self, text):
+        return lambda scope, write: write(f"<h1>{text(scope)}</h1>\n")
+
+    def rule(self, gap):
+        return lambda scope, write: write("<hr>\n")
+
+    def section(self, text):
+        return lambda scope, write: write(f"<h2>{text(scope)}</h2>\n")
+
+    def line(self, text, indent, gap, heading=False):
+        if heading:
+            tag = 'h4' if indent else 'h3'
+            return lambda scope, write: write(f"<{tag}>{text(scope)}</{tag}>\n")
+        return lambda scope, write: write(f"<p>{text(scope)}</p>\n")
+
+    def items(self, path, text, marker, indent, limit, numbered, details):
+        tag = 'ol' if numbered else 'ul'
+
+        def emit(scope, write):
+            items = (path(scope) or [])[:limit]
+            if not items:
+                return
+            write(f"<{tag}>\n")
+            for i, item in enumerate(items, 1):
+                inner = (scope[0], {**scope[1], 'item': item, 'i': i})
+                write(f"<li>{text(inner)}")
+                for detail, when in details:
+                    if when is None or when(inner):
+                        write(f"<br>{detail(inner)}")
+                write("</li>\n")
+            write(f"</{tag}>\n")
+        return emit
+
+    def note(self, text):
+        body = ''.join(f"<p>{html.escape(line.strip())}</p>\n" for line in text.splitlines() if line.strip())
+        return lambda scope, write: write(body)
+
+
+_FORMATS = {'text': _TextFormat(), 'markdown': _MarkdownFormat(), 'html': _HtmlFormat()}
+
+
+# ==================== COMPILER ====================
+
+def _compile_nodes(nodes: Sequence[Any], fmt) -> Emit:
+    emits = [_compile_node(node, fmt) for node in nodes]
+
+    def emit(scope, write):
+        for e in emits:
+            e(scope, write)
+    return emit
+
+
+def _compile_node(node: Any, fmt) -> Emit:
+    text = lambda template: _compile_text(template, fmt.escape)
+    if isinstance(node, Banner):
+        return fmt.banner(text(node.text))
+    if isinstance(node, Rule):
+        return fmt.rule(node.gap)
+    if isinstance(node, Section):
+        return fmt.section(text(node.text))
+    if isinstance(node, Heading):
+        return fmt.line(text(node.text), node.indent, node.gap, heading=True)
+    if isinstance(node, Line):
+        return fmt.line(text(node.text), node.indent, node.gap)
+    if isinstance(node, Items):
+        details = tuple((text(d.text), _getter(d.when) if d.when else None) for d in node.details)
+        return fmt.items(_getter(node.path), text(node.text), node.marker, node.indent,
+                         node.limit, node.numbered, details)
+    if isinstance(node, Note):
+        return fmt.note(node.text)
+    if isinstance(node, When):
+        get = _getter(node.path)
+        body = _compile_nodes(node.body, fmt)
+
+        def when(scope, write):
+            if get(scope):
+                body(scope, write)
+        return when
+    if isinstance(node, Each):
+        get = _getter(node.path)
+        body = _compile_nodes(node.body, fmt)
+        limit, pairs = node.limit, node.pairs
+
+        def each(scope, write):
+            values = get(scope)
+            if not values:
+                return
+            elements = list(values.items()) if pairs else values
+            for i, element in enumerate(elements[:limit], 1):
+                loop = {'key': element[0], 'value': element[1]} if pairs else {'item': element}
+                body((scope[0], {**scope[1], **loop, 'i': i}), write)
+        return each
+    raise TypeError(f"Unknown report node: {node!r}")
+
+
+def compile_template(nodes: Sequence[Any], fmt: str = 'text') -> Callable[[Dict, Callable[[str], None]], None]:
+    """A function (report, write) that renders `nodes` as `fmt`."""
+    if fmt not in _FORMATS:
+        raise ValueError(f"Unknown report format: {fmt!r} (expected one of {', '.join(FORMATS)})")
+    emit = _compile_nodes(nodes, _FORMATS[fmt])
+    if fmt != 'html':
+        return lambda report, write: emit((report, {}), write)
+
+    def render_html(report, write):
+        write('<article class="naviriti-report">\n')
+        emit((report, {}), write)
+        write('</article>\n')
+    return render_html
+
+
+# ==================== LAYOUTS ====================
+
+STAGE1_GUIDANCE = (
+    "\n"
+    "   At this stage, the focus is on EXPLORATION, not decision-making.\n"
+    "   \n"
+    "   ✓ Try different activities and subjects\n"
+    "   ✓ Participate in competitions and projects\n"
+    "   ✓ Discover what excites and energizes you\n"
+    "   ✓ Don't worry about choosing a final career yet\n"
+    "   ✓ Build diverse skills and experiences\n"
+    "   \n"
+    "   Remember: This is YOUR journey of discovery! 🚀\n"
+    "        "
+)
+
+# deloitte.py (SRS release)
+SRS_STAGE1 = [
+    Banner("📊 EXPLORATION REPORT - STAGE 1"),
+    Line("Student: {student_name}", gap=True),
+    Line("Grade: {grade}"),
+    Line("Stage: {stage}"),
+    Section("🎯 IDENTIFIED INTERESTS & INCLINATIONS"),
+    Line("📚 Subject Inclinations: {exploration_report.subject_inclinations|join}", gap=True),
+    Line("🎨 Creative Interests: {exploration_report.creative_interests|join}"),
+    Line("🏆 Achievements: {exploration_report.achievements|join|or:None yet - keep exploring!}"),
+    Heading("💡 Personality Insights:"),
+    Line("Type: {exploration_report.personality_insights.type}", indent=3),
+    Line("Strengths: {exploration_report.personality_insights.strengths|join}", indent=3),
+    Section("🌟 SUGGESTED PATHWAYS TO EXPLORE"),
+    Items("suggested_pathways", numbered=True),
+    Section("👀 CAREER AWARENESS (Fields to Explore - No Pressure!)"),
+    Items("awareness_insights"),
+    Section("🎪 CLUBS & WORKSHOPS TO JOIN"),
+    Items("clubs_workshops"),
+    Section("💬 GUIDANCE NOTE"),
+    Note(STAGE1_GUIDANCE),
+    Rule(),
+]
+
+SRS_STAGE2 = [
+    Banner("🎯 CAREER PREDICTION & ROADMAP - STAGE 2"),
+    Line("Student: {student_name}", gap=True),
+    Line("Grade: {grade}"),
+    Line("Stream: {stream}"),
+    Line("Stage: {stage}"),
+    Section("🏆 TOP RECOMMENDED CAREERS"),
+    Items("predicted_careers", numbered=True),
+    Section("🔄 ALTERNATE/BACKUP CAREERS"),
+    Items("alternate_careers"),
+    Section("📝 COMPETITIVE EXAMS TO TARGET"),
+    Items("competitive_exams"),
+    Section("🎯 SKILLS TO DEVELOP"),
+    Items("skills_to_develop"),
+    Section("💼 INTERNSHIP RECOMMENDATIONS"),
+    Items("internship_recommendations"),
+    Section("🎓 HIGHER EDUCATION PATHS"),
+    Items("higher_education_paths"),
+    When("career_roadmap", [
+        Banner("🗺️  DETAILED CAREER ROADMAP: {career_roadmap.career}"),
+        Each("career_roadmap.milestones", [
+            Heading("📍 {item.stage}"),
+            Line("Focus: {item.focus}", indent=3),
+            Line("Actions:", indent=3),
+            Items("item.actions", indent=6),
+        ]),
+    ]),
+    Rule(gap=True),
+]
+
+SRS_STAGE3 = [
+    Banner("🚀 CAREER MAPPING & EMPLOYABILITY REPORT - STAGE 3"),
+    Line("Student: {student_name}", gap=True),
+    Line("Degree: {degree}"),
+    Line("Stage: {stage}"),
+    Section("📊 EMPLOYABILITY SCORE: {employability_score}/100"),
+    Line("✓ Technical Readiness: {job_readiness.technical_readiness}", gap=True),
+    Line("✓ Experience Level: {job_readiness.experience_level}"),
+    Line("✓ Profile Strength: {job_readiness.profile_strength}"),
+    Section("🎯 CAREER MAPPING (Employability Focus)"),
+    Items("career_mapping", numbered=True),
+    When("skill_gap_analysis", [
+        Section("📈 SKILL GAP ANALYSIS - Target: {skill_gap_analysis.target_career}"),
+        Heading("✅ Skills You Have:"),
+        Items("skill_gap_analysis.skills_you_have", marker="✓"),
+        Heading("📚 Skills to Develop:"),
+        Items("skill_gap_analysis.skills_to_develop", marker="→"),
+        When("skill_gap_analysis.additional_skills", [
+            Heading("⭐ Additional Skills (Bonus):"),
+            Items("skill_gap_analysis.additional_skills", marker="+"),
+        ]),
+    ]),
+    Section("🎓 GRADUATE PATHWAY: {graduate_pathways.primary}"),
+    Line("Focus: {graduate_pathways.focus}", gap=True),
+    Line("Timeline: {graduate_pathways.timeline}"),
+    Heading("Action Plan:"),
+    Items("graduate_pathways.actions"),
+    Section("📄 RESUME ENHANCEMENT SUGGESTIONS"),
+    Items("resume_enhancement", marker=""),
+    Section("🚨 IMMEDIATE ACTIONS REQUIRED"),
+    Items("job_readiness.immediate_actions", marker=""),
+    Section("🏢 TARGET COMPANIES/SECTORS"),
+    Items("recommended_companies"),
+    Section("📚 LEARNING RESOURCES"),
+    Line("🎓 Online Courses: {learning_resources.online_courses|join}", gap=True),
+    Line("💻 Practice Platforms: {learning_resources.practice_platforms|join}"),
+    Line("🤝 Networking: {learning_resources.networking|join}"),
+    Line("💼 Career Prep: {learning_resources.career_prep|join}"),
+    Rule(gap=True),
+]
+
+# deloitte1.py (enhanced release)
+ENHANCED_STAGE1 = [
+    Banner("📊 NAVIRITI CAREER EXPLORATION REPORT - STAGE 1"),
+    Line("Student: {student_name}"),
+    Line("Grade: {grade}"),
+    Rule(),
+    Heading("📚 SUBJECT INCLINATIONS:"),
+    Items("exploration_report.subject_inclinations"),
+    Heading("🎨 CREATIVE INTERESTS:"),
+    Items("exploration_report.creative_interests"),
+    Heading("👤 PERSONALITY INSIGHTS:"),
+    Line("Type: {exploration_report.personality_insights.type}", indent=3),
+    Line("Strengths: {exploration_report.personality_insights.strengths|join}", indent=3),
+    Heading("🛤️  SUGGESTED PATHWAYS:"),
+    Items("suggested_pathways"),
+    Rule(gap=True),
+]
+
+ENHANCED_STAGE2 = [
+    Banner("📊 NAVIRITI CAREER PREDICTION REPORT - STAGE 2"),
+    Line("Student: {student_name}"),
+    Line("Grade: {grade}"),
+    Line("Stream: {stream}"),
+    Rule(),
+    Heading("📚 ACADEMIC PROFILE:"),
+    Line("Class 10: {academic_profile.class10_percentage}%", indent=3),
+    Line("Current: {academic_profile.current_performance}%", indent=3),
+    Line("Rating: {academic_profile.academic_rating}", indent=3),
+    Heading("🎯 CAREER RECOMMENDATIONS:"),
+    Items("career_recommendations", "{item.career} - Match: {item.match}% ({item.domain})", limit=5),
+    Heading("📖 EXAM GUIDANCE:"),
+    Each("exam_guidance", [
+        Heading("{key}:", indent=3),
+        Line("Time: {value.preparation_time}", indent=6),
+        Line("Subjects: {value.key_subjects|join}", indent=6),
+    ], pairs=True),
+    Rule(gap=True),
+]
+
+ENHANCED_STAGE3 = [
+    Banner("📊 NAVIRITI CAREER PREDICTION REPORT - STAGE 3"),
+    Line("Student: {student_name}"),
+    Line("Degree: {degree}"),
+    Line("Employability Score: {employability_score}/100"),
+    Rule(),
+    Heading("🎯 TOP CAREER PREDICTIONS:"),
+    Items("career_predictions", "{item.career} - Match: {item.match}%", limit=5,
+          details=(Detail("Salary: {item.salary_range}"),)),
+    Heading("💼 JOB ROLE MAPPING:"),
+    Each("job_role_mapping", [
+        Heading("{item.role}:", indent=3),
+        Line("Companies: {item.companies|first:3|join}", indent=6),
+        Line("Readiness: {item.readiness}", indent=6),
+    ], limit=3),
+    Heading("📊 SKILL GAP ANALYSIS:"),
+    Each("skill_gap_analysis", [
+        Heading("{key}:", indent=3),
+        Line("Completion: {value.completion_percentage}%", indent=6),
+        Line("Missing: {value.missing_skills|first:3|join}", indent=6),
+    ], limit=2, pairs=True),
+    When("skill_matched_careers", [
+        Heading("🧭 BEST SKILL MATCHES ACROSS ALL CAREERS:"),
+        Items("skill_matched_careers", "{item.career} - {item.coverage}% of required skills", limit=3,
+              details=(Detail("Still needed: {item.missing_skills|first:3|join}", when="item.missing_skills"),)),
+    ]),
+    When("similar_careers", [
+        Heading("📄 CAREERS CLOSEST TO YOUR CV:"),
+        Items("similar_careers", "{item.career} - {item.similarity}% text similarity", limit=3),
+    ]),
+    Heading("🗺️ PREPARATION ROADMAP:"),
+    Heading("Immediate Actions:", indent=3),
+    Items("preparation_roadmap.immediate_actions", indent=6),
+    Heading("Short-term Goals (3-6 months):", indent=3),
+    Items("preparation_roadmap.short_term_goals", indent=6),
+    Rule(gap=True),
+]
+
+LAYOUTS: Dict[str, Dict[int, List[Any]]] = {
+    'srs': {1: SRS_STAGE1, 2: SRS_STAGE2, 3: SRS_STAGE3},
+    'enhanced': {1: ENHANCED_STAGE1, 2: ENHANCED_STAGE2, 3: ENHANCED_STAGE3},
+}
+
+
+# ==================== RENDERING ====================
+
+def report_stage(report: Dict) -> int:
+    """1, 2 or 3 from a report's 'stage' ("Stage 2: Decision Years")."""
+    match = re.match(r'Stage (\d)', report.get('stage', ''))
+    if not match:
+        raise ValueError(f"Not a stage report: {report.get('stage')!r}")
+    return int(match.group(1))
+
+
+@lru_cache(maxsize=None)
+def compiled_template(variant: str, stage: int, fmt: str):
+    if variant not in LAYOUTS:
+        raise ValueError(f"Unknown report variant: {variant!r} (expected one of {', '.join(LAYOUTS)})")
+    return compile_template(LAYOUTS[variant][stage], fmt)
+
+
+def write_report(report: Dict, write: Callable[[str], None], fmt: str = 'text', variant: str = 'enhanced'):
+    """Render one report through `write` (e.g. a list's append or a stream's write)."""
+    compiled_template(variant, report_stage(report), fmt)(report, write)
+
+
+def render_report(report: Dict, fmt: str = 'text', variant: str = 'enhanced') -> str:
+    parts: List[str] = []
+    write_report(report, parts.append, fmt, variant)
+    return ''.join(parts)
+
+
+def render_reports(reports: Iterable[Dict], out: TextIO, fmt: str = 'text', variant: str = 'enhanced') -> int:
+    """Every report into one stream (one HTML page for 'html'); returns the count."""
+    count = 0
+    if fmt == 'html':
+        out.write(HTML_PAGE_START)
+    for report in reports:
+        out.write(render_report(report, fmt, variant))
+        count += 1
+    if fmt == 'html':
+        out.write(HTML_PAGE_END)
+    return count
+
+
+def _archive_name(index: int, report: Dict, fmt: str) -> str:
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', str(report.get('student_name') or 'student')).strip('_') or 'student'
+    return f"{index:06d}_{slug}.{EXTENSIONS[fmt]}"
+
+
+def write_report_archive(reports: Iterable[Dict], path: str, fmt: str = 'text', variant: str = 'enhanced',
+                         compression: int = zipfile.ZIP_DEFLATED) -> int:
+    """One file per report in a zip archive at `path` (standalone pages for 'html'); returns the count."""
+    count = 0
+    with zipfile.ZipFile(path, 'w', compression=compression) as archive:
+        for count, report in enumerate(reports, 1):
+            body = render_report(report, fmt, variant)
+            if fmt == 'html':
+                body = HTML_PAGE_START + body + HTML_PAGE_END
+            archive.writestr(_archive_name(count, report, fmt), body)
+    return count
@@ -0,0 +1,399 @@
+"""
+Declarative career rules, compiled once and hot-reloaded from a JSON file.
+
+A rule set is an ordered list of rules:
+
+    {"when": CONDITION, "emit": [ITEM, ...], "group": "stream", "rules": [RULE, ...]}
+
+Every key is optional. A rule without "when" always matches. Rules that
+share a "group" behave like an if/elif chain: only the first of them that
+matches fires (so a final group rule without "when" is the else branch).
+Nested "rules" are only evaluated when their parent matched.
+
+Conditions:
+    {"text": FIELD, "contains": [s, ...]}    any substring in the lowercased field
+                                             (lists are joined with spaces)
+    {"value": FIELD, "gt"|"gte"|"lt"|"lte": n}   numeric field, missing counts as 0
+    {"count": FIELD, "gt"|"gte"|"lt"|"lte": n}   length of a list field
+    {"all": [...]}, {"any": [...]}, {"not": CONDITION}
+
+FIELD is a key of the context, or a dotted path into nested dicts
+('psychometric.leadership_score'). Inside emitted items,
+{"$if": CONDITION, "then": a, "else": b} picks a value per request.
+
+Conditions compile to closures. Substring tests are not repeated per rule:
+each rule set knows every literal it tests against each field and finds
+them once per request (through a prefix index when there are many). Rules
+are indexed by the literals they need, so a
+request only visits the rules whose literals it contains (plus the few
+rules, such as numeric ones, that have no literal to key on).
+"""
+import json
+import operator
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+RULES_PATH = os.environ.get(
+    "NAVIRITI_CAREER_RULES",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "career_rules.json"),
+)
+
+# Seconds between checks of the rules file for changes
+RELOAD_INTERVAL = 2.0
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le,
+}
+
+
+class RuleError(ValueError):
+    """A rules file that does not describe valid rule sets."""
+
+
+def _lookup(context: Mapping, path: Tuple[str, ...]) -> Any:
+    value: Any = context
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.lower()
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value).lower()
+    return str(value).lower()
+
+
+# Up to this many literals per field are simply tested one by one
+_SCAN_LIMIT = 32
+_GRAM = 3
+
+
+class LiteralSet:
+    """The literals tested against one field, and a fast way to find which occur in a text."""
+
+    def __init__(self, words: Set[str]):
+        self.words = frozenset(words)
+        self.short: Tuple[str, ...] = tuple(w for w in self.words if len(w) < _GRAM)
+        # Large vocabularies are keyed on their first characters, so only literals whose
+        # prefix occurs in the text are tested and the cost follows the text, not the rule count
+        self.by_prefix: Dict[str, Tuple[str, ...]] = {}
+        if len(self.words) > _SCAN_LIMIT:
+            prefixes: Dict[str, List[str]] = {}
+            for w in self.words:
+                if len(w) >= _GRAM:
+                    prefixes.setdefault(w[:_GRAM], []).append(w)
+            self.by_prefix = {prefix: tuple(ws) for prefix, ws in prefixes.items()}
+
+    def present(self, text: str) -> Set[str]:
+        if not text:
+            return set()
+        if not self.by_prefix:
+            return {w for w in self.words if w in text}
+        found = {w for w in self.short if w in text}
+        by_prefix = self.by_prefix
+        for gram in {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}:
+            for w in by_prefix.get(gram, ()):
+                if w in text:
+                    found.add(w)
+        return found
+
+
+class Facts:
+    """One request's context plus the literals found in each text field."""
+
+    __slots__ = ("context", "hits")
+
+    def __init__(self, context: Mapping, literals: Mapping[Tuple[str, ...], LiteralSet]):
+        self.context = context
+        self.hits: Dict[Tuple[str, ...], Set[str]] = {
+            path: words.present(_text(_lookup(context, path))) for path, words in literals.items()
+        }
+
+    def value(self, path: Tuple[str, ...]) -> Any:
+        value = _lookup(self.context, path)
+        return 0 if value is None else value
+
+    def count(self, path: Tuple[str, ...]) -> int:
+        value = _lookup(self.context, path)
+        return len(value) if value else 0
+
+
+Condition = Callable[[Facts], bool]
+Template = Callable[[Facts], Any]
+
+
+# ==================== COMPILATION ====================
+
+def _field(spec: Mapping, key: str, where: str) -> Tuple[str, ...]:
+    field = spec[key]
+    if not isinstance(field, str) or not field:
+        raise RuleError(f"{where}: '{key}' must be a field name")
+    return tuple(field.split("."))
+
+
+def _compile_condition(spec: Any, literals: Dict[Tuple[str, ...], Set[str]], where: str) -> Condition:
+    if not isinstance(spec, Mapping):
+        raise RuleError(f"{where}: condition must be an object, got {spec!r}")
+
+    if "all" in spec or "any" in spec:
+        combine = all if "all" in spec else any
+        parts = [_compile_condition(c, literals, where) for c in spec["all" if "all" in spec else "any"]]
+        return lambda facts: combine(part(facts) for part in parts)
+
+    if "not" in spec:
+        inner = _compile_condition(spec["not"], literals, where)
+        return lambda facts: not inner(facts)
+
+    if "text" in spec:
+        path = _field(spec, "text", where)
+        words = spec.get("contains")
+        if not isinstance(words, list) or not words or not all(isinstance(w, str) and w for w in words):
+            raise RuleError(f"{where}: 'contains' must be a non-empty list of strings")
+        wanted = frozenset(w.lower() for w in words)
+        literals.setdefault(path, set()).update(wanted)
+        return lambda facts: not wanted.isdisjoint(facts.hits[path])
+
+    for kind in ("value", "count"):
+        if kind in spec:
+            path = _field(spec, kind, where)
+            ops = [(name, spec[name]) for name in _COMPARISONS if name in spec]
+            if len(ops) != 1 or not isinstance(ops[0][1], (int, float)):
+                raise RuleError(f"{where}: '{kind}' needs exactly one numeric gt/gte/lt/lte")
+            compare, threshold = _COMPARISONS[ops[0][0]], ops[0][1]
+            read = Facts.value if kind == "value" else Facts.count
+            return lambda facts: compare(read(facts, path), threshold)
+
+    raise RuleError(f"{where}: unknown condition {spec!r}")
+
+
+def _is_static(spec: Any) -> bool:
+    if isinstance(spec, Mapping):
+        return "$if" not in spec and all(_is_static(v) for v in spec.values())
+    if isinstance(spec, list):
+        return all(_is_static(v) for v in spec)
+    return True
+
+
+def _copy(spec: Any) -> Any:
+    # JSON data only: dicts, lists and immutable scalars
+    if isinstance(spec, dict):
+        return {key: _copy(value) for key, value in spec.items()}
+    if isinstance(spec, list):
+        return [_copy(value) for value in spec]
+    return spec
+
+
+def _copier(spec: Any) -> Callable[[], Any]:
+    """The cheapest way to copy a static template: a shallow copy when nothing in it is mutable."""
+    if isinstance(spec, (dict, list)):
+        values = spec.values() if isinstance(spec, dict) else spec
+        if any(isinstance(value, (dict, list)) for value in values):
+            return lambda: _copy(spec)
+        return spec.copy
+    return lambda: spec
+
+
+def _compile_template(spec: Any, literals: Dict[Tuple[str, ...], Set[str]], where: str) -> Template:
+    """A function building a fresh copy of `spec` per request, so callers may mutate what they get."""
+    if isinstance(spec, Mapping):
+        if "$if" in spec:
+            test = _compile_condition(spec["$if"], literals, where)
+            then = _compile_template(spec.get("then"), literals, where)
+            otherwise = _compile_template(spec.get("else"), literals, where)
+            return lambda facts: then(facts) if test(facts) else otherwise(facts)
+        if _is_static(spec):
+            copy = _copier(spec)
+            return lambda facts: copy()
+        items = [(key, _compile_template(value, literals, where)) for key, value in spec.items()]
+        return lambda facts: {key: build(facts) for key, build in items}
+    if isinstance(spec, list):
+        if _is_static(spec):
+            copy = _copier(spec)
+            return lambda facts: copy()
+        items = [_compile_template(value, literals, where) for value in spec]
+        return lambda facts: [build(facts) for build in items]
+    return lambda facts: spec
+
+
+Trigger = Tuple[Tuple[str, ...], str]
+
+
+def _triggers(spec: Mapping) -> Optional[FrozenSet[Trigger]]:
+    """(field, literal) pairs of which at least one must be present for `spec` to hold, if there are such."""
+    if "text" in spec:
+        path = tuple(spec["text"].split("."))
+        return frozenset((path, w.lower()) for w in spec["contains"])
+    if "any" in spec:
+        parts = [_triggers(c) for c in spec["any"]]
+        return None if not parts or None in parts else frozenset().union(*parts)
+    if "all" in spec:
+        parts = [t for t in (_triggers(c) for c in spec["all"]) if t is not None]
+        return min(parts, key=len) if parts else None
+    return None
+
+
+class Rule(NamedTuple):
+    when: Optional[Condition]
+    group: Optional[str]
+    emit: Tuple[Template, ...]
+    rules: "RuleList"
+
+
+class RuleList(NamedTuple):
+    rules: Tuple[Rule, ...]
+    # (field, literal) → positions of the rules it can trigger; rules without a
+    # literal to key on are always candidates
+    index: Dict[Trigger, Tuple[int, ...]]
+    always: Tuple[int, ...]
+
+
+_RULE_KEYS = {"when", "group", "emit", "rules"}
+
+
+def _compile_rules(specs: Any, literals: Dict[Tuple[str, ...], Set[str]], where: str) -> RuleList:
+    if not isinstance(specs, list):
+        raise RuleError(f"{where}: rules must be a list")
+    rules = []
+    index: Dict[Trigger, List[int]] = {}
+    always = []
+    for i, spec in enumerate(specs):
+        here = f"{where}[{i}]"
+        if not isinstance(spec, Mapping) or set(spec) - _RULE_KEYS:
+            raise RuleError(f"{here}: a rule is an object with keys {sorted(_RULE_KEYS)}")
+        emit = spec.get("emit", [])
+        if not isinstance(emit, list):
+            raise RuleError(f"{here}: 'emit' must be a list")
+        rules.append(Rule(
+            when=_compile_condition(spec["when"], literals, here) if "when" in spec else None,
+            group=spec.get("group"),
+            emit=tuple(_compile_template(item, literals, here) for item in emit),
+            rules=_compile_rules(spec.get("rules", []), literals, f"{here}.rules"),
+        ))
+        triggers = _triggers(spec["when"]) if "when" in spec else None
+        if triggers is None:
+            always.append(i)
+        else:
+            for trigger in triggers:
+                index.setdefault(trigger, []).append(i)
+    return RuleList(tuple(rules), {t: tuple(positions) for t, positions in index.items()}, tuple(always))
+
+
+def _fire(rule_list: RuleList, facts: Facts, out: List[Any]):
+    # Only rules that can match this request are visited, still in file order
+    positions = list(rule_list.always)
+    index = rule_list.index
+    for path, hits in facts.hits.items():
+        for word in hits:
+            positions.extend(index.get((path, word), ()))
+    if len(positions) > len(rule_list.always):
+        positions = sorted(set(positions))
+    rules = rule_list.rules
+    claimed: Set[str] = set()
+    for i in positions:
+        rule = rules[i]
+        if rule.group is not None and rule.group in claimed:
+            continue
+        if rule.when is not None and not rule.when(facts):
+            continue
+        if rule.group is not None:
+            claimed.add(rule.group)
+        for build in rule.emit:
+            out.append(build(facts))
+        if rule.rules.rules:
+            _fire(rule.rules, facts, out)
+
+
+class RuleSet:
+    def __init__(self, name: str, specs: List[Mapping]):
+        self.name = name
+        literals: Dict[Tuple[str, ...], Set[str]] = {}
+        self.rules = _compile_rules(specs, literals, name)
+        self.literals: Dict[Tuple[str, ...], LiteralSet] = {
+            path: LiteralSet(words) for path, words in literals.items()
+        }
+
+    def evaluate(self, context: Mapping) -> List[Any]:
+        """Items emitted by every rule that fires, in rule order."""
+        out: List[Any] = []
+        _fire(self.rules, Facts(context, self.literals), out)
+        return out
+
+
+def compile_rules(document: Mapping) -> Dict[str, RuleSet]:
+    rulesets = document.get("rulesets") if isinstance(document, Mapping) else None
+    if not isinstance(rulesets, Mapping):
+        raise RuleError("rules file needs a 'rulesets' object")
+    return {name: RuleSet(name, specs) for name, specs in rulesets.items()}
+
+
+def load_rules(path: str = RULES_PATH) -> Dict[str, RuleSet]:
+    with open(path, encoding="utf-8") as f:
+        try:
+            document = json.load(f)
+        except ValueError as e:
+            raise RuleError(f"{path}: {e}") from e
+    return compile_rules(document)
+
+
+# ==================== ENGINE ====================
+
+class RuleEngine:
+    """
+    Compiled rule sets from `path`. The file is re-checked at most every
+    `reload_interval` seconds and recompiled when it changes; a broken edit
+    is reported and the previous rules stay in force.
+    """
+
+    def __init__(self, path: str = RULES_PATH, reload_interval: float = RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._rulesets = load_rules(path)
+        self._checked = time.monotonic()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """Recompile the rules if the file changed; returns True when new rules were loaded."""
+        with self._lock:
+            self._checked = time.monotonic()
+            stamp = self._file_stamp()
+            if stamp is None or stamp == self._stamp:
+                return False
+            try:
+                rulesets = load_rules(self.path)
+            except (OSError, RuleError) as e:
+                print(f"Keeping previous career rules; {self.path} failed to load: {e}", file=sys.stderr)
+                self._stamp = stamp
+                return False
+            self._rulesets, self._stamp = rulesets, stamp
+            return True
+
+    def ruleset(self, name: str) -> RuleSet:
+        if time.monotonic() - self._checked >= self.reload_interval:
+            self.reload()
+        return self._rulesets[name]
+
+    def evaluate(self, name: str, context: Mapping) -> List[Any]:
+        return self.ruleset(name).evaluate(context)
+
+
+@lru_cache(maxsize=None)
+def default_rule_engine() -> RuleEngine:
+    return RuleEngine()
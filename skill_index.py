@@ -0,0 +1,188 @@
+"""
+Inverted skill → career index for skill-gap analysis over a whole catalog.
+
+Skills are normalized and interned to bit positions (as job_index does for
+job titles) and each career's requirements become one skill bitset. The
+inverted side is a career bitmap per skill. Ranking a student adds the
+bitmaps of their skills into bit-sliced counters (plane j holds bit j of
+every career's matched-skill count), so the whole catalog is scored with a
+few big-integer operations per skill instead of a loop over careers. The
+top careers are then read off coverage tier by coverage tier (matched h of
+r required), best tier first, stopping once k are found.
+"""
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Common abbreviations, keyed on the normalized spelling
+SKILL_SYNONYMS: Dict[str, str] = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "dl": "deep learning",
+    "js": "javascript",
+    "dsa": "data structures and algorithms",
+    "oop": "object oriented programming",
+    "ms excel": "excel",
+    "adobe creative suite": "adobe suite",
+    "data visualisation": "data visualization",
+    "statistic": "statistics",
+}
+
+_NON_SKILL = re.compile(r"[^a-z0-9+#.]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercased, '&' → 'and', punctuation collapsed to single spaces, synonyms resolved."""
+    key = " ".join(_NON_SKILL.sub(" ", skill.lower().replace("&", " and ")).split()).strip(".")
+    return SKILL_SYNONYMS.get(key, key)
+
+
+class CareerMatch(NamedTuple):
+    career: str
+    domain: Optional[str]
+    coverage: float             # share of the career's required skills the student has
+    matched_skills: List[str]   # in the career's requirement order
+    missing_skills: List[str]
+
+
+def career_domains(career_database: Mapping[str, Sequence[str]]) -> Dict[str, str]:
+    """career → domain from a {domain: [careers]} database (first domain wins)."""
+    domains: Dict[str, str] = {}
+    for domain, careers in career_database.items():
+        for career in careers:
+            domains.setdefault(career, domain)
+    return domains
+
+
+def _bitmap(positions: Iterable[int], size: int) -> int:
+    # Built as bytes: OR-ing 1 << p into a growing int is quadratic for large catalogs
+    buf = bytearray((size + 7) // 8)
+    for p in positions:
+        buf[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _positions(bits: int, limit: int) -> List[int]:
+    out = []
+    while bits and len(out) < limit:
+        low = bits & -bits
+        out.append(low.bit_length() - 1)
+        bits ^= low
+    return out
+
+
+class SkillIndex:
+    def __init__(self, requirements: Mapping[str, Sequence[str]], domains: Optional[Mapping[str, str]] = None):
+        self._skill_ids: Dict[str, int] = {}
+        self._skill_names: List[str] = []
+        self.careers: List[str] = []
+        self.domains = dict(domains or {})
+        self._positions: Dict[str, int] = {}
+        self._required: List[int] = []
+        self._required_ids: List[List[int]] = []
+
+        postings: List[List[int]] = []
+        by_size: Dict[int, List[int]] = {}
+        for career, skills in requirements.items():
+            ids = list(dict.fromkeys(self._intern(skill) for skill in skills))
+            if not ids:
+                continue
+            position = self._positions[career] = len(self.careers)
+            self.careers.append(career)
+            self._required_ids.append(ids)
+            self._required.append(sum(1 << i for i in ids))
+            by_size.setdefault(len(ids), []).append(position)
+            for i in ids:
+                while len(postings) <= i:
+                    postings.append([])
+                postings[i].append(position)
+
+        size = len(self.careers)
+        # skill ID → bitmap of the careers requiring it
+        self._careers_with: List[int] = [_bitmap(p, size) for p in postings]
+        # required-skill count → bitmap of the careers with that many requirements
+        self._size_groups: Dict[int, int] = {r: _bitmap(p, size) for r, p in by_size.items()}
+        # (matched, required) tiers, best coverage first, then more matched skills
+        self._tiers: List[Tuple[int, int]] = sorted(
+            ((h, r) for r in by_size for h in range(1, r + 1)),
+            key=lambda t: (t[0] / t[1], t[0]), reverse=True,
+        )
+
+    def __len__(self) -> int:
+        return len(self.careers)
+
+    def _intern(self, skill: str) -> int:
+        key = normalize_skill(skill)
+        skill_id = self._skill_ids.get(key)
+        if skill_id is None:
+            skill_id = self._skill_ids[key] = len(self._skill_names)
+            self._skill_names.append(skill.strip())
+        return skill_id
+
+    def skill_bits(self, skills: Iterable[str]) -> int:
+        """Bitset of the indexed skills among `skills`; skills no career requires are ignored."""
+        bits = 0
+        ids = self._skill_ids
+        for skill in skills:
+            skill_id = ids.get(normalize_skill(skill))
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def _match(self, position: int, student: int) -> CareerMatch:
+        required_ids = self._required_ids[position]
+        covered = self._required[position] & student
+        names = self._skill_names
+        matched = [names[i] for i in required_ids if covered >> i & 1]
+        missing = [names[i] for i in required_ids if not covered >> i & 1]
+        career = self.careers[position]
+        return CareerMatch(career, self.domains.get(career), len(matched) / len(required_ids), matched, missing)
+
+    def _count_planes(self, student: int) -> Tuple[List[int], int]:
+        """Bit-sliced per-career counts of matched skills, and the number of skills added."""
+        planes: List[int] = []
+        added = 0
+        bits = student
+        while bits:
+            low = bits & -bits
+            carry = self._careers_with[low.bit_length() - 1]
+            bits ^= low
+            added += 1
+            for j, plane in enumerate(planes):
+                planes[j] = plane ^ carry
+                carry &= plane
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        return planes, added
+
+    def top_careers(self, skills: Iterable[str], k: int = 5, min_coverage: float = 0.0) -> List[CareerMatch]:
+        """
+        The k careers covering the largest share of their requirements with
+        `skills`; ties go to more matched skills, then catalog order.
+        Careers sharing no skill with the student are not returned.
+        """
+        student = self.skill_bits(skills)
+        planes, added = self._count_planes(student)
+        best: List[int] = []
+        for h, r in self._tiers:
+            if len(best) >= k or h / r < min_coverage:
+                break
+            if h > added:
+                continue
+            # Careers needing r skills whose count equals h, bit by bit
+            mask = self._size_groups[r]
+            for j in range(max(len(planes), h.bit_length())):
+                plane = planes[j] if j < len(planes) else 0
+                mask &= plane if h >> j & 1 else ~plane
+                if not mask:
+                    break
+            best.extend(_positions(mask, k - len(best)))
+        return [self._match(p, student) for p in best]
+
+    def gap(self, career: str, skills: Iterable[str]) -> Optional[CareerMatch]:
+        """Coverage and missing skills for one career, or None if it has no requirements."""
+        position = self._positions.get(career)
+        if position is None:
+            return None
+        return self._match(position, self.skill_bits(skills))
@@ -7,6 +7,38 @@ import pytz
 # Initialize Swiss Ephemeris
 swe.set_ephe_path('/usr/share/ephe')  # Set path for ephemeris files
 
+# Nakshatra occupation mapping
+NAKSHATRA_OCCUPATIONS = {
+    "Ashwini": ["Medicine", "Healing", "Veterinary", "Surgery", "Emergency Services", "Racing", "Transportation"],
+    "Bharani": ["Arts", "Entertainment", "Fashion", "Law", "Justice", "Agriculture", "Food Industry"],
+    "Krittika": ["Military", "Chef", "Metallurgy", "Crafts", "Teaching", "Criticism", "Debate"],
+    "Rohini": ["Agriculture", "Arts", "Fashion", "Beauty", "Luxury Goods", "Banking", "Real Estate"],
+    "Mrigashira": ["Research", "Travel", "Sales", "Marketing", "Exploration", "Writing", "Teaching"],
+    "Ardra": ["Technology", "Science", "Research", "Pharmaceuticals", "Psychology", "Social Work"],
+    "Punarvasu": ["Architecture", "Construction", "Restoration", "Writing", "Philosophy", "Teaching", "Real Estate"],
+    "Pushya": ["Counseling", "Teaching", "Nursing", "Priesthood", "Social Services", "Nutrition"],
+    "Ashlesha": ["Medicine", "Occult Sciences", "Psychology", "Investigation", "Politics", "Diplomacy"],
+    "Magha": ["Administration", "Government", "Management", "Archaeology", "History", "Royal Services"],
+    "Purva Phalguni": ["Entertainment", "Arts", "Music", "Wedding Industry", "Hospitality", "Luxury Services"],
+    "Uttara Phalguni": ["Social Work", "Administration", "Banking", "Contracts", "Partnerships", "Management"],
+    "Hasta": ["Crafts", "Handwork", "Healing", "Astrology", "Fine Arts", "Consultancy", "Trading"],
+    "Chitra": ["Architecture", "Design", "Fashion", "Jewelry", "Photography", "Engineering", "Media"],
+    "Swati": ["Business", "Trade", "Aviation", "Law", "Diplomacy", "Sales", "Public Relations"],
+    "Vishakha": ["Politics", "Public Speaking", "Law", "Business", "Research", "Goal-oriented professions"],
+    "Anuradha": ["Organization", "Administration", "Friendship-based business", "Mathematics", "Numerology"],
+    "Jyeshtha": ["Administration", "Military", "Police", "Investigation", "Occult", "Engineering"],
+    "Mula": ["Research", "Philosophy", "Herbalism", "Medicine", "Investigation", "Spirituality"],
+    "Purva Ashadha": ["Writing", "Publishing", "Law", "Philosophy", "Education", "Public Relations"],
+    "Uttara Ashadha": ["Government", "Administration", "Law", "Military", "Construction", "Athletics"],
+    "Shravana": ["Music", "Teaching", "Communication", "Media", "Counseling", "Languages", "Publishing"],
+    "Dhanishta": ["Music", "Dance", "Real Estate", "Property", "Instruments", "Rhythm-based arts"],
+    "Shatabhisha": ["Medicine", "Healing", "Research", "Astronomy", "Astrology", "Unconventional healing"],
+    "Purva Bhadrapada": ["Occult", "Astrology", "Finance", "Funeral Services", "Mysticism", "Research"],
+    "Uttara Bhadrapada": ["Charity", "Spirituality", "Writing", "Teaching", "Counseling", "Social Work"],
+    "Revati": ["Travel", "Navigation", "Import/Export", "Arts", "Music", "Social Services", "Animal Care"]
+}
+
+
 class KundaliGenerator:
     def __init__(self):
         self.nakshatras = [
@@ -35,35 +67,7 @@ class KundaliGenerator:
         }
         
         # Nakshatra occupation mapping
-        self.nakshatra_occupations = {
-            "Ashwini": ["Medicine", "Healing", "Veterinary", "Surgery", "Emergency Services", "Racing", "Transportation"],
-            "Bharani": ["Arts", "Entertainment", "Fashion", "Law", "Justice", "Agriculture", "Food Industry"],
-            "Krittika": ["Military", "Chef", "Metallurgy", "Crafts", "Teaching", "Criticism", "Debate"],
-            "Rohini": ["Agriculture", "Arts", "Fashion", "Beauty", "Luxury Goods", "Banking", "Real Estate"],
-            "Mrigashira": ["Research", "Travel", "Sales", "Marketing", "Exploration", "Writing", "Teaching"],
-            "Ardra": ["Technology", "Science", "Research", "Pharmaceuticals", "Psychology", "Social Work"],
-            "Punarvasu": ["Architecture", "Construction", "Restoration", "Writing", "Philosophy", "Teaching", "Real Estate"],
-            "Pushya": ["Counseling", "Teaching", "Nursing", "Priesthood", "Social Services", "Nutrition"],
-            "Ashlesha": ["Medicine", "Occult Sciences", "Psychology", "Investigation", "Politics", "Diplomacy"],
-            "Magha": ["Administration", "Government", "Management", "Archaeology", "History", "Royal Services"],
-            "Purva Phalguni": ["Entertainment", "Arts", "Music", "Wedding Industry", "Hospitality", "Luxury Services"],
-            "Uttara Phalguni": ["Social Work", "Administration", "Banking", "Contracts", "Partnerships", "Management"],
-            "Hasta": ["Crafts", "Handwork", "Healing", "Astrology", "Fine Arts", "Consultancy", "Trading"],
-            "Chitra": ["Architecture", "Design", "Fashion", "Jewelry", "Photography", "Engineering", "Media"],
-            "Swati": ["Business", "Trade", "Aviation", "Law", "Diplomacy", "Sales", "Public Relations"],
-            "Vishakha": ["Politics", "Public Speaking", "Law", "Business", "Research", "Goal-oriented professions"],
-            "Anuradha": ["Organization", "Administration", "Friendship-based business", "Mathematics", "Numerology"],
-            "Jyeshtha": ["Administration", "Military", "Police", "Investigation", "Occult", "Engineering"],
-            "Mula": ["Research", "Philosophy", "Herbalism", "Medicine", "Investigation", "Spirituality"],
-            "Purva Ashadha": ["Writing", "Publishing", "Law", "Philosophy", "Education", "Public Relations"],
-            "Uttara Ashadha": ["Government", "Administration", "Law", "Military", "Construction", "Athletics"],
-            "Shravana": ["Music", "Teaching", "Communication", "Media", "Counseling", "Languages", "Publishing"],
-            "Dhanishta": ["Music", "Dance", "Real Estate", "Property", "Instruments", "Rhythm-based arts"],
-            "Shatabhisha": ["Medicine", "Healing", "Research", "Astronomy", "Astrology", "Unconventional healing"],
-            "Purva Bhadrapada": ["Occult", "Astrology", "Finance", "Funeral Services", "Mysticism", "Research"],
-            "Uttara Bhadrapada": ["Charity", "Spirituality", "Writing", "Teaching", "Counseling", "Social Work"],
-            "Revati": ["Travel", "Navigation", "Import/Export", "Arts", "Music", "Social Services", "Animal Care"]
-        }
+        self.nakshatra_occupations = NAKSHATRA_OCCUPATIONS
         
         # House occupation mapping
         self.house_occupations = {
@@ -218,6 +222,11 @@ class KundaliGenerator:
         
         return career_analysis
     
+    def to_utc(self, dt_naive, tz_name):
+        """Localize a naive birth datetime to its timezone and convert to UTC"""
+        tz = pytz.timezone(tz_name)
+        return tz.localize(dt_naive).astimezone(pytz.UTC)
+    
     def generate_kundali(self, birth_date, birth_time, birth_place):
         """Generate complete kundali"""
         try:
@@ -228,95 +237,97 @@ class KundaliGenerator:
             
             # Get timezone and create datetime
             tz_name = self.get_timezone(lat, lon)
-            tz = pytz.timezone(tz_name)
             
             # Parse input
             dt_str = f"{birth_date} {birth_time}"
             dt_naive = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-            dt_local = tz.localize(dt_naive)
-            dt_utc = dt_local.astimezone(pytz.UTC)
+            dt_utc = self.to_utc(dt_naive, tz_name)
             
             # Calculate Julian Day
             jd = self.calculate_julian_day(dt_utc, lat, lon)
             
-            # Get ayanamsa
-            ayanamsa = self.get_ayanamsa(jd)
+            return self.build_kundali(birth_date, birth_time, birth_place, lat, lon, tz_name, jd)
             
-            # Calculate ascendant
-            asc_tropical = self.calculate_ascendant(jd, lat, lon)
-            asc_sidereal = (asc_tropical - ayanamsa) % 360
-            
-            # Calculate houses
-            houses_tropical = self.calculate_houses(jd, lat, lon)
-            houses_sidereal = [(h - ayanamsa) % 360 for h in houses_tropical]
-            
-            # Calculate planets
-            planets_data = {}
-            for planet_id, planet_name in self.planets.items():
-                if planet_name == "Ketu":
-                    # Ketu is 180 degrees opposite to Rahu
-                    rahu_pos = planets_data["Rahu"]["longitude"]
-                    longitude_tropical = (rahu_pos + 180) % 360
-                else:
-                    longitude_tropical = self.calculate_planet_position(planet_id, jd)
-                
-                longitude_sidereal = (longitude_tropical - ayanamsa) % 360
-                nakshatra, pada = self.get_nakshatra(longitude_sidereal)
-                rashi, degree = self.get_rashi(longitude_sidereal)
-                
-                planets_data[planet_name] = {
-                    "longitude": longitude_sidereal,
-                    "rashi": rashi,
-                    "degree": f"{degree:.2f}°",
-                    "nakshatra": nakshatra,
-                    "pada": pada
-                }
-            
-            # Get ascendant nakshatra
-            asc_nakshatra, asc_pada = self.get_nakshatra(asc_sidereal)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def build_kundali(self, birth_date, birth_time, birth_place, lat, lon, tz_name, jd):
+        """Compute the kundali for an already resolved location, timezone and Julian Day"""
+        # Get ayanamsa
+        ayanamsa = self.get_ayanamsa(jd)
+        
+        # Calculate ascendant
+        asc_tropical = self.calculate_ascendant(jd, lat, lon)
+        asc_sidereal = (asc_tropical - ayanamsa) % 360
+        
+        # Calculate houses
+        houses_tropical = self.calculate_houses(jd, lat, lon)
+        houses_sidereal = [(h - ayanamsa) % 360 for h in houses_tropical]
+        
+        # Calculate planets
+        planets_data = {}
+        for planet_id, planet_name in self.planets.items():
+            if planet_name == "Ketu":
+                # Ketu is 180 degrees opposite to Rahu
+                rahu_pos = planets_data["Rahu"]["longitude"]
+                longitude_tropical = (rahu_pos + 180) % 360
+            else:
+                longitude_tropical = self.calculate_planet_position(planet_id, jd)
             
-            # Analyze career potential
-            career_analysis = self.analyze_career_potential(
-                planets_data, 
-                houses_sidereal, 
-                asc_nakshatra
-            )
+            longitude_sidereal = (longitude_tropical - ayanamsa) % 360
+            nakshatra, pada = self.get_nakshatra(longitude_sidereal)
+            rashi, degree = self.get_rashi(longitude_sidereal)
             
-            # Prepare result
-            result = {
-                "birth_details": {
-                    "date": birth_date,
-                    "time": birth_time,
-                    "place": birth_place,
-                    "latitude": f"{lat:.4f}",
-                    "longitude": f"{lon:.4f}",
-                    "timezone": tz_name
-                },
-                "ayanamsa": f"{ayanamsa:.2f}°",
-                "ascendant": {
-                    "longitude": asc_sidereal,
-                    "rashi": self.get_rashi(asc_sidereal)[0],
-                    "degree": f"{self.get_rashi(asc_sidereal)[1]:.2f}°",
-                    "nakshatra": asc_nakshatra,
-                    "pada": asc_pada
-                },
-                "houses": [
-                    {
-                        "house": i+1,
-                        "cusp": f"{h:.2f}°",
-                        "rashi": self.get_rashi(h)[0]
-                    } for i, h in enumerate(houses_sidereal)
-                ],
-                "planets": planets_data
+            planets_data[planet_name] = {
+                "longitude": longitude_sidereal,
+                "rashi": rashi,
+                "degree": f"{degree:.2f}°",
+                "nakshatra": nakshatra,
+                "pada": pada
             }
-            
-            # Add career analysis to result
-            result["career_analysis"] = career_analysis
-            
-            return result
-            
-        except Exception as e:
-            return {"error": str(e)}
+        
+        # Get ascendant nakshatra
+        asc_nakshatra, asc_pada = self.get_nakshatra(asc_sidereal)
+        
+        # Analyze career potential
+        career_analysis = self.analyze_career_potential(
+            planets_data, 
+            houses_sidereal, 
+            asc_nakshatra
+        )
+        
+        # Prepare result
+        result = {
+            "birth_details": {
+                "date": birth_date,
+                "time": birth_time,
+                "place": birth_place,
+                "latitude": f"{lat:.4f}",
+                "longitude": f"{lon:.4f}",
+                "timezone": tz_name
+            },
+            "ayanamsa": f"{ayanamsa:.2f}°",
+            "ascendant": {
+                "longitude": asc_sidereal,
+                "rashi": self.get_rashi(asc_sidereal)[0],
+                "degree": f"{self.get_rashi(asc_sidereal)[1]:.2f}°",
+                "nakshatra": asc_nakshatra,
+                "pada": asc_pada
+            },
+            "houses": [
+                {
+                    "house": i+1,
+                    "cusp": f"{h:.2f}°",
+                    "rashi": self.get_rashi(h)[0]
+                } for i, h in enumerate(houses_sidereal)
+            ],
+            "planets": planets_data
+        }
+        
+        # Add career analysis to result
+        result["career_analysis"] = career_analysis
+        
+        return result
     
     def print_kundali(self, kundali):
         """Print kundali in readable format"""
@@ -1,5 +1,9 @@
-from datetime import datetime, date
-from typing import Dict, Tuple, Any
+from array import array
+from datetime import date
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any
+
+from date_parser import RowError, parse_date, parse_date_column
 
 
 # Zodiac definitions: (start_month, start_day), (end_month, end_day)
@@ -72,18 +76,7 @@ ZODIAC_PROFILE: Dict[str, Dict[str, Any]] = {
 
 
 def _parse_date_string(d: str) -> date:
-    d = d.strip()
-    today = date.today()
-    for fmt in ("%Y-%m-%d", "%m-%d", "%m/%d", "%Y/%m/%d"):
-        try:
-            parsed = datetime.strptime(d, fmt)
-            if "%Y" in fmt:
-                return parsed.date()
-            else:
-                return date(today.year, parsed.month, parsed.day)
-        except ValueError:
-            continue
-    raise ValueError("Please enter date in format YYYY-MM-DD or MM-DD.")
+    return parse_date(d)
 
 
 def _in_range(month: int, day: int, start: Tuple[int, int], end: Tuple[int, int]) -> bool:
@@ -94,26 +87,68 @@ def _in_range(month: int, day: int, start: Tuple[int, int], end: Tuple[int, int]
         return m_d >= start or m_d <= end
 
 
-def get_zodiac_sign(birth_date_str: str) -> str:
-    d = _parse_date_string(birth_date_str)
-    month, day = d.month, d.day
-    for sign, (start, end) in ZODIAC_RANGES.items():
-        if _in_range(month, day, start, end):
-            return sign
-    raise RuntimeError("Could not determine zodiac sign.")
+# Sign order used for sign indices
+ZODIAC_SIGNS: Tuple[str, ...] = tuple(ZODIAC_RANGES)
 
 
-def get_zodiac_profile(birth_date_str: str) -> Dict[str, Any]:
-    sign = get_zodiac_sign(birth_date_str)
+def _build_profile(sign: str) -> Mapping[str, Any]:
     start, end = ZODIAC_RANGES[sign]
     profile = ZODIAC_PROFILE[sign]
-
-    return {
+    return MappingProxyType({
         "sign": sign,
-        "qualities": profile["qualities"],
-        "jobs": profile["jobs"],
+        "qualities": tuple(profile["qualities"]),
+        "jobs": tuple(profile["jobs"]),
         "date_range": f"{start[0]}/{start[1]} - {end[0]}/{end[1]}"
-    }
+    })
+
+
+# The 12 possible profiles, built once and shared read-only by every caller
+ZODIAC_PROFILES: Tuple[Mapping[str, Any], ...] = tuple(_build_profile(s) for s in ZODIAC_SIGNS)
+
+# _SIGN_INDEX[month][day] -> sign index (-1 for impossible month/day pairs)
+_SIGN_INDEX: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        next((i for i, (start, end) in enumerate(ZODIAC_RANGES.values())
+              if _in_range(month, day, start, end)), -1)
+        if month else -1
+        for day in range(32)
+    )
+    for month in range(13)
+)
+
+
+def sign_index(month: int, day: int) -> int:
+    return _SIGN_INDEX[month][day]
+
+
+def get_zodiac_index(birth_date_str: str) -> int:
+    d = _parse_date_string(birth_date_str)
+    return _SIGN_INDEX[d.month][d.day]
+
+
+def get_zodiac_sign(birth_date_str: str) -> str:
+    return ZODIAC_SIGNS[get_zodiac_index(birth_date_str)]
+
+
+def get_zodiac_profile(birth_date_str: str) -> Dict[str, Any]:
+    """A fresh, JSON-serializable copy of the sign's profile (lists, not the shared read-only table)."""
+    profile = ZODIAC_PROFILES[get_zodiac_index(birth_date_str)]
+    return {**profile, "qualities": list(profile["qualities"]), "jobs": list(profile["jobs"])}
+
+
+def get_zodiac_indices(
+    birth_dates: Sequence[str],
+    fmt: Optional[str] = None,
+) -> Tuple[array, Tuple[Mapping[str, Any], ...], List[RowError]]:
+    """
+    Bulk variant of get_zodiac_profile.
+    Returns one sign index per row (-1 for rows that failed to parse), the
+    shared profile table those indices point into, and the per-row errors.
+    """
+    dates, errors = parse_date_column(birth_dates, fmt)
+    table = _SIGN_INDEX
+    indices = array("b", [table[d.month][d.day] if d else -1 for d in dates])
+    return indices, ZODIAC_PROFILES, errors
 
 
 if __name__ == "__main__":